@@ -7,13 +7,21 @@ from .extensions import register_extensions
 from .models import *
 from .utils.api_docs import init_swagger
 from .utils.error_handlers import handle_exception
+from .utils.identity import init_identity
+from .utils.json_provider import init_json_provider
+from .utils.metrics import init_metrics
+from .utils.sql_profiler import init_sql_profiler
 
 
 def create_app(config_name: str = 'development') -> Flask:
     app = Flask(__name__)
     app.config.from_object(config[config_name])
+    init_json_provider(app)
 
     register_extensions(app)
+    init_identity(app)
+    init_sql_profiler(app)
+    init_metrics(app)
     init_swagger(app)
 
     app.register_blueprint(api_blueprint)
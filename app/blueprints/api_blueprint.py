@@ -1,8 +1,12 @@
 from flask import Blueprint
 
 from .auth_blueprint import auth_blueprint
+from .genre_blueprint import genre_blueprint
+from .metrics_blueprint import metrics_blueprint
 from .movie_blueprint import movie_blueprint
 
 api_blueprint = Blueprint('api', __name__, url_prefix='/api')
 api_blueprint.register_blueprint(movie_blueprint)
 api_blueprint.register_blueprint(auth_blueprint)
+api_blueprint.register_blueprint(genre_blueprint)
+api_blueprint.register_blueprint(metrics_blueprint)
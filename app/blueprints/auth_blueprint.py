@@ -1,6 +1,11 @@
 from flask import Blueprint
 
-from ..controllers import LoginController, RegisterController
+from ..controllers import (
+    LoginController,
+    LogoutController,
+    RefreshController,
+    RegisterController,
+)
 
 auth_blueprint = Blueprint('auth', __name__)
 
@@ -15,3 +20,15 @@ auth_blueprint.add_url_rule(
     view_func=LoginController.as_view('login_view'),
     methods=['POST'],
 )
+
+auth_blueprint.add_url_rule(
+    '/refresh',
+    view_func=RefreshController.as_view('refresh_view'),
+    methods=['POST'],
+)
+
+auth_blueprint.add_url_rule(
+    '/logout',
+    view_func=LogoutController.as_view('logout_view'),
+    methods=['POST'],
+)
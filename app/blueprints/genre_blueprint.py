@@ -0,0 +1,11 @@
+from flask import Blueprint
+
+from ..controllers import GenreController
+
+genre_blueprint = Blueprint('genres', __name__, url_prefix='/genres')
+
+genre_blueprint.add_url_rule(
+    '/',
+    view_func=GenreController.as_view('genre_api'),
+    methods=['GET'],
+)
@@ -0,0 +1,11 @@
+from flask import Blueprint
+
+from ..controllers import PoolMetricsController
+
+metrics_blueprint = Blueprint('metrics', __name__, url_prefix='/metrics')
+
+metrics_blueprint.add_url_rule(
+    '/pool',
+    view_func=PoolMetricsController.as_view('pool_metrics_view'),
+    methods=['GET'],
+)
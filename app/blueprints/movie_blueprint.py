@@ -1,11 +1,15 @@
 from flask import Blueprint
 
-from ..controllers import MovieController, MovieRentalController, MovieReviewController
+from ..controllers import MovieBulkController, MovieController, MovieExportController, MovieRentalController, MovieReviewController
 
 movie_blueprint = Blueprint('movies', __name__, url_prefix='/movies')
 
 movie_view = MovieController.as_view('movie_api')
 
+movie_bulk_view = MovieBulkController.as_view('movie_bulk_api')
+
+movie_export_view = MovieExportController.as_view('movie_export_api')
+
 movie_rental_view = MovieRentalController.as_view('movie_rental_api')
 
 movie_review_view = MovieReviewController.as_view('movie_review_api')
@@ -14,6 +18,12 @@ movie_blueprint.add_url_rule(
     '/', defaults={'movie_id': None}, view_func=movie_view, methods=['GET']
 )
 movie_blueprint.add_url_rule('/', view_func=movie_view, methods=['POST'])
+movie_blueprint.add_url_rule(
+    '/bulk', view_func=movie_bulk_view, methods=['POST']
+)
+movie_blueprint.add_url_rule(
+    '/export', view_func=movie_export_view, methods=['GET']
+)
 movie_blueprint.add_url_rule(
     '/<string:movie_id>',
     view_func=movie_view,
@@ -26,6 +36,12 @@ movie_blueprint.add_url_rule(
     methods=['POST'],
 )
 
+movie_blueprint.add_url_rule(
+    '/<string:movie_id>/reviews',
+    view_func=movie_review_view,
+    methods=['GET'],
+)
+
 movie_blueprint.add_url_rule(
     '/<string:movie_id>/rate',
     view_func=movie_review_view,
@@ -1,19 +1,122 @@
 import os
-from typing import Dict, Type
+from typing import Any, Dict, Type
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+def engine_options(pool_size: int, max_overflow: int) -> Dict[str, Any]:
+    return {
+        # Connections kept open per worker process, plus the extra ones
+        # opened under load and closed once returned
+        'pool_size': int(os.getenv('DATABASE_POOL_SIZE', pool_size)),
+        'max_overflow': int(os.getenv('DATABASE_MAX_OVERFLOW', max_overflow)),
+        # Seconds to wait for a free connection before failing the request
+        'pool_timeout': float(os.getenv('DATABASE_POOL_TIMEOUT', '10')),
+        # Replace connections older than this, before proxies and failovers
+        # drop them from under us
+        'pool_recycle': int(os.getenv('DATABASE_POOL_RECYCLE', '1800')),
+        # Test each connection on checkout so dead ones are replaced
+        # instead of failing the request
+        'pool_pre_ping': True,
+    }
+
+
+def replica_binds(options: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    One `replica_<n>` bind per URL in the comma-separated
+    DATABASE_REPLICA_URLS, with the primary's engine options.
+    """
+    urls = os.getenv('DATABASE_REPLICA_URLS', '')
+    return {
+        f'replica_{index}': {**options, 'url': url.strip()}
+        for index, url in enumerate(urls.split(','))
+        if url.strip()
+    }
+
+
 class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL')
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(pool_size=5, max_overflow=10)
+    SQLALCHEMY_BINDS = replica_binds(SQLALCHEMY_ENGINE_OPTIONS)
+    # Seconds an unreachable replica is left out before being probed again
+    REPLICA_RETRY_SECONDS = float(os.getenv('REPLICA_RETRY_SECONDS', '30'))
+    # Seconds a user's reads stay on the primary after they commit a write,
+    # longer than the replicas' usual lag
+    REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', '5'))
+    # Where pins are kept, falls back to CACHE_REDIS_URL, memory:// for the
+    # in-process stand-in
+    REPLICA_PIN_REDIS_URL = os.getenv('REPLICA_PIN_REDIS_URL')
+    # Milliseconds a statement may run before PostgreSQL cancels it, 0 off
+    DATABASE_STATEMENT_TIMEOUT = int(
+        os.getenv('DATABASE_STATEMENT_TIMEOUT', '30000')
+    )
     API_TITLE = 'FilmesTop API'
     API_VERSION = 'v1'
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY')
     JWT_ACCESS_TOKEN_EXPIRES = 3600  # 1 hour
     JWT_REFRESH_TOKEN_EXPIRES = 604800  # 7 days
 
+    # memory (per-process LRU), redis or null
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'memory')
+    # redis:// URL, or memory:// for the in-process stand-in
+    CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL')
+    CACHE_DEFAULT_TTL = int(os.getenv('CACHE_DEFAULT_TTL', '300'))
+    CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '1024'))
+
+    # orjson (falls back to default when not installed) or default
+    JSON_PROVIDER = os.getenv('JSON_PROVIDER', 'orjson')
+
+    # werkzeug method string with every cost parameter spelled out, stored
+    # hashes made with anything else are upgraded on the next login
+    PASSWORD_HASH_METHOD = os.getenv(
+        'PASSWORD_HASH_METHOD', 'scrypt:32768:8:1'
+    )
+    PASSWORD_SALT_LENGTH = int(os.getenv('PASSWORD_SALT_LENGTH', '16'))
+    # Hashing processes per app worker, 0 hashes inline
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', '0'))
+    # Hashes allowed to wait for the pool before logins are refused
+    PASSWORD_HASH_QUEUE = int(os.getenv('PASSWORD_HASH_QUEUE', '32'))
+    PASSWORD_HASH_TIMEOUT = float(os.getenv('PASSWORD_HASH_TIMEOUT', '10'))
+
+    # Authenticated users are cached per worker for this many seconds
+    USER_CACHE_TTL = int(os.getenv('USER_CACHE_TTL', '60'))
+    USER_CACHE_MAX_ENTRIES = int(os.getenv('USER_CACHE_MAX_ENTRIES', '4096'))
+
+    # Refuse per-process stores for state that every worker must share,
+    # token revocations and, with replicas, the read-your-writes pin
+    REQUIRE_SHARED_STATE = False
+
+    # memory (per-process, bloom filter in front) or redis
+    REVOCATION_BACKEND = os.getenv('REVOCATION_BACKEND', 'memory')
+    # Falls back to CACHE_REDIS_URL, memory:// for the in-process stand-in
+    REVOCATION_REDIS_URL = os.getenv('REVOCATION_REDIS_URL')
+    REVOCATION_BLOOM_CAPACITY = int(
+        os.getenv('REVOCATION_BLOOM_CAPACITY', '100000')
+    )
+    REVOCATION_BLOOM_ERROR_RATE = float(
+        os.getenv('REVOCATION_BLOOM_ERROR_RATE', '0.001')
+    )
+
+    # Count and time each request's statements (Server-Timing header and
+    # the app.sql logger), flagging statements repeated this many times
+    SQL_PROFILER = os.getenv('SQL_PROFILER', 'false').lower() == 'true'
+    SQL_PROFILER_N_PLUS_ONE = int(os.getenv('SQL_PROFILER_N_PLUS_ONE', '5'))
+    # Raise NPlusOneQueryError instead of only logging it, for test suites
+    SQL_PROFILER_RAISE = False
+
+    # Per-endpoint Prometheus metrics at /metrics, needs the metrics extra,
+    # and pool metrics at /api/metrics/pool
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+    # Bearer token both metrics endpoints require when set
+    METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+
+    # Rows inserted and committed together by POST /api/movies/bulk
+    MOVIE_BULK_CHUNK_SIZE = int(os.getenv('MOVIE_BULK_CHUNK_SIZE', '500'))
+    # Rows fetched per round trip by GET /api/movies/export
+    MOVIE_EXPORT_BATCH_SIZE = int(os.getenv('MOVIE_EXPORT_BATCH_SIZE', '1000'))
+
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -21,6 +124,22 @@ class DevelopmentConfig(Config):
 
 class ProductionConfig(Config):
     DEBUG = False
+    # Every gunicorn worker has its own pool, keep workers * (size +
+    # overflow) under the server's max_connections
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(pool_size=5, max_overflow=5)
+    SQLALCHEMY_BINDS = replica_binds(SQLALCHEMY_ENGINE_OPTIONS)
+    DATABASE_STATEMENT_TIMEOUT = int(
+        os.getenv('DATABASE_STATEMENT_TIMEOUT', '10000')
+    )
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', '2'))
+    # gunicorn runs several workers, a revocation or a rotated refresh
+    # token seen by one of them only must not be accepted by the others
+    REQUIRE_SHARED_STATE = (
+        os.getenv('REQUIRE_SHARED_STATE', 'true').lower() == 'true'
+    )
+    REVOCATION_BACKEND = os.getenv('REVOCATION_BACKEND', 'redis')
+    # Metrics reveal traffic and pool state, serve them only on request
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'false').lower() == 'true'
 
 
 config: Dict[str, Type[Config]] = {
@@ -1,10 +1,23 @@
-from .auth_controller import LoginController, RegisterController
-from .movie_controller import MovieController, MovieRentalController, MovieReviewController
+from .auth_controller import (
+    LoginController,
+    LogoutController,
+    RefreshController,
+    RegisterController,
+)
+from .genre_controller import GenreController
+from .metrics_controller import PoolMetricsController
+from .movie_controller import MovieBulkController, MovieController, MovieExportController, MovieRentalController, MovieReviewController
 
 __all__ = [
     'MovieController',
+    'MovieBulkController',
+    'MovieExportController',
     'RegisterController',
     'LoginController',
+    'RefreshController',
+    'LogoutController',
     'MovieRentalController',
     'MovieReviewController',
+    'GenreController',
+    'PoolMetricsController',
 ]
@@ -1,5 +1,10 @@
 from flask import Response
 from flask.views import MethodView
+from flask_jwt_extended import (  # pyright: ignore
+    current_user,
+    get_jwt,
+    jwt_required,
+)
 
 from ..repositories.user_repository import UserRepository
 from ..schemas.user.login_user_schema import LoginUserRequest
@@ -65,7 +70,7 @@ class LoginController(MethodView):
         ---
         tags:
           - Authentication
-        description: Authenticates a user and returns an access token
+        description: Authenticates a user and returns access and refresh tokens
         consumes:
           - application/json
         produces:
@@ -89,6 +94,9 @@ class LoginController(MethodView):
                     access_token:
                       type: string
                       example: eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...
+                    refresh_token:
+                      type: string
+                      example: eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...
                     user:
                       $ref: '#/definitions/UserDto'
           400:
@@ -107,3 +115,70 @@ class LoginController(MethodView):
             $ref: '#/responses/InternalServerError'
         """
         return self.auth_service.login_user(body)
+
+
+class RefreshController(MethodView):
+    def __init__(self) -> None:
+        self.auth_service = AuthService(UserRepository())
+
+    @jwt_required(refresh=True)
+    def post(self) -> Response:
+        """
+        Refresh tokens
+        ---
+        tags:
+          - Authentication
+        description: |
+          Exchanges a refresh token, sent as the Bearer token, for a new
+          access and refresh token pair without checking the password
+          again. Refresh tokens are single use: the one presented is
+          revoked and replaying it is rejected.
+        security:
+          - BearerAuth: []
+        produces:
+          - application/json
+        responses:
+          200:
+            description: Tokens refreshed
+            schema:
+              $ref: '#/definitions/TokenPairResponse'
+          401:
+            $ref: '#/responses/Unauthorized'
+          422:
+            description: An access token was sent instead of a refresh token
+          500:
+            $ref: '#/responses/InternalServerError'
+        """
+        return self.auth_service.refresh_tokens(current_user, get_jwt())
+
+
+class LogoutController(MethodView):
+    def __init__(self) -> None:
+        self.auth_service = AuthService(UserRepository())
+
+    @jwt_required(verify_type=False)
+    def post(self) -> Response:
+        """
+        Revoke a token
+        ---
+        tags:
+          - Authentication
+        description: |
+          Revokes the access or refresh token sent as the Bearer token.
+          Clients logging out should revoke their refresh token, and their
+          access token too if it must stop working before it expires.
+        security:
+          - BearerAuth: []
+        produces:
+          - application/json
+        responses:
+          200:
+            description: Token revoked
+            schema:
+              $ref: '#/definitions/ApiResponse'
+          401:
+            $ref: '#/responses/Unauthorized'
+          500:
+            $ref: '#/responses/InternalServerError'
+        """
+        return self.auth_service.logout_user(get_jwt())
@@ -0,0 +1,36 @@
+from flask import Response
+from flask.views import MethodView
+from flask_jwt_extended import jwt_required  # pyright: ignore
+
+from ..repositories import GenreRepository
+from ..services import GenreService
+
+
+class GenreController(MethodView):
+    def __init__(self) -> None:
+        self.genre_service = GenreService(GenreRepository())
+
+    @jwt_required()
+    def get(self) -> Response:
+        """
+        List genres
+        ---
+        tags:
+          - Genres
+        description: |
+          List every genre with the number of movies tagged with it. The
+          counts are maintained when movies are created, so this endpoint
+          never aggregates over the movie catalog.
+        security:
+          - BearerAuth: []
+        responses:
+          200:
+            description: Successful operation
+            schema:
+              $ref: '#/definitions/ListGenreResponseDto'
+          401:
+            $ref: '#/responses/Unauthorized'
+          500:
+            $ref: '#/responses/InternalServerError'
+        """
+        return self.genre_service.get_genres()
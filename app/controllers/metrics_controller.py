@@ -0,0 +1,39 @@
+from flask import Response
+from flask.views import MethodView
+
+from ..services import MetricsService
+from ..utils.metrics import authorize_metrics
+
+
+class PoolMetricsController(MethodView):
+    def __init__(self) -> None:
+        self.metrics_service = MetricsService()
+
+    def get(self) -> Response:
+        """
+        Connection pool metrics
+        ---
+        tags:
+          - Metrics
+        description: |
+          Connection pool state and counters for each database engine of
+          the worker process that answers. Each gunicorn worker has its
+          own pools, so scrape every worker or compare over several calls.
+          Served only with METRICS_ENABLED, and with METRICS_TOKEN set the
+          token must be sent as a bearer token.
+        produces:
+          - application/json
+        responses:
+          200:
+            description: Successful operation
+            schema:
+              $ref: '#/definitions/PoolMetricsResponse'
+          401:
+            $ref: '#/responses/Unauthorized'
+          404:
+            $ref: '#/responses/NotFound'
+          500:
+            $ref: '#/responses/InternalServerError'
+        """
+        authorize_metrics()
+        return self.metrics_service.get_pool_metrics()
@@ -1,26 +1,32 @@
-from flask import Response
+from flask import Response, request
 from flask.views import MethodView
+from flask_jwt_extended import jwt_required  # pyright: ignore
 
-from ..repositories import MovieRepository
+from ..repositories import GenreRepository, MovieRepository
 from ..repositories.rental_repository import RentalRepository
 from ..repositories.review_repository import ReviewRepository
-from ..repositories.user_repository import UserRepository
 from ..schemas.movie.add_review_schema import AddReviewRequest
 from ..schemas.movie.create_movie_schema import CreateMovieRequest
+from ..schemas.movie.export_movies_request_schema import ExportMoviesRequest
 from ..schemas.movie.get_movie_request_schema import GetMovieRequest
+from ..schemas.movie.get_reviews_request_schema import GetReviewsRequest
 from ..services.movie_service import MovieService
 from ..utils.auth_mixin import AuthMixin
+from ..utils.json_stream import iter_json_array, iter_ndjson
 from ..validators.body_validator import validate_body
 from ..validators.query_validator import validate_query
 
 
+NDJSON_MIMETYPES = ('application/x-ndjson', 'application/jsonl')
+
+
 class MovieBaseController(MethodView, AuthMixin):
     def __init__(self) -> None:
         self.movie_service = MovieService(
             movie_repository=MovieRepository(),
-            user_repository=UserRepository(),
             rental_repository=RentalRepository(),
             review_repository=ReviewRepository(),
+            genre_repository=GenreRepository(),
         )
 
 
@@ -62,6 +68,15 @@ class MovieController(MovieBaseController):
             minimum: 1
             maximum: 100
             description: Number of items per page
+          - name: cursor
+            in: query
+            type: string
+            required: false
+            maxLength: 512
+            description: |
+              Opaque cursor taken from `pagination.next_cursor` or
+              `pagination.prev_cursor`. When present, `page` is ignored and
+              the page is read with keyset pagination.
           - name: search
             in: query
             type: string
@@ -73,12 +88,82 @@ class MovieController(MovieBaseController):
             type: string
             required: false
             maxLength: 50
-            description: Filter movies by genre
+            description: Filter movies by genre (exact, case-insensitive)
+          - name: genres
+            in: query
+            type: string
+            required: false
+            maxLength: 200
+            description: Comma-separated list of genres to filter by
+          - name: genre_match
+            in: query
+            type: string
+            required: false
+            enum: [any, all]
+            default: any
+            description: Whether movies must match any or all of the genres
+          - name: year_min
+            in: query
+            type: integer
+            required: false
+            description: Minimum release year
+          - name: year_max
+            in: query
+            type: integer
+            required: false
+            description: Maximum release year
+          - name: duration_min
+            in: query
+            type: integer
+            required: false
+            description: Minimum duration in minutes
+          - name: duration_max
+            in: query
+            type: integer
+            required: false
+            description: Maximum duration in minutes
+          - name: min_rating
+            in: query
+            type: number
+            required: false
+            minimum: 0
+            maximum: 10
+            description: Minimum average rating
+          - name: sort
+            in: query
+            type: string
+            required: false
+            enum: [created_at, -created_at, title, -title, year, -year, rating, -rating, relevance]
+            description: |
+              Sort order, "-" prefix for descending. Defaults to relevance
+              when searching and to created_at otherwise. Relevance ordering
+              does not return cursors, use page instead.
           - name: rented
             in: query
             type: boolean
             required: false
             description: Filter movies rented by the current user
+          - name: view
+            in: query
+            type: string
+            required: false
+            enum: [summary, detail]
+            default: summary
+            description: |
+              Shape of listed movies. "summary" carries the rating
+              aggregates only, "detail" adds the description and every
+              review. Reviews of one movie are paged with
+              /movies/{movie_id}/reviews.
+          - name: If-None-Match
+            in: header
+            type: string
+            required: false
+            description: ETag from a previous response
+          - name: If-Modified-Since
+            in: header
+            type: string
+            required: false
+            description: Last-Modified from a previous response
         responses:
           200:
             description: Successful operation
@@ -86,7 +171,19 @@ class MovieController(MovieBaseController):
               oneOf:
                 - $ref: '#/definitions/MovieResponse'
                 - $ref: '#/definitions/ListMovieResponseDto'
+                - $ref: '#/definitions/ListMovieSummaryResponseDto'
                 - $ref: '#/definitions/ListRentedMoviesResponseDto'
+            headers:
+              ETag:
+                type: string
+                description: Version of the movie or of the movie catalog
+              Last-Modified:
+                type: string
+                description: Last change of the movie or of the movie catalog
+          304:
+            description: |
+              Not modified, the ETag sent in If-None-Match (or the date in
+              If-Modified-Since) is still current. Not used with rented=true.
           401:
             $ref: '#/responses/Unauthorized'
           404:
@@ -100,7 +197,7 @@ class MovieController(MovieBaseController):
             return self.movie_service.get_movie(movie_id, user_id)
 
         if query.rented:
-            return self.movie_service.get_rented_movies(user_id)
+            return self.movie_service.get_rented_movies(user_id, query.view)
 
         return self.movie_service.get_movies(query)
 
@@ -148,6 +245,108 @@ class MovieController(MovieBaseController):
         return self.movie_service.create_movie(create_movie_request)
 
 
+class MovieBulkController(MovieBaseController):
+    def __init__(self) -> None:
+        super().__init__()
+
+    @jwt_required()
+    def post(self) -> Response:
+        """
+        Import movies in bulk
+        ---
+        tags:
+          - Movies
+        description: |
+          Create many movies from a JSON array of movie objects or, with
+          `Content-Type: application/x-ndjson`, from one movie object per
+          line. Both are read as they arrive, so uploads of any size can be
+          sent. Rows are validated and inserted in chunks, each committed
+          on its own, and titles that already exist are skipped.
+
+          The response is streamed as NDJSON: one result per row, in
+          upload order, with `status` set to `created`, `duplicate`,
+          `invalid` or `error`, then a final line with the count of each
+          status.
+        security:
+          - BearerAuth: []
+        consumes:
+          - application/json
+          - application/x-ndjson
+        produces:
+          - application/x-ndjson
+        parameters:
+          - in: body
+            name: body
+            description: Movies to create
+            required: true
+            schema:
+              type: array
+              items:
+                $ref: '#/definitions/CreateMovieRequest'
+        responses:
+          200:
+            description: One result per row, then the summary
+            schema:
+              $ref: '#/definitions/BulkMovieResult'
+          401:
+            $ref: '#/responses/Unauthorized'
+        """
+        if request.mimetype in NDJSON_MIMETYPES:
+            rows = iter_ndjson(request.stream)
+        else:
+            rows = iter_json_array(request.stream)
+        return self.movie_service.import_movies(rows)
+
+
+class MovieExportController(MovieBaseController):
+    def __init__(self) -> None:
+        super().__init__()
+
+    @jwt_required()
+    @validate_query(ExportMoviesRequest)
+    def get(self, query: ExportMoviesRequest) -> Response:
+        """
+        Export the movie catalog
+        ---
+        tags:
+          - Movies
+        description: |
+          Stream every movie, oldest first, in a single response. Rows are
+          read from the database in batches as the response is sent, so
+          the whole catalog can be exported at once instead of paging
+          through GET /movies.
+        security:
+          - BearerAuth: []
+        produces:
+          - application/x-ndjson
+          - text/csv
+        parameters:
+          - name: format
+            in: query
+            type: string
+            required: false
+            enum: [ndjson, csv]
+            default: ndjson
+            description: One JSON object per line, or CSV with a header row
+          - name: aggregates
+            in: query
+            type: boolean
+            required: false
+            default: false
+            description: Add the total_reviews and average_rating columns
+        responses:
+          200:
+            description: The catalog, as an attachment
+            schema:
+              $ref: '#/definitions/MovieExportRow'
+          400:
+            $ref: '#/responses/ValidationError'
+          401:
+            $ref: '#/responses/Unauthorized'
+        """
+        return self.movie_service.export_movies(query)
+
+
 class MovieRentalController(MovieBaseController):
     def __init__(self) -> None:
         super().__init__()
@@ -204,6 +403,63 @@ class MovieReviewController(MovieBaseController):
     def __init__(self) -> None:
         super().__init__()
 
+    @jwt_required()
+    @validate_query(GetReviewsRequest)
+    def get(self, movie_id: str, query: GetReviewsRequest) -> Response:
+        """
+        List the reviews of a movie
+        ---
+        tags:
+          - Movies
+        description: |
+          Page through the reviews of a movie, newest first by default.
+          Follow `pagination.next_cursor` / `pagination.prev_cursor` to move
+          between pages.
+        security:
+          - BearerAuth: []
+        parameters:
+          - name: movie_id
+            in: path
+            type: string
+            required: true
+            description: ID of the movie
+          - name: limit
+            in: query
+            type: integer
+            required: false
+            default: 20
+            minimum: 1
+            maximum: 100
+            description: Number of reviews per page
+          - name: cursor
+            in: query
+            type: string
+            required: false
+            maxLength: 512
+            description: Opaque cursor from a previous page
+          - name: sort
+            in: query
+            type: string
+            required: false
+            enum: [created_at, -created_at, rating, -rating]
+            default: -created_at
+            description: Sort order, "-" prefix for descending
+        responses:
+          200:
+            description: Successful operation
+            schema:
+              $ref: '#/definitions/ReviewPageResponse'
+          400:
+            $ref: '#/responses/ValidationError'
+          401:
+            $ref: '#/responses/Unauthorized'
+          404:
+            $ref: '#/responses/NotFound'
+          500:
+            $ref: '#/responses/InternalServerError'
+        """
+        return self.movie_service.get_reviews(movie_id, query)
+
     @validate_body(AddReviewRequest, 'add_review_request')
     def post(
         self, movie_id: str, add_review_request: AddReviewRequest
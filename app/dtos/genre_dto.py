@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from ..models import Genre
+
+
+@dataclass(slots=True, frozen=True)
+class GenreDto:
+    id: int
+    name: str
+    movie_count: int = field(default=0)
+
+    @classmethod
+    def from_model(cls, genre: Genre) -> 'GenreDto':
+        return cls(
+            id=genre.id,
+            name=genre.name,
+            movie_count=genre.movie_count,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class ListGenreResponseDto:
+    data: List[GenreDto] = field(default_factory=list)
+
+    @classmethod
+    def from_model(cls, genres: list[Genre]) -> 'ListGenreResponseDto':
+        return cls(data=[GenreDto.from_model(genre) for genre in genres])
@@ -1,11 +1,47 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List, Sequence
 
-from ..models import Movie, Rental
+from sqlalchemy import Row
+
+from ..models import Movie
 from .review_dto import ListReviewResponseDto
 
+ReviewRows = Dict[str, List[Row[Any]]]
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class MovieSummaryDto:
+    id: str
+    title: str
+    year: int
+    created_at: str | None = None
+    duration_minutes: int | None = None
+    genre: str | None = None
+    total_reviews: int | None = None
+    average_rating: float | None = None
+    rented_at: str | None = None
+
+    @classmethod
+    def from_row(cls, row: Row[Any]) -> 'MovieSummaryDto':
+        """
+        Builds the DTO from a `MOVIE_SUMMARY_ROW` projection, with
+        `rented_at` when the row carries it.
+        """
+        rented_at = getattr(row, 'rented_at', None)
+        return cls(
+            id=row.id,
+            title=row.title,
+            year=row.year,
+            created_at=row.created_at.isoformat(),
+            duration_minutes=row.duration_minutes,
+            genre=row.genre,
+            total_reviews=row.total_reviews,
+            average_rating=row.average_rating,
+            rented_at=rented_at.isoformat() if rented_at else None,
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class MovieResponseDto:
     id: str
     title: str
@@ -24,7 +60,10 @@ class MovieResponseDto:
 
     @classmethod
     def from_model(
-        cls, movie: Movie, rented_at: str | None = None
+        cls,
+        movie: Movie,
+        rented_at: str | None = None,
+        reviews: Sequence[Row[Any]] = (),
     ) -> 'MovieResponseDto':
         return cls(
             id=movie.id,
@@ -37,34 +76,64 @@ class MovieResponseDto:
             total_reviews=movie.total_reviews,
             average_rating=movie.average_rating,
             rented_at=rented_at,
-            reviews=ListReviewResponseDto.from_model(movie.reviews),
+            reviews=ListReviewResponseDto.from_rows(reviews),
+        )
+
+    @classmethod
+    def from_row(
+        cls, row: Row[Any], reviews: Sequence[Row[Any]] = ()
+    ) -> 'MovieResponseDto':
+        """
+        Builds the DTO from a `MOVIE_ROW` projection, with `rented_at` when
+        the row carries it.
+        """
+        rented_at = getattr(row, 'rented_at', None)
+        return cls(
+            id=row.id,
+            title=row.title,
+            year=row.year,
+            created_at=row.created_at.isoformat(),
+            description=row.description,
+            duration_minutes=row.duration_minutes,
+            genre=row.genre,
+            total_reviews=row.total_reviews,
+            average_rating=row.average_rating,
+            rented_at=rented_at.isoformat() if rented_at else None,
+            reviews=ListReviewResponseDto.from_rows(reviews),
         )
 
 
-@dataclass
+def movie_dtos(
+    rows: Sequence[Row[Any]], reviews: ReviewRows | None
+) -> List[MovieSummaryDto | MovieResponseDto]:
+    """
+    Detail DTOs when the reviews of the rows were loaded, summaries
+    otherwise.
+    """
+    if reviews is None:
+        return [MovieSummaryDto.from_row(row) for row in rows]
+    return [
+        MovieResponseDto.from_row(row, reviews.get(row.id, ())) for row in rows
+    ]
+
+
+@dataclass(slots=True, frozen=True)
 class ListMovieResponseDto:
-    data: List[MovieResponseDto]
+    data: List[MovieSummaryDto | MovieResponseDto]
 
     @classmethod
-    def from_model(cls, movies: list[Movie]) -> 'ListMovieResponseDto':
-        return cls(
-            data=[MovieResponseDto.from_model(movie) for movie in movies]
-        )
+    def from_rows(
+        cls, rows: Sequence[Row[Any]], reviews: ReviewRows | None = None
+    ) -> 'ListMovieResponseDto':
+        return cls(data=movie_dtos(rows, reviews))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ListRentedMoviesResponseDto:
-    data: List[MovieResponseDto]
+    data: List[MovieSummaryDto | MovieResponseDto]
 
     @classmethod
-    def from_model(
-        cls, rentals: List[Rental]
+    def from_rows(
+        cls, rows: Sequence[Row[Any]], reviews: ReviewRows | None = None
     ) -> 'ListRentedMoviesResponseDto':
-        return cls(
-            data=[
-                MovieResponseDto.from_model(
-                    rental.movie, rented_at=rental.rented_at.isoformat()
-                )
-                for rental in rentals
-            ]
-        )
+        return cls(data=movie_dtos(rows, reviews))
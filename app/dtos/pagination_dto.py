@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Any
+
+from ..utils.cursor import Page
+
+
+@dataclass(slots=True, frozen=True)
+class CursorPaginationDto:
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+    @classmethod
+    def from_page(cls, page: Page[Any]) -> 'CursorPaginationDto':
+        return cls(
+            next_cursor=page.next_cursor.encode() if page.next_cursor else None,
+            prev_cursor=page.prev_cursor.encode() if page.prev_cursor else None,
+        )
@@ -1,10 +1,12 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import Row
 
 from ..models import Review
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReviewDto:
     id: Optional[int] = field(default=None)
     created_at: Optional[str] = field(default=None)
@@ -22,11 +24,28 @@ class ReviewDto:
             user_name=review.user.name,
         )
 
+    @classmethod
+    def from_row(cls, row: Row[Any]) -> 'ReviewDto':
+        """
+        Builds the DTO from a `ReviewRepository.REVIEW_ROW` projection.
+        """
+        return cls(
+            id=row.id,
+            created_at=row.created_at.isoformat(),
+            rating=row.rating,
+            comment=row.comment,
+            user_name=row.user_name,
+        )
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ListReviewResponseDto:
-    data: List[ReviewDto] = field(default_factory=List[ReviewDto])
+    data: List[ReviewDto] = field(default_factory=list)
 
     @classmethod
     def from_model(cls, reviews: list[Review]) -> 'ListReviewResponseDto':
         return cls(data=[ReviewDto.from_model(review) for review in reviews])
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Row[Any]]) -> 'ListReviewResponseDto':
+        return cls(data=[ReviewDto.from_row(row) for row in rows])
@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional
 
 from ..models import User
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserDto:
     id: Optional[str] = field(default=None)
     username: str = field(default='')
@@ -23,3 +23,32 @@ class UserDto:
             created_at=user.created_at.isoformat(),
             updated_at=user.updated_at.isoformat(),
         )
+
+
+@dataclass(slots=True, frozen=True)
+class UserIdentityDto:
+    """
+    The authenticated user as carried by access token claims.
+    """
+
+    id: str
+    name: str | None = None
+    is_admin: bool = False
+    token_version: int = 0
+
+    @classmethod
+    def from_model(cls, user: User) -> 'UserIdentityDto':
+        return cls(
+            id=user.id,
+            name=user.name,
+            is_admin=user.is_admin,
+            token_version=user.token_version,
+        )
+
+    @property
+    def claims(self) -> dict[str, Any]:
+        return {
+            'name': self.name,
+            'is_admin': self.is_admin,
+            'ver': self.token_version,
+        }
@@ -1,11 +1,35 @@
+from sqlite3 import Connection as SQLiteConnection
+from typing import Any
+
 from flask import Flask
 from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
-from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .utils.cache import CacheExtension
+from .utils.database import Database
+from .utils.passwords import PasswordHasher
+from .utils.revocation import RevocationExtension
 
-db = SQLAlchemy()
+db = Database()
 migrate = Migrate()
 jwt = JWTManager()
+cache = CacheExtension()
+passwords = PasswordHasher()
+revocations = RevocationExtension()
+
+
+@event.listens_for(Engine, 'connect')
+def enable_sqlite_foreign_keys(dbapi_connection: Any, _: Any) -> None:
+    """
+    SQLite ignores foreign keys unless asked per connection. The rental
+    insert relies on them to reject unknown movies and users.
+    """
+    if isinstance(dbapi_connection, SQLiteConnection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
 
 
 def register_extensions(app: Flask) -> None:
@@ -15,3 +39,6 @@ def register_extensions(app: Flask) -> None:
     db.init_app(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
+    cache.init_app(app)
+    passwords.init_app(app)
+    revocations.init_app(app)
@@ -1,6 +1,7 @@
+from .genre import Genre, movie_genres
 from .movie import Movie
 from .rental import Rental
 from .review import Review
 from .user import User
 
-__all__ = ['Movie', 'User', 'Rental', 'Review']
+__all__ = ['Movie', 'User', 'Rental', 'Review', 'Genre', 'movie_genres']
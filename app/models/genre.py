@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Table
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from ..types.model import Model
+
+if TYPE_CHECKING:
+    from .movie import Movie
+
+
+movie_genres = Table(
+    'movie_genres',
+    Model.metadata,
+    Column(
+        'movie_id',
+        ForeignKey('movies.id', ondelete='CASCADE'),
+        primary_key=True,
+    ),
+    Column(
+        'genre_id',
+        ForeignKey('genres.id', ondelete='CASCADE'),
+        primary_key=True,
+    ),
+    Index('ix_movie_genres_genre_id_movie_id', 'genre_id', 'movie_id'),
+)
+
+
+class Genre(Model):
+    __tablename__ = 'genres'
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(nullable=False)
+    slug: Mapped[str] = mapped_column(unique=True, nullable=False)
+    movie_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    movies: Mapped[list[Movie]] = relationship(
+        secondary=movie_genres, back_populates='genres'
+    )
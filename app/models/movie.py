@@ -1,21 +1,38 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
-from sqlalchemy import DateTime
+from sqlalchemy import Connection, DateTime, Index, Table, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..types.model import Model
+from .genre import movie_genres
 
 if TYPE_CHECKING:
+    from .genre import Genre
     from .rental import Rental
     from .review import Review
 
 
 class Movie(Model):
     __tablename__ = 'movies'
+    __table_args__ = (
+        Index('ix_movies_created_at_id', 'created_at', 'id'),
+        Index('ix_movies_year_id', 'year', 'id'),
+        Index('ix_movies_average_rating_id', 'average_rating', 'id'),
+        Index('ix_movies_duration_minutes', 'duration_minutes'),
+        Index('ix_movies_updated_at', 'updated_at'),
+        # Serves `ILIKE '%term%'` title searches and `similarity()`
+        # ranking, the unique title index already covers other dialects.
+        Index(
+            'ix_movies_title_trgm',
+            'title',
+            postgresql_using='gin',
+            postgresql_ops={'title': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
+    )
 
     id: Mapped[str] = mapped_column(
         primary_key=True, default=lambda: str(uuid4())
@@ -29,6 +46,7 @@ class Movie(Model):
     genre: Mapped[str] = mapped_column(nullable=False)
     total_reviews: Mapped[int] = mapped_column(nullable=False, default=0)
     average_rating: Mapped[float] = mapped_column(nullable=False, default=0.0)
+    rating_sum: Mapped[float] = mapped_column(nullable=False, default=0.0)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -43,3 +61,18 @@ class Movie(Model):
 
     rentals: Mapped[list[Rental]] = relationship(back_populates='movie')
     reviews: Mapped[list[Review]] = relationship(back_populates='movie')
+    genres: Mapped[list[Genre]] = relationship(
+        secondary=movie_genres, back_populates='movies'
+    )
+
+
+def create_trigram_extension(
+    target: Table, connection: Connection, **kwargs: Any
+) -> None:
+    # The trigram operator class comes from pg_trgm, see the
+    # `ix_movies_title_trgm` migration.
+    if connection.dialect.name == 'postgresql':
+        connection.exec_driver_sql('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+
+event.listen(Movie.__table__, 'before_create', create_trigram_extension)
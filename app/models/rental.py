@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy import DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..types.model import Model
@@ -16,6 +16,12 @@ if TYPE_CHECKING:
 
 class Rental(Model):
     __tablename__ = 'rentals'
+    __table_args__ = (
+        Index(
+            'ix_rentals_user_id_movie_id', 'user_id', 'movie_id', unique=True
+        ),
+        Index('ix_rentals_movie_id', 'movie_id'),
+    )
 
     id: Mapped[str] = mapped_column(
         primary_key=True, default=lambda: str(uuid4())
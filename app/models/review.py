@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy import DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..types.model import Model
@@ -15,6 +15,15 @@ if TYPE_CHECKING:
 
 class Review(Model):
     __tablename__ = 'reviews'
+    __table_args__ = (
+        Index(
+            'ix_reviews_user_id_movie_id', 'user_id', 'movie_id', unique=True
+        ),
+        Index(
+            'ix_reviews_movie_id_created_at_id', 'movie_id', 'created_at', 'id'
+        ),
+        Index('ix_reviews_movie_id_rating_id', 'movie_id', 'rating', 'id'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[str] = mapped_column(
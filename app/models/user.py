@@ -28,6 +28,10 @@ class User(Model):
         nullable=False,
         default=False,
     )
+    # Embedded in issued tokens, bumping it invalidates all of them
+    token_version: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default='0'
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -1,3 +1,4 @@
+from .genre_repository import GenreRepository
 from .movies_repository import MovieRepository
 from .rental_repository import RentalRepository
 from .review_repository import ReviewRepository
@@ -8,4 +9,5 @@ __all__ = [
     'UserRepository',
     'RentalRepository',
     'ReviewRepository',
+    'GenreRepository',
 ]
@@ -0,0 +1,48 @@
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from ..extensions import db
+from ..models import Genre
+from ..types.error import ApiErrorCodes
+from ..utils.exceptions import CustomException
+from ..utils.genres import genre_slug
+
+
+class GenreRepository:
+    def find_all(self) -> list[Genre]:
+        try:
+            return db.session.query(Genre).order_by(Genre.name).all()
+        except SQLAlchemyError as e:
+            raise CustomException(
+                ApiErrorCodes.INTERNAL_SERVER_ERROR, data={'errors': str(e)}
+            ) from e
+
+    def get_or_create(self, names: list[str]) -> list[Genre]:
+        """
+        Resolve genre names to rows, creating the missing ones in the
+        current transaction. Each insert runs in a savepoint so a genre
+        created concurrently by another request is picked up instead of
+        failing the whole transaction.
+        """
+        slugs = {genre_slug(name): name for name in names}
+        genres = {
+            genre.slug: genre
+            for genre in db.session.scalars(
+                select(Genre).where(Genre.slug.in_(slugs))
+            )
+        }
+
+        for slug, name in slugs.items():
+            if slug in genres:
+                continue
+            try:
+                with db.session.begin_nested():
+                    genre = Genre(name=name, slug=slug)
+                    db.session.add(genre)
+                genres[slug] = genre
+            except IntegrityError:
+                genres[slug] = db.session.scalars(
+                    select(Genre).where(Genre.slug == slug)
+                ).one()
+
+        return [genres[slug] for slug in slugs]
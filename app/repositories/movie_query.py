@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    case,
+    func,
+    literal,
+    select,
+    tuple_,
+)
+from sqlalchemy.orm import InstrumentedAttribute
+
+from ..models.genre import Genre, movie_genres
+from ..models.movie import Movie
+from ..schemas.movie.get_movie_request_schema import GetMovieRequest
+from ..utils.cursor import Cursor, CursorDirection, invalid_cursor
+
+# Sort name -> (column, descending). Every keyset sort is tie-broken on
+# `Movie.id` and backed by an `(column, id)` index, except title which is
+# already unique.
+MOVIE_SORTS: dict[str, tuple[InstrumentedAttribute[Any], bool]] = {
+    'created_at': (Movie.created_at, False),
+    '-created_at': (Movie.created_at, True),
+    'title': (Movie.title, False),
+    '-title': (Movie.title, True),
+    'year': (Movie.year, False),
+    '-year': (Movie.year, True),
+    'rating': (Movie.average_rating, False),
+    '-rating': (Movie.average_rating, True),
+}
+
+
+def escape_like(term: str) -> str:
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def seek_past(
+    columns: Sequence[InstrumentedAttribute[Any]],
+    key: Sequence[Any],
+    descending: bool,
+) -> ColumnElement[bool]:
+    """
+    WHERE clause selecting the rows after `key` when ordered by `columns`,
+    all ascending or all descending. The row-value comparison lets the
+    database seek along the matching composite index.
+    """
+    row = tuple_(*columns)
+    value = tuple_(
+        *(literal(part, column.type) for column, part in zip(columns, key))
+    )
+    if descending:
+        return row < value
+    return row > value
+
+
+def title_relevance(term: str, dialect: str) -> list[ColumnElement[Any]]:
+    """
+    ORDER BY clauses ranking titles by how well they match `term`.
+
+    PostgreSQL ranks by trigram similarity (`pg_trgm`, see the
+    `ix_movies_title_trgm` migration). Other dialects, such as the SQLite
+    database used in tests, fall back to exact match, then prefix match,
+    then shortest title first.
+    """
+    if dialect == 'postgresql':
+        return [func.similarity(Movie.title, term).desc()]
+
+    title = func.lower(Movie.title)
+    term = term.lower()
+    return [
+        case(
+            (title == term, 0),
+            (title.startswith(term, autoescape=True), 1),
+            else_=2,
+        ),
+        func.length(Movie.title),
+    ]
+
+
+class MovieQuery:
+    """
+    Translates a `GetMovieRequest` into the clauses of one SELECT: every
+    filter is ANDed into a single WHERE clause and the requested sort is
+    applied with `Movie.id` as tie-breaker, so that keyset cursors can seek
+    straight to the next page. Relevance ordering is computed per row and
+    only supports offset pagination.
+    """
+
+    def __init__(self, request: GetMovieRequest, dialect: str) -> None:
+        self.request = request
+        self.dialect = dialect
+        self.sort = request.sort_order
+
+    @property
+    def keyset(self) -> bool:
+        return self.sort in MOVIE_SORTS
+
+    def where(self) -> list[ColumnElement[bool]]:
+        request = self.request
+        clauses: list[ColumnElement[bool]] = []
+
+        if request.search:
+            clauses.append(
+                Movie.title.ilike(
+                    f'%{escape_like(request.search)}%', escape='\\'
+                )
+            )
+
+        slugs = request.genre_slugs
+        if slugs:
+            movie_ids = (
+                select(movie_genres.c.movie_id)
+                .join(Genre, Genre.id == movie_genres.c.genre_id)
+                .where(Genre.slug.in_(slugs))
+            )
+            if request.genre_match == 'all':
+                movie_ids = movie_ids.group_by(
+                    movie_genres.c.movie_id
+                ).having(func.count(movie_genres.c.genre_id) == len(slugs))
+            clauses.append(Movie.id.in_(movie_ids))
+
+        if request.year_min is not None:
+            clauses.append(Movie.year >= request.year_min)
+        if request.year_max is not None:
+            clauses.append(Movie.year <= request.year_max)
+        if request.duration_min is not None:
+            clauses.append(Movie.duration_minutes >= request.duration_min)
+        if request.duration_max is not None:
+            clauses.append(Movie.duration_minutes <= request.duration_max)
+        if request.min_rating is not None:
+            clauses.append(Movie.average_rating >= request.min_rating)
+
+        return clauses
+
+    def order_by(self, backwards: bool = False) -> list[ColumnElement[Any]]:
+        if not self.keyset:
+            return [
+                *title_relevance(self.request.search or '', self.dialect),
+                Movie.id.asc(),
+            ]
+
+        column, descending = MOVIE_SORTS[self.sort]
+        if descending != backwards:
+            return [column.desc(), Movie.id.desc()]
+        return [column.asc(), Movie.id.asc()]
+
+    def seek(self, cursor: Cursor) -> ColumnElement[bool]:
+        """
+        WHERE clause selecting the rows past `cursor` in its direction.
+        """
+        if cursor.sort != self.sort or not self.keyset:
+            raise invalid_cursor(cursor.encode())
+
+        column, descending = MOVIE_SORTS[self.sort]
+        return seek_past(
+            (column, Movie.id),
+            self._parse_key(cursor),
+            descending != (cursor.direction == 'prev'),
+        )
+
+    def cursor(
+        self, movie: Movie | Row[Any], direction: CursorDirection = 'next'
+    ) -> Cursor:
+        column, _ = MOVIE_SORTS[self.sort]
+        value = getattr(movie, column.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        return Cursor([value, movie.id], direction, self.sort)
+
+    def _parse_key(self, cursor: Cursor) -> tuple[Any, str]:
+        try:
+            value, movie_id = cursor.key
+            column, _ = MOVIE_SORTS[self.sort]
+            if column is Movie.created_at:
+                value = datetime.fromisoformat(value)
+            elif column is Movie.year:
+                value = int(value)
+            elif column is Movie.average_rating:
+                value = float(value)
+            elif not isinstance(value, str):
+                raise TypeError(value)
+            return value, str(movie_id)
+        except (TypeError, ValueError) as e:
+            raise invalid_cursor(cursor.encode()) from e
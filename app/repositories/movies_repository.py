@@ -1,21 +1,89 @@
 from __future__ import annotations
 
+from collections import Counter
+from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy import (
+    Insert,
+    Result,
+    Row,
+    Table,
+    and_,
+    bindparam,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from ..extensions import db
+from ..models.genre import Genre, movie_genres
 from ..models.movie import Movie
+from ..models.rental import Rental
 from ..schemas.movie.create_movie_schema import CreateMovieRequest
+from ..schemas.movie.get_movie_request_schema import (
+    GetMovieRequest,
+    MovieView,
+)
 from ..types.error import ApiErrorCodes
+from ..utils.cursor import Cursor, Page
 from ..utils.exceptions import CustomException
+from ..utils.genres import genre_slug, parse_genre_names
+from ..utils.replicas import replica_read
+from .genre_repository import GenreRepository
+from .movie_query import MovieQuery
+
+
+# Columns of a movie as rendered by `MovieSummaryDto` and `MovieResponseDto`.
+# Read-only listings select only these and get plain rows back, which skips
+# entity hydration and the identity map and leaves `rating_sum`/`updated_at`
+# in the database.
+MOVIE_SUMMARY_ROW = (
+    Movie.id,
+    Movie.title,
+    Movie.year,
+    Movie.created_at,
+    Movie.duration_minutes,
+    Movie.genre,
+    Movie.total_reviews,
+    Movie.average_rating,
+)
+MOVIE_ROW = (*MOVIE_SUMMARY_ROW, Movie.description)
+
+MOVIE_COLUMNS: dict[MovieView, tuple[Any, ...]] = {
+    'summary': MOVIE_SUMMARY_ROW,
+    'detail': MOVIE_ROW,
+}
+
+# Columns of a catalog export, the aggregates are optional
+MOVIE_EXPORT_ROW = (
+    Movie.id,
+    Movie.title,
+    Movie.year,
+    Movie.genre,
+    Movie.duration_minutes,
+    Movie.description,
+    Movie.created_at,
+)
+MOVIE_AGGREGATES = (Movie.total_reviews, Movie.average_rating)
 
 
 class MovieRepository:
+    @replica_read
     def find_all(
         self, skip: int | None = 0, limit: int | None = 100
-    ) -> list[Movie]:
+    ) -> list[Row[Any]]:
         try:
-            movies = db.session.query(Movie).offset(skip).limit(limit).all()
-            return movies
+            movies = db.session.execute(
+                select(*MOVIE_ROW)
+                .order_by(Movie.created_at, Movie.id)
+                .offset(skip)
+                .limit(limit)
+            ).all()
+            return list(movies)
         except SQLAlchemyError as e:
             raise CustomException(
                 ApiErrorCodes.INTERNAL_SERVER_ERROR, data={'errors': str(e)}
@@ -25,6 +93,60 @@ class MovieRepository:
                 ApiErrorCodes.INTERNAL_SERVER_ERROR, data={'errors': str(e)}
             ) from e
 
+    @replica_read
+    def find_page(
+        self, get_movie_request: GetMovieRequest, cursor: Cursor | None = None
+    ) -> Page[Row[Any]]:
+        """
+        Apply every filter, the sort order and pagination of
+        `get_movie_request` in a single statement. With a `cursor` the page
+        is read by seeking on the sort index, otherwise `page` is used as an
+        offset. Only the columns of the requested view are selected.
+        """
+        try:
+            movie_query = MovieQuery(
+                get_movie_request, db.session.get_bind().dialect.name
+            )
+            limit = get_movie_request.limit or 100
+            backwards = cursor is not None and cursor.direction == 'prev'
+
+            query = (
+                select(*MOVIE_COLUMNS[get_movie_request.view])
+                .where(*movie_query.where())
+                .order_by(*movie_query.order_by(backwards))
+            )
+            if cursor is not None:
+                query = query.where(movie_query.seek(cursor))
+                has_prev = True
+            else:
+                page = get_movie_request.page or 1
+                query = query.offset((page - 1) * limit)
+                has_prev = page > 1
+
+            movies = list(db.session.execute(query.limit(limit + 1)).all())
+            has_next = len(movies) > limit
+            movies = movies[:limit]
+            if backwards:
+                movies.reverse()
+                has_prev, has_next = has_next, has_prev
+
+            if not movies or not movie_query.keyset:
+                return Page(movies)
+            return Page(
+                movies,
+                next_cursor=(
+                    movie_query.cursor(movies[-1]) if has_next else None
+                ),
+                prev_cursor=(
+                    movie_query.cursor(movies[0], 'prev') if has_prev else None
+                ),
+            )
+        except SQLAlchemyError as e:
+            raise CustomException(
+                ApiErrorCodes.INTERNAL_SERVER_ERROR, data={'errors': str(e)}
+            ) from e
+
+    @replica_read
     def find_by_id(self, movie_id: str) -> Movie:
         try:
             movie = db.session.query(Movie).filter_by(id=movie_id).first()
@@ -40,37 +162,81 @@ class MovieRepository:
         except CustomException as e:
             raise e
 
-    def find_by_title(
-        self, title: str, skip: int | None = 0, limit: int | None = 100
-    ) -> list[Movie]:
+    @replica_read
+    def find_version(
+        self, movie_id: str, user_id: str
+    ) -> tuple[datetime, int, datetime | None]:
+        """
+        Reads only what identifies the movie detail representation for
+        `user_id`: the movie's last change and the caller's rental.
+        """
         try:
-            query = db.session.query(Movie).filter(
-                Movie.title.ilike(f'%{title}%')
-            )
-            movies = query.offset(skip).limit(limit).all()
-            return movies
+            version = db.session.execute(
+                select(
+                    Movie.updated_at, Movie.total_reviews, Rental.rented_at
+                )
+                .outerjoin(
+                    Rental,
+                    and_(
+                        Rental.movie_id == Movie.id,
+                        Rental.user_id == user_id,
+                    ),
+                )
+                .where(Movie.id == movie_id)
+            ).first()
+            if not version:
+                raise CustomException(
+                    ApiErrorCodes.MOVIE_NOT_FOUND, data={'movie_id': movie_id}
+                )
+            return version._tuple()
         except SQLAlchemyError as e:
             raise CustomException(
                 ApiErrorCodes.INTERNAL_SERVER_ERROR, data={'errors': str(e)}
             ) from e
-        except CustomException as e:
-            raise e
 
-    def find_by_genre(
-        self, genre: str, skip: int | None = 0, limit: int | None = 100
-    ) -> list[Movie]:
+    @replica_read
+    def stream_export(self, aggregates: bool, batch_size: int) -> Result[Any]:
+        """
+        Read the whole catalog through a server-side cursor, fetching
+        `batch_size` rows at a time. The statement runs here, on a replica
+        when one is configured, and rows are fetched from the same
+        connection as the result is iterated. `partitions()` yields them
+        batch by batch.
+        """
+        columns: tuple[Any, ...] = MOVIE_EXPORT_ROW
+        if aggregates:
+            columns += MOVIE_AGGREGATES
         try:
-            query = db.session.query(Movie).filter(
-                Movie.genre.ilike(f'%{genre}%')
+            return db.session.execute(
+                select(*columns)
+                .order_by(Movie.created_at, Movie.id)
+                .execution_options(yield_per=batch_size)
             )
-            movies = query.offset(skip).limit(limit).all()
-            return movies
         except SQLAlchemyError as e:
             raise CustomException(
                 ApiErrorCodes.INTERNAL_SERVER_ERROR, data={'errors': str(e)}
             ) from e
 
-    def create(self, create_movie_request: CreateMovieRequest) -> Movie:
+    @replica_read
+    def catalog_version(self) -> tuple[int, datetime | None]:
+        """
+        Movie count and latest change across the catalog. Review aggregates
+        live on the movie row, so new reviews bump it as well.
+        """
+        try:
+            return db.session.execute(
+                select(func.count(Movie.id), func.max(Movie.updated_at))
+            ).one()._tuple()
+        except SQLAlchemyError as e:
+            raise CustomException(
+                ApiErrorCodes.INTERNAL_SERVER_ERROR, data={'errors': str(e)}
+            ) from e
+
+    def create(
+        self,
+        create_movie_request: CreateMovieRequest,
+        genres: list[Genre] | None = None,
+    ) -> Movie:
         try:
             title = create_movie_request.title
             year = create_movie_request.year
@@ -87,8 +253,15 @@ class MovieRepository:
                 year=year,
                 genre=genre,
                 duration_minutes=durateion_minutes,
+                genres=genres or [],
             )
             db.session.add(movie)
+            if genres:
+                db.session.execute(
+                    update(Genre)
+                    .where(Genre.id.in_([genre.id for genre in genres]))
+                    .values(movie_count=Genre.movie_count + 1)
+                )
             db.session.commit()
             return movie
         except IntegrityError as e:
@@ -106,10 +279,95 @@ class MovieRepository:
             db.session.rollback()
             raise e
 
-    def update_rating(self, movie: Movie, new_rating: float) -> Movie:
-        movie.total_reviews = movie.total_reviews + 1
-        movie.average_rating = (
-            (movie.average_rating * (movie.total_reviews - 1)) + new_rating
-        ) / movie.total_reviews
-        db.session.commit()
-        return movie
+    def create_many(
+        self, create_movie_requests: list[CreateMovieRequest]
+    ) -> dict[str, str]:
+        """
+        Insert a batch of movies with one `INSERT ... ON CONFLICT (title) DO
+        NOTHING RETURNING`, then link the inserted ones to their genres and
+        bump the genre counts, all in one transaction. Returns the ids of
+        the inserted movies by title; titles missing from it already
+        existed. Titles must be distinct within the batch.
+        """
+        dialect = db.session.get_bind().dialect.name
+        statement: Insert
+        if dialect == 'postgresql':
+            statement = postgresql.insert(Movie).on_conflict_do_nothing(
+                index_elements=['title']
+            )
+        elif dialect == 'sqlite':
+            statement = sqlite.insert(Movie).on_conflict_do_nothing(
+                index_elements=['title']
+            )
+        else:
+            statement = insert(Movie)
+
+        genres_by_title = {
+            request.title: parse_genre_names(request.genre)
+            for request in create_movie_requests
+        }
+        try:
+            created: dict[str, str] = {
+                title: movie_id
+                for movie_id, title in db.session.execute(
+                    statement.values(
+                        [
+                            {
+                                'title': request.title,
+                                'year': request.year,
+                                'genre': request.genre,
+                                'duration_minutes': request.duration,
+                            }
+                            for request in create_movie_requests
+                        ]
+                    ).returning(Movie.id, Movie.title)
+                )
+            }
+            if created:
+                self._add_genres(
+                    {
+                        movie_id: genres_by_title[title]
+                        for title, movie_id in created.items()
+                    }
+                )
+            db.session.commit()
+            return created
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise CustomException(
+                ApiErrorCodes.ERROR_CREATING_MOVIE, data={'errors': str(e)}
+            ) from e
+
+    def _add_genres(self, genre_names: dict[str, list[str]]) -> None:
+        genres = {
+            genre.slug: genre
+            for genre in GenreRepository().get_or_create(
+                [name for names in genre_names.values() for name in names]
+            )
+        }
+        pairs = [
+            (movie_id, genres[genre_slug(name)].id)
+            for movie_id, names in genre_names.items()
+            for name in names
+        ]
+        if not pairs:
+            return
+        links: list[dict[str, Any]] = [
+            {'movie_id': movie_id, 'genre_id': genre_id}
+            for movie_id, genre_id in pairs
+        ]
+        db.session.execute(insert(movie_genres), links)
+
+        counts = Counter(genre_id for _, genre_id in pairs)
+        # Core statement, the ORM would read a parameter list as a bulk
+        # update by primary key instead of executemany
+        table = cast(Table, Genre.__table__)
+        db.session.execute(
+            update(table)
+            .where(table.c.id == bindparam('genre_id'))
+            .values(movie_count=table.c.movie_count + bindparam('added')),
+            [
+                {'genre_id': genre_id, 'added': added}
+                for genre_id, added in counts.items()
+            ],
+        )
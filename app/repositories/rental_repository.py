@@ -1,43 +1,112 @@
 from datetime import datetime
-from typing import List
+from typing import Any, List
 
+from sqlalchemy import Insert, Row, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 
 from ..extensions import db
-from ..models import Rental
+from ..models import Movie, Rental
+from ..schemas.movie.get_movie_request_schema import MovieView
 from ..types.error import ApiErrorCodes
 from ..utils.exceptions import CustomException
+from ..utils.replicas import replica_read
+from .movies_repository import MOVIE_COLUMNS
 
 
 class RentalRepository:
     def create(
         self, user_id: str, movie_id: str, expiration_date: datetime
-    ) -> Rental:
-        try:
-            rental = Rental(
-                user_id=user_id,
-                movie_id=movie_id,
-                expires_at=expiration_date,
+    ) -> str:
+        """
+        Rent a movie with a single `INSERT ... ON CONFLICT DO NOTHING
+        RETURNING id`. The unique `(user_id, movie_id)` index detects an
+        existing rental and the foreign keys detect unknown movies or users,
+        so no lookups are needed beforehand and concurrent requests cannot
+        create duplicates.
+        """
+        dialect = db.session.get_bind().dialect.name
+        values = {
+            'user_id': user_id,
+            'movie_id': movie_id,
+            'expires_at': expiration_date,
+        }
+
+        statement: Insert
+        if dialect == 'postgresql':
+            statement = postgresql.insert(Rental).on_conflict_do_nothing(
+                index_elements=['user_id', 'movie_id']
             )
-            db.session.add(rental)
+        elif dialect == 'sqlite':
+            statement = sqlite.insert(Rental).on_conflict_do_nothing(
+                index_elements=['user_id', 'movie_id']
+            )
+        else:
+            statement = insert(Rental)
+
+        try:
+            rental_id = db.session.execute(
+                statement.values(**values).returning(Rental.id)
+            ).scalar_one_or_none()
             db.session.commit()
-            return rental
-        except CustomException as e:
-            db.session.rollback()
-            raise e
         except IntegrityError as e:
             db.session.rollback()
-            raise CustomException(ApiErrorCodes.USER_ALREADY_EXISTS) from e
+            raise self._integrity_error(e, user_id, movie_id) from e
+
+        if rental_id is None:
+            raise CustomException(
+                ApiErrorCodes.MOVIE_ALREADY_RENTED, data={'movie_id': movie_id}
+            )
+        return rental_id
+
+    def _integrity_error(
+        self, error: IntegrityError, user_id: str, movie_id: str
+    ) -> CustomException:
+        message = str(error.orig).lower()
+        diag = getattr(error.orig, 'diag', None)
+        constraint = (getattr(diag, 'constraint_name', None) or '').lower()
 
-    def find_by_user_id(self, user_id: str) -> List[Rental]:
-        return db.session.query(Rental).filter_by(user_id=user_id).all()
+        if 'unique' in message or 'duplicate' in message:
+            return CustomException(
+                ApiErrorCodes.MOVIE_ALREADY_RENTED, data={'movie_id': movie_id}
+            )
+        # SQLite does not name the violated foreign key. The user id comes
+        # from a verified token, so an unknown movie is the likely cause.
+        if 'user_id' in constraint:
+            return CustomException(
+                ApiErrorCodes.USER_NOT_FOUND, data={'user_id': user_id}
+            )
+        return CustomException(
+            ApiErrorCodes.MOVIE_NOT_FOUND, data={'movie_id': movie_id}
+        )
+
+    @replica_read
+    def find_movie_rows_by_user_id(
+        self, user_id: str, view: MovieView = 'summary'
+    ) -> List[Row[Any]]:
+        """
+        Reads the movies rented by `user_id` as projections of `view`
+        extended with the rental's `rented_at`.
+        """
+        return list(
+            db.session.execute(
+                select(*MOVIE_COLUMNS[view], Rental.rented_at)
+                .join(Rental, Rental.movie_id == Movie.id)
+                .where(Rental.user_id == user_id)
+            ).all()
+        )
 
+    @replica_read
     def find_by_movie_id(self, movie_id: str) -> List[Rental]:
         return db.session.query(Rental).filter_by(movie_id=movie_id).all()
 
     def find_by_user_and_movie(
         self, user_id: str, movie_id: str
     ) -> Rental | None:
+        """
+        Reads from the primary. It guards writes, and a rental made moments
+        ago may not have reached the replicas yet.
+        """
         return (
             db.session.query(Rental)
             .filter_by(user_id=user_id, movie_id=movie_id)
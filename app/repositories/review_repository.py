@@ -1,23 +1,84 @@
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import Row, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import InstrumentedAttribute
+
 from ..extensions import db
-from ..models import Review
+from ..models import Movie, Review, User
+from ..schemas.movie.get_reviews_request_schema import GetReviewsRequest
+from ..types.error import ApiErrorCodes
+from ..utils.cursor import Cursor, CursorDirection, Page, invalid_cursor
+from ..utils.exceptions import CustomException
+from ..utils.replicas import replica_read
+from .movie_query import seek_past
+
+# Sort name -> (column, descending), each backed by a
+# `(movie_id, column, id)` index so a page is one index range scan.
+REVIEW_SORTS: dict[str, tuple[InstrumentedAttribute[Any], bool]] = {
+    'created_at': (Review.created_at, False),
+    '-created_at': (Review.created_at, True),
+    'rating': (Review.rating, False),
+    '-rating': (Review.rating, True),
+}
 
 
 class ReviewRepository:
+    # Columns read for embedded reviews, see `ReviewDto.from_row`.
+    REVIEW_ROW = (
+        Review.movie_id,
+        Review.id,
+        Review.created_at,
+        Review.rating,
+        Review.comment,
+        User.name.label('user_name'),
+    )
+
     def __init__(self):
         self.session = db.session
 
     def create(
         self, user_id: str, movie_id: str, rating: float, comment: str | None
     ) -> Review:
-        review = Review(
-            user_id=user_id,
-            movie_id=movie_id,
-            rating=rating,
-            comment=comment,
-        )
-        self.session.add(review)
-        self.session.commit()
-        return review
+        """
+        Insert the review and fold its rating into the movie's aggregates in
+        the same transaction. The aggregates are updated server-side from
+        the running `rating_sum`, so concurrent reviews of one movie neither
+        overwrite each other nor accumulate float drift in the average.
+        """
+        try:
+            review = Review(
+                user_id=user_id,
+                movie_id=movie_id,
+                rating=rating,
+                comment=comment,
+            )
+            self.session.add(review)
+            self.session.execute(
+                update(Movie)
+                .where(Movie.id == movie_id)
+                .values(
+                    total_reviews=Movie.total_reviews + 1,
+                    rating_sum=Movie.rating_sum + rating,
+                    average_rating=(Movie.rating_sum + rating)
+                    / (Movie.total_reviews + 1),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            self.session.commit()
+            return review
+        except IntegrityError as e:
+            self.session.rollback()
+            raise CustomException(
+                ApiErrorCodes.TRY_REVIEW_ALREADY_RATED_MOVIE,
+                data={'movie_id': movie_id},
+            ) from e
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            raise CustomException(
+                ApiErrorCodes.INTERNAL_SERVER_ERROR, data={'errors': str(e)}
+            ) from e
 
     def find_by_user_and_movie(
         self, user_id: str, movie_id: str
@@ -27,3 +88,119 @@ class ReviewRepository:
             .filter_by(user_id=user_id, movie_id=movie_id)
             .first()
         )
+
+    @replica_read
+    def find_rows_by_movie_ids(
+        self, movie_ids: List[str]
+    ) -> Dict[str, List[Row[Any]]]:
+        """
+        Reads the reviews of every movie in `movie_ids`, with the author's
+        name, in one statement. Plain rows are returned instead of `Review`
+        and `User` entities, which skips identity-map bookkeeping for what
+        is only ever rendered.
+        """
+        reviews: Dict[str, List[Row[Any]]] = {
+            movie_id: [] for movie_id in movie_ids
+        }
+        if not movie_ids:
+            return reviews
+
+        try:
+            rows = self.session.execute(
+                select(*self.REVIEW_ROW)
+                .join(User, User.id == Review.user_id)
+                .where(Review.movie_id.in_(movie_ids))
+                .order_by(Review.movie_id, Review.created_at, Review.id)
+            )
+            for row in rows:
+                reviews[row.movie_id].append(row)
+            return reviews
+        except SQLAlchemyError as e:
+            raise CustomException(
+                ApiErrorCodes.INTERNAL_SERVER_ERROR, data={'errors': str(e)}
+            ) from e
+
+    @replica_read
+    def find_page(
+        self,
+        movie_id: str,
+        get_reviews_request: GetReviewsRequest,
+        cursor: Cursor | None = None,
+    ) -> Page[Row[Any]]:
+        """
+        One page of the reviews of `movie_id` in the requested order, read
+        by seeking past `cursor` on the `(movie_id, column, id)` index.
+        """
+        sort = get_reviews_request.sort
+        column, descending = REVIEW_SORTS[sort]
+        limit = get_reviews_request.limit or 20
+        backwards = cursor is not None and cursor.direction == 'prev'
+        if cursor is not None and cursor.sort != sort:
+            raise invalid_cursor(cursor.encode())
+
+        query = (
+            select(*self.REVIEW_ROW)
+            .join(User, User.id == Review.user_id)
+            .where(Review.movie_id == movie_id)
+        )
+        if descending != backwards:
+            query = query.order_by(column.desc(), Review.id.desc())
+        else:
+            query = query.order_by(column.asc(), Review.id.asc())
+        if cursor is not None:
+            query = query.where(
+                seek_past(
+                    (column, Review.id),
+                    self._parse_key(cursor),
+                    descending != backwards,
+                )
+            )
+
+        try:
+            reviews = list(
+                self.session.execute(query.limit(limit + 1)).all()
+            )
+        except SQLAlchemyError as e:
+            raise CustomException(
+                ApiErrorCodes.INTERNAL_SERVER_ERROR, data={'errors': str(e)}
+            ) from e
+
+        has_prev = cursor is not None
+        has_next = len(reviews) > limit
+        reviews = reviews[:limit]
+        if backwards:
+            reviews.reverse()
+            has_prev, has_next = has_next, has_prev
+        if not reviews:
+            return Page(reviews)
+
+        return Page(
+            reviews,
+            next_cursor=(
+                self._cursor(reviews[-1], sort, 'next') if has_next else None
+            ),
+            prev_cursor=(
+                self._cursor(reviews[0], sort, 'prev') if has_prev else None
+            ),
+        )
+
+    def _cursor(
+        self, review: Row[Any], sort: str, direction: CursorDirection
+    ) -> Cursor:
+        column, _ = REVIEW_SORTS[sort]
+        value = getattr(review, column.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        return Cursor([value, review.id], direction, sort)
+
+    def _parse_key(self, cursor: Cursor) -> tuple[Any, int]:
+        try:
+            value, review_id = cursor.key
+            column, _ = REVIEW_SORTS[str(cursor.sort)]
+            if column is Review.created_at:
+                value = datetime.fromisoformat(value)
+            else:
+                value = float(value)
+            return value, int(review_id)
+        except (TypeError, ValueError) as e:
+            raise invalid_cursor(cursor.encode()) from e
@@ -69,3 +69,17 @@ class UserRepository:
             raise CustomException(
                 ApiErrorCodes.INTERNAL_SERVER_ERROR, data={'error': str(e)}
             ) from e
+
+    def update_password(self, user: User, password: str) -> User:
+        try:
+            user.password = password
+            db.session.commit()
+            return user
+        except Exception as e:
+            db.session.rollback()
+            raise CustomException(
+                ApiErrorCodes.INTERNAL_SERVER_ERROR, data={'error': str(e)}
+            ) from e
+
+    def find_identity(self, user_id: str) -> User | None:
+        return db.session.get(User, user_id)
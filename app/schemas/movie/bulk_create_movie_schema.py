@@ -0,0 +1,47 @@
+from typing import Any, List, Union
+
+from pydantic import TypeAdapter, ValidationError
+
+from .create_movie_schema import CreateMovieRequest
+
+ValidationErrors = List[Any]
+
+_batch: TypeAdapter[List[CreateMovieRequest]] = TypeAdapter(
+    List[CreateMovieRequest]
+)
+
+
+def _errors(error: ValidationError) -> dict[int, ValidationErrors]:
+    by_row: dict[int, ValidationErrors] = {}
+    for detail in error.errors(
+        include_context=False, include_input=False, include_url=False
+    ):
+        index, *loc = detail['loc']
+        by_row.setdefault(int(index), []).append({**detail, 'loc': loc})
+    return by_row
+
+
+def validate_movie_batch(
+    rows: List[Any],
+) -> List[Union[CreateMovieRequest, ValidationErrors]]:
+    """
+    Validates a batch of `CreateMovieRequest` bodies in one call, returning
+    for each row either the request or its validation errors, shaped like
+    the errors of a single request.
+    """
+    try:
+        return list(_batch.validate_python(rows))
+    except ValidationError as e:
+        invalid = _errors(e)
+
+    # Rows valid on their own still validate as one batch, so a second
+    # pass without the invalid rows cannot fail
+    valid = iter(
+        _batch.validate_python(
+            [row for index, row in enumerate(rows) if index not in invalid]
+        )
+    )
+    return [
+        next(valid) if index not in invalid else invalid[index]
+        for index in range(len(rows))
+    ]
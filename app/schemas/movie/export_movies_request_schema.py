@@ -0,0 +1,13 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+ExportFormat = Literal['ndjson', 'csv']
+
+
+class ExportMoviesRequest(BaseModel):
+    format: ExportFormat = Field(default='ndjson')
+    aggregates: bool = Field(
+        default=False,
+        description='Include the review count and average rating',
+    )
@@ -1,13 +1,88 @@
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+from ...utils.genres import genre_slug, parse_genre_names
+
+GenreMatch = Literal['any', 'all']
+
+MovieView = Literal['summary', 'detail']
+
+MovieSort = Literal[
+    'created_at',
+    '-created_at',
+    'title',
+    '-title',
+    'year',
+    '-year',
+    'rating',
+    '-rating',
+    'relevance',
+]
 
 
 class GetMovieRequest(BaseModel):
     page: Optional[int] = Field(default=1, ge=1)
     limit: Optional[int] = Field(default=100, ge=1, le=100)
+    cursor: Optional[str] = Field(default=None, max_length=512)
     search: Optional[str] = Field(default=None, max_length=100)
     genre: Optional[str] = Field(default=None, max_length=50)
+    genres: Optional[str] = Field(
+        default=None,
+        max_length=200,
+        description='Comma-separated list of genres',
+    )
+    genre_match: GenreMatch = Field(
+        default='any',
+        description='Match movies with any or with all of the genres',
+    )
+    year_min: Optional[int] = Field(default=None, gt=1888, lt=2100)
+    year_max: Optional[int] = Field(default=None, gt=1888, lt=2100)
+    duration_min: Optional[int] = Field(default=None, gt=0)
+    duration_max: Optional[int] = Field(default=None, gt=0)
+    min_rating: Optional[float] = Field(default=None, ge=0, le=10)
+    sort: Optional[MovieSort] = Field(
+        default=None,
+        description=(
+            'Sort order, prefix with "-" for descending. Defaults to '
+            '"relevance" when searching and "created_at" otherwise'
+        ),
+    )
     rented: Optional[bool] = Field(
         default=None, description='Filter by rented status'
     )
+    view: MovieView = Field(
+        default='summary',
+        description=(
+            'Shape of listed movies: "summary" carries the rating '
+            'aggregates only, "detail" adds the description and every '
+            'review'
+        ),
+    )
+
+    @model_validator(mode='after')
+    def check_ranges(self) -> 'GetMovieRequest':
+        if self.year_min and self.year_max and self.year_min > self.year_max:
+            raise ValueError('year_min must not be greater than year_max')
+        if (
+            self.duration_min
+            and self.duration_max
+            and self.duration_min > self.duration_max
+        ):
+            raise ValueError(
+                'duration_min must not be greater than duration_max'
+            )
+        if self.sort == 'relevance' and not self.search:
+            raise ValueError('sort=relevance requires a search term')
+        return self
+
+    @property
+    def genre_slugs(self) -> list[str]:
+        raw = ','.join(value for value in (self.genre, self.genres) if value)
+        return [genre_slug(name) for name in parse_genre_names(raw)]
+
+    @property
+    def sort_order(self) -> MovieSort:
+        if self.sort:
+            return self.sort
+        return 'relevance' if self.search else 'created_at'
@@ -0,0 +1,14 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+ReviewSort = Literal['created_at', '-created_at', 'rating', '-rating']
+
+
+class GetReviewsRequest(BaseModel):
+    limit: Optional[int] = Field(default=20, ge=1, le=100)
+    cursor: Optional[str] = Field(default=None, max_length=512)
+    sort: ReviewSort = Field(
+        default='-created_at',
+        description='Sort order, prefix with "-" for descending',
+    )
@@ -1,4 +1,6 @@
 from .auth_service import AuthService
+from .genre_service import GenreService
+from .metrics_service import MetricsService
 from .movie_service import MovieService
 
-__all__ = ['MovieService', 'AuthService']
+__all__ = ['MovieService', 'AuthService', 'GenreService', 'MetricsService']
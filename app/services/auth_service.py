@@ -1,15 +1,21 @@
+from typing import Any, Dict
+
 from flask import Response
-from flask_jwt_extended import create_access_token  # pyright: ignore
-from werkzeug.security import check_password_hash, generate_password_hash
+from flask_jwt_extended import (  # pyright: ignore
+    create_access_token,
+    create_refresh_token,
+)
 
 from app.types.error import ApiErrorCodes
 from app.utils.exceptions import CustomException
 
-from ..dtos.user_dto import UserDto
+from ..dtos.user_dto import UserDto, UserIdentityDto
+from ..extensions import passwords, revocations
 from ..repositories.user_repository import UserRepository
 from ..schemas.user.login_user_schema import LoginUserRequest
 from ..schemas.user.register_user_schema import RegisterUserRequest
 from ..utils.api_response import ApiResponse
+from ..utils.identity import remember_user
 
 
 class AuthService:
@@ -24,7 +30,7 @@ class AuthService:
         email = register_user_request.email
         password = register_user_request.password
 
-        hashed_password = generate_password_hash(password)
+        hashed_password = passwords.hash(password)
 
         user = self.user_repository.create(
             username, name, email, hashed_password
@@ -33,7 +39,7 @@ class AuthService:
         return ApiResponse.send(
             201,
             'Usuário criado com sucesso',
-            data=UserDto.from_model(user).__dict__,
+            data=UserDto.from_model(user),
         )
 
     def login_user(self, login_user_request: LoginUserRequest) -> Response:
@@ -42,13 +48,39 @@ class AuthService:
 
         user = self.user_repository.find_by_email(email)
 
-        if not user or not check_password_hash(user.password, password):
+        if not user or not passwords.verify(user.password, password):
             raise CustomException(ApiErrorCodes.EMAIL_OR_PASSWORD_INCORRECT)
 
-        access_token = create_access_token(identity=user.id)
-        return ApiResponse.send(
-            200,
-            data={
-                'access_token': access_token,
-            },
-        )
+        if passwords.needs_rehash(user.password):
+            self.user_repository.update_password(
+                user, passwords.hash(password)
+            )
+
+        identity = UserIdentityDto.from_model(user)
+        # The first authenticated request is likely to follow right away
+        remember_user(identity)
+        return ApiResponse.send(200, data=self._issue_tokens(identity))
+
+    def refresh_tokens(
+        self, identity: UserIdentityDto, jwt_data: Dict[str, Any]
+    ) -> Response:
+        # Refresh tokens are single use. Claiming is atomic, so of several
+        # requests replaying the same token only the first one rotates it
+        if not revocations.claim(jwt_data):
+            raise CustomException(ApiErrorCodes.USER_NOT_AUTHENTICATED)
+        return ApiResponse.send(200, data=self._issue_tokens(identity))
+
+    def logout_user(self, jwt_data: Dict[str, Any]) -> Response:
+        revocations.revoke(jwt_data)
+        return ApiResponse.send(200, 'Token revogado com sucesso')
+
+    @staticmethod
+    def _issue_tokens(identity: UserIdentityDto) -> Dict[str, str]:
+        return {
+            'access_token': create_access_token(
+                identity=identity.id, additional_claims=identity.claims
+            ),
+            'refresh_token': create_refresh_token(
+                identity=identity.id, additional_claims=identity.claims
+            ),
+        }
@@ -0,0 +1,16 @@
+from flask import Response
+
+from ..dtos.genre_dto import ListGenreResponseDto
+from ..repositories import GenreRepository
+from ..utils.api_response import ApiResponse
+
+
+class GenreService:
+    def __init__(self, genre_repository: GenreRepository):
+        self.genre_repository = genre_repository
+
+    def get_genres(self) -> Response:
+        genres = self.genre_repository.find_all()
+        return ApiResponse.send(
+            data={'genres': ListGenreResponseDto.from_model(genres)}
+        )
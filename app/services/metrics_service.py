@@ -0,0 +1,16 @@
+from flask import Response, current_app
+
+from ..utils.api_response import ApiResponse
+from ..utils.pool_metrics import pool_metrics
+
+
+class MetricsService:
+    def get_pool_metrics(self) -> Response:
+        return ApiResponse.send(
+            data={
+                'pools': [
+                    metrics.snapshot()
+                    for metrics in pool_metrics(current_app)
+                ]
+            }
+        )
@@ -1,112 +1,284 @@
+import csv
+import io
+from dataclasses import asdict
 from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Iterable, Iterator, Sequence
 
-from flask import Response
+from flask import Response, current_app, stream_with_context
+from sqlalchemy import Row
 
-from ..dtos.movie_dto import ListMovieResponseDto, ListRentedMoviesResponseDto, MovieResponseDto
-from ..dtos.review_dto import ReviewDto
-from ..repositories import MovieRepository, RentalRepository, UserRepository
+from ..dtos.movie_dto import ListMovieResponseDto, ListRentedMoviesResponseDto, MovieResponseDto, ReviewRows
+from ..dtos.pagination_dto import CursorPaginationDto
+from ..dtos.review_dto import ListReviewResponseDto, ReviewDto
+from ..extensions import cache
+from ..repositories import GenreRepository, MovieRepository, RentalRepository
 from ..repositories.review_repository import ReviewRepository
 from ..schemas.movie.add_review_schema import AddReviewRequest
+from ..schemas.movie.bulk_create_movie_schema import validate_movie_batch
 from ..schemas.movie.create_movie_schema import CreateMovieRequest
-from ..schemas.movie.get_movie_request_schema import GetMovieRequest
+from ..schemas.movie.export_movies_request_schema import ExportMoviesRequest
+from ..schemas.movie.get_movie_request_schema import (
+    GetMovieRequest,
+    MovieView,
+)
+from ..schemas.movie.get_reviews_request_schema import GetReviewsRequest
 from ..types.error import ApiErrorCodes
 from ..utils.api_response import ApiResponse
+from ..utils.conditional import make_etag, send_conditional
+from ..utils.cursor import Cursor
 from ..utils.exceptions import CustomException
+from ..utils.genres import parse_genre_names
+from ..utils.json_stream import InvalidJson
+
+# Keyed by the version the ETag is built from, so a worker that missed an
+# invalidation never pairs an outdated body with the current ETag
+MOVIE_CACHE_KEY = 'movie:{movie_id}:{updated_at}:{total_reviews}'
+BULK_STATUSES = ('created', 'duplicate', 'invalid', 'error')
 
 
 class MovieService:
     def __init__(
         self,
         movie_repository: MovieRepository,
-        user_repository: UserRepository,
         rental_repository: RentalRepository,
         review_repository: ReviewRepository,
+        genre_repository: GenreRepository,
     ):
         self.movie_repository = movie_repository
-        self.user_repository = user_repository
         self.rental_repository = rental_repository
         self.review_repository = review_repository
+        self.genre_repository = genre_repository
 
     def get_movies(self, get_movie_request: GetMovieRequest) -> Response:
-        if get_movie_request.search:
-            movies = self.movie_repository.find_by_title(
-                get_movie_request.search
-            )
-            return ApiResponse.send(
-                status_code=200,
-                data={
-                    'movies': ListMovieResponseDto.from_model(movies).__dict__
-                },
-            )
+        cursor = None
+        if get_movie_request.cursor:
+            cursor = Cursor.decode(get_movie_request.cursor)
 
-        if get_movie_request.genre:
-            movies = self.movie_repository.find_by_genre(
-                get_movie_request.genre
-            )
-            return ApiResponse.send(
-                status_code=200,
-                data={
-                    'movies': ListMovieResponseDto.from_model(movies).__dict__
-                },
-            )
+        # List pages carry no per-user data, so every page of the catalog
+        # shares one version and a client polling an unchanged catalog
+        # costs a single aggregate query.
+        total, last_modified = self.movie_repository.catalog_version()
 
-        page = get_movie_request.page or 1
-        page_size = get_movie_request.limit or 100
-        movies = self.movie_repository.find_all(
-            (page - 1) * page_size, page_size
+        return send_conditional(
+            etag=make_etag('movies', total, last_modified),
+            last_modified=last_modified,
+            build=lambda: self._movies_response(get_movie_request, cursor),
         )
+
+    def _movies_response(
+        self, get_movie_request: GetMovieRequest, cursor: Cursor | None
+    ) -> Response:
+        page = self.movie_repository.find_page(get_movie_request, cursor)
+        reviews = self._embedded_reviews(page.items, get_movie_request.view)
+
         return ApiResponse.send(
-            data={'movies': ListMovieResponseDto.from_model(movies).__dict__}
+            data={
+                'movies': ListMovieResponseDto.from_rows(page.items, reviews),
+                'pagination': CursorPaginationDto.from_page(page),
+            }
         )
 
     def get_movie(self, movie_id: str, user_id: str) -> Response:
-        movie = self.movie_repository.find_by_id(movie_id)
-        rental = self.rental_repository.find_by_user_and_movie(
-            user_id=user_id, movie_id=movie_id
+        updated_at, total_reviews, rented_at = (
+            self.movie_repository.find_version(movie_id, user_id)
+        )
+        rented_at_iso = rented_at.isoformat() if rented_at else None
+
+        return send_conditional(
+            etag=make_etag(movie_id, updated_at, total_reviews, rented_at_iso),
+            last_modified=max(updated_at, rented_at or updated_at),
+            build=lambda: self._movie_response(
+                movie_id, updated_at, total_reviews, rented_at_iso
+            ),
         )
 
-        response_dto: MovieResponseDto = MovieResponseDto.from_model(movie)
-        if rental:
-            response_dto = MovieResponseDto.from_model(
-                movie, rental.rented_at.isoformat()
+    def _movie_response(
+        self,
+        movie_id: str,
+        updated_at: datetime,
+        total_reviews: int,
+        rented_at: str | None,
+    ) -> Response:
+        # The cached body is shared by every user, rented_at is overlaid
+        # per request from the caller's own rental.
+        cache_key = MOVIE_CACHE_KEY.format(
+            movie_id=movie_id,
+            updated_at=updated_at.isoformat(),
+            total_reviews=total_reviews,
+        )
+        movie_data = cache.get(cache_key)
+        if movie_data is None:
+            movie = self.movie_repository.find_by_id(movie_id)
+            reviews = self.review_repository.find_rows_by_movie_ids(
+                [movie_id]
             )
+            movie_data = asdict(
+                MovieResponseDto.from_model(movie, reviews=reviews[movie_id])
+            )
+            # A write landing between the version and the body read makes
+            # the body newer than its key, leave it out of the cache
+            if (movie.updated_at, movie.total_reviews) == (
+                updated_at,
+                total_reviews,
+            ):
+                cache.set(cache_key, movie_data)
 
         return ApiResponse.send(
-            data=response_dto.__dict__,
+            data={**movie_data, 'rented_at': rented_at},
             message='Filme encontrado com sucesso',
         )
 
     def create_movie(
         self, create_movie_request: CreateMovieRequest
     ) -> Response:
-        movie = self.movie_repository.create(create_movie_request)
+        genres = self.genre_repository.get_or_create(
+            parse_genre_names(create_movie_request.genre)
+        )
+        movie = self.movie_repository.create(create_movie_request, genres)
         return ApiResponse.send(
             status_code=201,
             message='Filme criado com sucesso',
-            data=MovieResponseDto.from_model(movie).__dict__,
+            data=MovieResponseDto.from_model(movie),
         )
 
-    def rent_movie(self, movie_id: str, user_id: str) -> Response:
-        movie = self.movie_repository.find_by_id(movie_id)
-        user = self.user_repository.find_by_id(user_id)
+    def import_movies(self, rows: Iterable[Any]) -> Response:
+        """
+        Create movies from `rows` in chunks of MOVIE_BULK_CHUNK_SIZE, each
+        committed on its own, streaming back one NDJSON result per row and
+        a final summary line. Neither the upload nor the report is held in
+        memory, only the chunk being imported.
+        """
+        chunk_size = current_app.config.get('MOVIE_BULK_CHUNK_SIZE', 500)
 
-        if not user:
-            raise CustomException(ApiErrorCodes.USER_NOT_FOUND)
-        if not movie:
-            raise CustomException(ApiErrorCodes.MOVIE_NOT_FOUND)
+        def report() -> Iterator[str]:
+            summary = dict.fromkeys(BULK_STATUSES, 0)
+            numbered = enumerate(rows, start=1)
+            while chunk := list(islice(numbered, chunk_size)):
+                for result in self._import_chunk(chunk):
+                    summary[result['status']] += 1
+                    yield current_app.json.dumps(result) + '\n'
+            yield current_app.json.dumps({'summary': summary}) + '\n'
 
-        rental = self.rental_repository.find_by_user_and_movie(
-            user_id=user_id, movie_id=movie_id
+        return Response(
+            stream_with_context(report()), mimetype='application/x-ndjson'
         )
 
-        if rental:
-            raise CustomException(
-                ApiErrorCodes.MOVIE_ALREADY_RENTED,
-                data={
-                    'movie_id': movie_id,
-                },
-            )
+    def export_movies(self, export_request: ExportMoviesRequest) -> Response:
+        """
+        Stream the whole catalog as NDJSON or CSV. Rows are read in batches
+        of MOVIE_EXPORT_BATCH_SIZE from a server-side cursor and each batch
+        is written out before the next is fetched, so memory does not grow
+        with the catalog.
+        """
+        result = self.movie_repository.stream_export(
+            export_request.aggregates,
+            current_app.config.get('MOVIE_EXPORT_BATCH_SIZE', 1000),
+        )
+        columns = list(result.keys())
+        created_at = columns.index('created_at')
+
+        def batches() -> Iterator[list[list[Any]]]:
+            for partition in result.partitions():
+                batch = [list(row) for row in partition]
+                for row in batch:
+                    row[created_at] = row[created_at].isoformat()
+                yield batch
 
+        def ndjson() -> Iterator[str]:
+            dumps = current_app.json.dumps
+            for batch in batches():
+                yield ''.join(
+                    dumps(dict(zip(columns, row))) + '\n' for row in batch
+                )
+
+        def csv_lines() -> Iterator[str]:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            for batch in batches():
+                writer.writerows(batch)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            # The header alone when the catalog is empty
+            yield buffer.getvalue()
+
+        body, mimetype = {
+            'ndjson': (ndjson, 'application/x-ndjson'),
+            'csv': (csv_lines, 'text/csv'),
+        }[export_request.format]
+        response = Response(stream_with_context(body()), mimetype=mimetype)
+        response.headers['Content-Disposition'] = (
+            f'attachment; filename="movies.{export_request.format}"'
+        )
+        return response
+
+    def _import_chunk(
+        self, chunk: list[tuple[int, Any]]
+    ) -> list[dict[str, Any]]:
+        results: dict[int, dict[str, Any]] = {}
+        decoded = []
+        for row, value in chunk:
+            if isinstance(value, InvalidJson):
+                results[row] = {
+                    'row': row,
+                    'status': 'invalid',
+                    'errors': value.message,
+                }
+            else:
+                decoded.append((row, value))
+
+        # First occurrence of each title, later ones are duplicates
+        pending: dict[str, tuple[int, CreateMovieRequest]] = {}
+        validated = validate_movie_batch([value for _, value in decoded])
+        for (row, _), outcome in zip(decoded, validated):
+            if not isinstance(outcome, CreateMovieRequest):
+                results[row] = {
+                    'row': row,
+                    'status': 'invalid',
+                    'errors': outcome,
+                }
+            elif outcome.title in pending:
+                results[row] = {
+                    'row': row,
+                    'status': 'duplicate',
+                    'title': outcome.title,
+                }
+            else:
+                pending[outcome.title] = (row, outcome)
+
+        if pending:
+            try:
+                created = self.movie_repository.create_many(
+                    [request for _, request in pending.values()]
+                )
+            except CustomException as e:
+                for row, _ in pending.values():
+                    results[row] = {
+                        'row': row,
+                        'status': 'error',
+                        'errors': e.description,
+                    }
+            else:
+                for title, (row, _) in pending.items():
+                    if title in created:
+                        results[row] = {
+                            'row': row,
+                            'status': 'created',
+                            'title': title,
+                            'id': created[title],
+                        }
+                    else:
+                        results[row] = {
+                            'row': row,
+                            'status': 'duplicate',
+                            'title': title,
+                        }
+
+        return [results[row] for row, _ in chunk]
+
+    def rent_movie(self, movie_id: str, user_id: str) -> Response:
         expiration_date = datetime.now() + timedelta(days=7)
         self.rental_repository.create(
             user_id=user_id, movie_id=movie_id, expiration_date=expiration_date
@@ -116,38 +288,66 @@ class MovieService:
             message='Filme alugado com sucesso',
         )
 
-    def get_rented_movies(self, user_id: str) -> Response:
-        user = self.user_repository.find_by_id(user_id)
+    def get_rented_movies(
+        self, user_id: str, view: MovieView = 'summary'
+    ) -> Response:
+        movies = self.rental_repository.find_movie_rows_by_user_id(
+            user_id, view
+        )
+        reviews = self._embedded_reviews(movies, view)
 
-        if not user:
-            raise CustomException(ApiErrorCodes.USER_NOT_FOUND)
+        return ApiResponse.send(
+            data={
+                'movies': ListRentedMoviesResponseDto.from_rows(
+                    movies, reviews
+                )
+            },
+        )
 
-        rentals = self.rental_repository.find_by_user_id(user_id)
+    def _embedded_reviews(
+        self, movies: Sequence[Row[Any]], view: MovieView
+    ) -> ReviewRows | None:
+        # Summaries carry the rating aggregates only, reviews are paged
+        # through get_reviews instead.
+        if view == 'summary':
+            return None
+        return self.review_repository.find_rows_by_movie_ids(
+            [movie.id for movie in movies]
+        )
+
+    def get_reviews(
+        self, movie_id: str, get_reviews_request: GetReviewsRequest
+    ) -> Response:
+        cursor = None
+        if get_reviews_request.cursor:
+            cursor = Cursor.decode(get_reviews_request.cursor)
+
+        page = self.review_repository.find_page(
+            movie_id, get_reviews_request, cursor
+        )
+        # An empty first page may also mean the movie does not exist.
+        if not page.items and cursor is None:
+            self.movie_repository.find_by_id(movie_id)
 
         return ApiResponse.send(
             data={
-                'movies': ListRentedMoviesResponseDto.from_model(
-                    rentals
-                ).__dict__
-            },
+                'reviews': ListReviewResponseDto.from_rows(page.items),
+                'pagination': CursorPaginationDto.from_page(page),
+            }
         )
 
     def add_review(
         self, movie_id: str, user_id: str, add_review_request: AddReviewRequest
     ) -> Response:
-        movie = self.movie_repository.find_by_id(movie_id)
-        user = self.user_repository.find_by_id(user_id)
-
-        if not user:
-            raise CustomException(ApiErrorCodes.USER_NOT_FOUND)
-        if not movie:
-            raise CustomException(ApiErrorCodes.MOVIE_NOT_FOUND)
-
+        # The user comes from a verified token and a rental can only exist
+        # for an existing user and movie, so the rental is the only row to
+        # check up front. A second review is rejected by the unique index.
         rental = self.rental_repository.find_by_user_and_movie(
             user_id=user_id, movie_id=movie_id
         )
 
         if not rental:
+            self.movie_repository.find_by_id(movie_id)
             raise CustomException(
                 ApiErrorCodes.TRY_REVIEW_NOT_RENTED_MOVIE,
                 data={
@@ -155,18 +355,6 @@ class MovieService:
                 },
             )
 
-        review = self.review_repository.find_by_user_and_movie(
-            user_id=user_id, movie_id=movie_id
-        )
-
-        if review:
-            raise CustomException(
-                ApiErrorCodes.TRY_REVIEW_ALREADY_RATED_MOVIE,
-                data={
-                    'movie_id': movie_id,
-                },
-            )
-
         review = self.review_repository.create(
             user_id=user_id,
             movie_id=movie_id,
@@ -174,9 +362,7 @@ class MovieService:
             comment=add_review_request.comment,
         )
 
-        self.movie_repository.update_rating(movie, review.rating)
-
         return ApiResponse.send(
             message='Avaliação criada com sucesso',
-            data=ReviewDto.from_model(review).__dict__,
+            data=ReviewDto.from_model(review),
         )
@@ -13,6 +13,7 @@ class ApiErrorCodes(str, Enum):
 
     # Validation errors
     VALIDATION_ERROR = 'VALIDATION_ERROR'
+    INVALID_CURSOR = 'INVALID_CURSOR'
 
     # User errors
     USER_ALREADY_EXISTS = 'USER_ALREADY_EXISTS'
@@ -23,6 +24,7 @@ class ApiErrorCodes(str, Enum):
     # Authentication errors
     EMAIL_OR_PASSWORD_INCORRECT = 'EMAIL_OR_PASSWORD_INCORRECT'
     USER_NOT_AUTHENTICATED = 'USER_NOT_AUTHENTICATED'
+    AUTHENTICATION_UNAVAILABLE = 'AUTHENTICATION_UNAVAILABLE'
 
     # Rental errors
     MOVIE_ALREADY_RENTED = 'MOVIE_ALREADY_RENTED'
@@ -102,6 +104,11 @@ AuthErrors: Dict[ApiErrorCodes, ApiBaseError] = {
         description='Usuário não autenticado',
         data=[],
     ),
+    ApiErrorCodes.AUTHENTICATION_UNAVAILABLE: ApiBaseError(
+        status=503,
+        description='Autenticação sobrecarregada, tente novamente',
+        data=[],
+    ),
 }
 
 ApiErrors: Dict[ApiErrorCodes, ApiBaseError] = {
@@ -123,6 +130,11 @@ ApiErrors: Dict[ApiErrorCodes, ApiBaseError] = {
         description='Ocorreu um erro de validação',
         data=[],
     ),
+    ApiErrorCodes.INVALID_CURSOR: ApiBaseError(
+        status=400,
+        description='Cursor de paginação inválido',
+        data=[],
+    ),
     ApiErrorCodes.MOVIE_NOT_FOUND: ApiBaseError(
         status=404,
         description='Filme não encontrado',
@@ -124,6 +124,77 @@ swagger_template: Dict[str, Any] = {
                 'duration': {'type': 'integer', 'minimum': 1, 'example': 148},
             },
         },
+        'BulkMovieResult': {
+            'type': 'object',
+            'description': (
+                'One NDJSON line per uploaded row. The last line carries '
+                '`summary` instead, the count of rows of each status.'
+            ),
+            'properties': {
+                'row': {
+                    'type': 'integer',
+                    'description': 'Position of the row in the upload, from 1',
+                    'example': 1,
+                },
+                'status': {
+                    'type': 'string',
+                    'enum': ['created', 'duplicate', 'invalid', 'error'],
+                    'example': 'created',
+                },
+                'title': {'type': 'string', 'example': 'Inception'},
+                'id': {
+                    'type': 'string',
+                    'description': 'ID of the created movie',
+                    'example': '123e4567-e89b-12d3-a456-426614174000',
+                },
+                'errors': {
+                    'description': (
+                        'Validation errors of an invalid row, or the '
+                        'message of a chunk that failed to insert'
+                    ),
+                },
+                'summary': {
+                    'type': 'object',
+                    'additionalProperties': {'type': 'integer'},
+                    'example': {
+                        'created': 2,
+                        'duplicate': 1,
+                        'invalid': 0,
+                        'error': 0,
+                    },
+                },
+            },
+        },
+        'MovieExportRow': {
+            'type': 'object',
+            'description': (
+                'One exported movie, an NDJSON line or a CSV row. '
+                '`total_reviews` and `average_rating` are only present with '
+                '`aggregates=true`.'
+            ),
+            'properties': {
+                'id': {
+                    'type': 'string',
+                    'example': '123e4567-e89b-12d3-a456-426614174000',
+                },
+                'title': {'type': 'string', 'example': 'Inception'},
+                'year': {'type': 'integer', 'example': 2010},
+                'genre': {'type': 'string', 'example': 'Sci-Fi'},
+                'duration_minutes': {'type': 'integer', 'example': 148},
+                'description': {'type': 'string', 'nullable': True},
+                'created_at': {
+                    'type': 'string',
+                    'format': 'date-time',
+                    'example': '2023-01-01T00:00:00',
+                },
+                'total_reviews': {'type': 'integer', 'example': 12},
+                'average_rating': {
+                    'type': 'number',
+                    'format': 'float',
+                    'example': 8.5,
+                },
+            },
+        },
         'AddReviewRequest': {
             'type': 'object',
             'required': ['rating'],
@@ -159,6 +230,12 @@ swagger_template: Dict[str, Any] = {
                     'default': 100,
                     'example': 10,
                 },
+                'cursor': {
+                    'type': 'string',
+                    'maxLength': 512,
+                    'nullable': True,
+                    'description': 'Opaque keyset pagination cursor',
+                },
                 'search': {
                     'type': 'string',
                     'maxLength': 100,
@@ -171,6 +248,42 @@ swagger_template: Dict[str, Any] = {
                     'nullable': True,
                     'example': 'Sci-Fi',
                 },
+                'genres': {
+                    'type': 'string',
+                    'maxLength': 200,
+                    'nullable': True,
+                    'example': 'Sci-Fi,Drama',
+                },
+                'genre_match': {
+                    'type': 'string',
+                    'enum': ['any', 'all'],
+                    'default': 'any',
+                },
+                'year_min': {'type': 'integer', 'nullable': True},
+                'year_max': {'type': 'integer', 'nullable': True},
+                'duration_min': {'type': 'integer', 'nullable': True},
+                'duration_max': {'type': 'integer', 'nullable': True},
+                'min_rating': {
+                    'type': 'number',
+                    'minimum': 0,
+                    'maximum': 10,
+                    'nullable': True,
+                },
+                'sort': {
+                    'type': 'string',
+                    'enum': [
+                        'created_at',
+                        '-created_at',
+                        'title',
+                        '-title',
+                        'year',
+                        '-year',
+                        'rating',
+                        '-rating',
+                        'relevance',
+                    ],
+                    'nullable': True,
+                },
                 'rented': {
                     'type': 'boolean',
                     'nullable': True,
@@ -229,6 +342,41 @@ swagger_template: Dict[str, Any] = {
                 'reviews': {'$ref': '#/definitions/ListReviewResponseDto'},
             },
         },
+        'MovieSummary': {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'string', 'example': '1'},
+                'title': {'type': 'string', 'example': 'Inception'},
+                'year': {'type': 'integer', 'example': 2010},
+                'created_at': {
+                    'type': 'string',
+                    'format': 'date-time',
+                    'example': '2023-01-01T00:00:00Z',
+                },
+                'duration_minutes': {'type': 'integer', 'example': 148},
+                'genre': {'type': 'string', 'example': 'Sci-Fi'},
+                'total_reviews': {'type': 'integer', 'example': 5},
+                'average_rating': {
+                    'type': 'number',
+                    'format': 'float',
+                    'example': 8.5,
+                },
+                'rented_at': {
+                    'type': 'string',
+                    'format': 'date-time',
+                    'nullable': True,
+                },
+            },
+        },
+        'ListMovieSummaryResponseDto': {
+            'type': 'object',
+            'properties': {
+                'data': {
+                    'type': 'array',
+                    'items': {'$ref': '#/definitions/MovieSummary'},
+                }
+            },
+        },
         'ListMovieResponseDto': {
             'type': 'object',
             'properties': {
@@ -238,6 +386,21 @@ swagger_template: Dict[str, Any] = {
                 }
             },
         },
+        'CursorPaginationDto': {
+            'type': 'object',
+            'properties': {
+                'next_cursor': {
+                    'type': 'string',
+                    'nullable': True,
+                    'example': 'eyJrIjpbIjIwMjMtMDEtMDFUMDA6MDA6MDAiLCIxIl19',
+                },
+                'prev_cursor': {
+                    'type': 'string',
+                    'nullable': True,
+                    'example': None,
+                },
+            },
+        },
         'ListRentedMoviesResponseDto': {
             'type': 'object',
             'properties': {
@@ -247,6 +410,23 @@ swagger_template: Dict[str, Any] = {
                 }
             },
         },
+        'GenreDto': {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer', 'example': 1},
+                'name': {'type': 'string', 'example': 'Sci-Fi'},
+                'movie_count': {'type': 'integer', 'example': 42},
+            },
+        },
+        'ListGenreResponseDto': {
+            'type': 'object',
+            'properties': {
+                'data': {
+                    'type': 'array',
+                    'items': {'$ref': '#/definitions/GenreDto'},
+                }
+            },
+        },
         'ReviewDto': {
             'type': 'object',
             'properties': {
@@ -283,6 +463,75 @@ swagger_template: Dict[str, Any] = {
                 }
             },
         },
+        'ReviewPageResponse': {
+            'type': 'object',
+            'properties': {
+                'code': {'type': 'integer', 'example': 200},
+                'message': {'type': 'string', 'example': ''},
+                'reviews': {'$ref': '#/definitions/ListReviewResponseDto'},
+                'pagination': {'$ref': '#/definitions/CursorPaginationDto'},
+            },
+        },
+        'TokenPairResponse': {
+            'type': 'object',
+            'properties': {
+                'code': {'type': 'integer', 'example': 200},
+                'message': {'type': 'string', 'example': ''},
+                'access_token': {
+                    'type': 'string',
+                    'example': 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...',
+                },
+                'refresh_token': {
+                    'type': 'string',
+                    'example': 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...',
+                },
+            },
+        },
+        'PoolMetrics': {
+            'type': 'object',
+            'properties': {
+                'name': {'type': 'string', 'example': 'default'},
+                'pool': {
+                    'type': 'string',
+                    'example': 'InstrumentedQueuePool',
+                },
+                'size': {'type': 'integer', 'example': 5, 'nullable': True},
+                'checked_out': {'type': 'integer', 'example': 2},
+                'overflow': {
+                    'type': 'integer',
+                    'example': 0,
+                    'nullable': True,
+                },
+                'checkouts': {'type': 'integer', 'example': 1520},
+                'connects': {'type': 'integer', 'example': 5},
+                'invalidations': {'type': 'integer', 'example': 0},
+                'timeouts': {'type': 'integer', 'example': 0},
+                'wait_seconds': {
+                    'type': 'object',
+                    'description': 'Cumulative checkout wait histogram',
+                    'properties': {
+                        'buckets': {
+                            'type': 'object',
+                            'additionalProperties': {'type': 'integer'},
+                            'example': {'0.001': 1500, '+Inf': 1520},
+                        },
+                        'sum': {'type': 'number', 'example': 0.42},
+                        'count': {'type': 'integer', 'example': 1520},
+                    },
+                },
+            },
+        },
+        'PoolMetricsResponse': {
+            'type': 'object',
+            'properties': {
+                'code': {'type': 'integer', 'example': 200},
+                'message': {'type': 'string', 'example': ''},
+                'pools': {
+                    'type': 'array',
+                    'items': {'$ref': '#/definitions/PoolMetrics'},
+                },
+            },
+        },
         'ApiResponse': {
             'type': 'object',
             'properties': {
@@ -315,12 +564,14 @@ swagger_template: Dict[str, Any] = {
                 'ERROR_CREATING_MOVIE',
                 'MOVIE_NOT_FOUND',
                 'VALIDATION_ERROR',
+                'INVALID_CURSOR',
                 'USER_ALREADY_EXISTS',
                 'USER_NAME_ALREADY_EXISTS',
                 'USER_EMAIL_ALREADY_EXISTS',
                 'USER_NOT_FOUND',
                 'EMAIL_OR_PASSWORD_INCORRECT',
                 'USER_NOT_AUTHENTICATED',
+                'AUTHENTICATION_UNAVAILABLE',
                 'MOVIE_ALREADY_RENTED',
                 'RENTAL_NOT_FOUND',
                 'TRY_REVIEW_NOT_RENTED_MOVIE',
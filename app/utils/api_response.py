@@ -1,3 +1,4 @@
+from dataclasses import fields, is_dataclass
 from typing import Any
 
 from flask import Response, make_response
@@ -8,6 +9,13 @@ class ApiResponse:
     def send(
         status_code: int = 200, message: str = '', data: Any = {}
     ) -> Response:
+        # DTOs are spread one level deep only, nested DTOs are left for the
+        # JSON provider to serialize.
+        if is_dataclass(data):
+            data = {
+                field.name: getattr(data, field.name) for field in fields(data)
+            }
+
         return make_response(
             {
                 'code': status_code,
@@ -1,4 +1,10 @@
-from flask_jwt_extended import get_jwt_identity, jwt_required  # pyright: ignore
+from flask_jwt_extended import (  # pyright: ignore
+    current_user,
+    get_jwt_identity,
+    jwt_required,
+)
+
+from ..dtos.user_dto import UserIdentityDto
 
 
 class AuthMixin:
@@ -6,3 +12,9 @@ class AuthMixin:
     @jwt_required()
     def user_id(self) -> str:
         return get_jwt_identity()
+
+    @property
+    @jwt_required()
+    def current_user(self) -> UserIdentityDto:
+        user: UserIdentityDto = current_user
+        return user
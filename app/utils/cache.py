@@ -0,0 +1,256 @@
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from itertools import islice
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from flask import Flask, current_app
+
+
+class Cache(ABC):
+    """
+    Key/value cache interface. Values must be JSON-serializable and are
+    shared between readers, so callers must treat them as read-only.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class NullCache(Cache):
+    def get(self, key: str) -> Any | None:
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class MemoryCache(Cache):
+    """
+    In-process LRU cache with per-entry expiry. Each worker process keeps
+    its own copy, so invalidation only reaches the worker that performs it;
+    the TTL bounds how stale other workers can be.
+    """
+
+    def __init__(self, max_entries: int = 1024, default_ttl: int = 300):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + (ttl or self.default_ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class LocalRedis:
+    """
+    In-process stand-in for the subset of the redis-py client used by
+    `RedisCache`, selected with the `memory://` URL in tests and local runs.
+    """
+
+    def __init__(self) -> None:
+        self._data: Dict[str, Tuple[Optional[float], bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> bytes | None:
+        with self._lock:
+            entry = self._data.get(name)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[name]
+                return None
+            return value
+
+    def set(
+        self,
+        name: str,
+        value: bytes | str,
+        ex: Optional[int] = None,
+        nx: bool = False,
+    ) -> bool | None:
+        if isinstance(value, str):
+            value = value.encode()
+        now = time.monotonic()
+        expires_at = now + ex if ex else None
+        with self._lock:
+            if nx and name in self._data:
+                current_expiry, _ = self._data[name]
+                if current_expiry is None or current_expiry > now:
+                    return None
+            self._data[name] = (expires_at, value)
+        return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(
+                1 for name in names if self._data.pop(name, None) is not None
+            )
+
+    def scan_iter(self, match: str = '*') -> Iterator[str]:
+        with self._lock:
+            names = [name for name in self._data if fnmatchcase(name, match)]
+        return iter(names)
+
+
+class RedisCache(Cache):
+    """
+    Cache shared by every worker through a Redis-compatible server. Values
+    are stored as JSON under `prefix`.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        default_ttl: int = 300,
+        prefix: str = 'filmes:cache:',
+    ):
+        self.client = client
+        self.default_ttl = default_ttl
+        self.prefix = prefix
+
+    def get(self, key: str) -> Any | None:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.client.set(
+            self.prefix + key,
+            json.dumps(value, separators=(',', ':')),
+            ex=ttl or self.default_ttl,
+        )
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    def clear(self) -> None:
+        # Only this cache's keys, the server may hold other data such as
+        # the revocation store
+        keys = self.client.scan_iter(match=self.prefix + '*')
+        while batch := list(islice(keys, 500)):
+            self.client.delete(*batch)
+
+
+def require_shared(app: Flask, setting: str) -> None:
+    """
+    Refuses to start with a per-process store for state every worker must
+    see when `REQUIRE_SHARED_STATE` is set, as in production where several
+    workers serve requests.
+    """
+    if app.config.get('REQUIRE_SHARED_STATE'):
+        raise RuntimeError(
+            f'{setting} keeps its state in each worker process, point it '
+            'at a redis:// server or set REQUIRE_SHARED_STATE=false to run '
+            'a single worker'
+        )
+
+
+def redis_client(url: str) -> Any:
+    if url.startswith('memory://'):
+        return LocalRedis()
+
+    try:
+        import redis  # pyright: ignore
+    except ImportError as e:
+        raise RuntimeError(
+            'CACHE_REDIS_URL requires the redis package, '
+            'install it with `uv sync --extra redis`'
+        ) from e
+    return redis.Redis.from_url(url)
+
+
+def create_cache(app: Flask) -> Cache:
+    backend = app.config.get('CACHE_BACKEND', 'memory')
+    default_ttl = app.config.get('CACHE_DEFAULT_TTL', 300)
+
+    if backend == 'memory':
+        return MemoryCache(
+            max_entries=app.config.get('CACHE_MAX_ENTRIES', 1024),
+            default_ttl=default_ttl,
+        )
+    if backend == 'redis':
+        return RedisCache(
+            redis_client(app.config.get('CACHE_REDIS_URL') or 'memory://'),
+            default_ttl=default_ttl,
+        )
+    if backend == 'null':
+        return NullCache()
+    raise ValueError(f'Unknown CACHE_BACKEND: {backend}')
+
+
+class CacheExtension:
+    """
+    Flask extension exposing the cache configured for the current app.
+    """
+
+    def init_app(self, app: Flask) -> None:
+        app.extensions['cache'] = create_cache(app)
+
+    @property
+    def backend(self) -> Cache:
+        backend: Cache = current_app.extensions['cache']
+        return backend
+
+    def get(self, key: str) -> Any | None:
+        return self.backend.get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.backend.set(key, value, ttl)
+
+    def delete(self, *keys: str) -> None:
+        self.backend.delete(*keys)
+
+    def clear(self) -> None:
+        self.backend.clear()
@@ -0,0 +1,57 @@
+from datetime import datetime, timezone
+from hashlib import sha256
+from typing import Any, Callable
+
+from flask import Response, request
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Builds a strong ETag from the values that identify a representation.
+    """
+    return sha256('|'.join(map(str, parts)).encode()).hexdigest()[:32]
+
+
+def as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes even for timezone-aware columns.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def is_not_modified(etag: str, last_modified: datetime | None) -> bool:
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2)
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified:
+        return (
+            as_utc(last_modified).replace(microsecond=0)
+            <= request.if_modified_since
+        )
+    return False
+
+
+def send_conditional(
+    etag: str,
+    last_modified: datetime | None,
+    build: Callable[[], Response],
+) -> Response:
+    """
+    Answers with 304 Not Modified when the client already holds the current
+    representation, otherwise calls `build` for the full response. Either
+    way the response carries the validators.
+    """
+    if is_not_modified(etag, last_modified):
+        response = Response(status=304)
+    else:
+        response = build()
+
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = as_utc(last_modified)
+    # Bodies embed the caller's own rentals, so shared caches must not
+    # reuse them and clients must revalidate before each reuse.
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.vary.add('Authorization')
+    return response
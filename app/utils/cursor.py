@@ -0,0 +1,63 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from dataclasses import dataclass
+from typing import Any, Generic, List, Literal, TypeVar
+
+from ..types.error import ApiErrorCodes
+from .exceptions import CustomException
+
+CursorDirection = Literal['next', 'prev']
+
+T = TypeVar('T')
+
+
+@dataclass
+class Cursor:
+    """
+    Position in a keyset-paginated listing.
+
+    `key` holds the sort key values of the row the cursor points at,
+    `sort` names the ordering they belong to and `direction` tells whether
+    the page continues after or before that row.
+    """
+
+    key: List[Any]
+    direction: CursorDirection = 'next'
+    sort: str | None = None
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            {'k': self.key, 'd': self.direction, 's': self.sort},
+            separators=(',', ':'),
+        )
+        return urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, token: str) -> 'Cursor':
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            payload = json.loads(urlsafe_b64decode(padded.encode()))
+            key = payload['k']
+            direction = payload['d']
+            sort = payload.get('s')
+            if not isinstance(key, list) or direction not in ('next', 'prev'):
+                raise ValueError(token)
+            return cls(key=key, direction=direction, sort=sort)
+        except (BinasciiError, ValueError, KeyError, TypeError) as e:
+            raise invalid_cursor(token) from e
+
+
+def invalid_cursor(token: str) -> CustomException:
+    return CustomException(ApiErrorCodes.INVALID_CURSOR, data={'cursor': token})
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    One page of a listing plus the cursors leading to its neighbours.
+    """
+
+    items: List[T]
+    next_cursor: Cursor | None = None
+    prev_cursor: Cursor | None = None
@@ -0,0 +1,94 @@
+from typing import Any, Dict
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import MetaData, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from .pool_metrics import InstrumentedQueuePool, PoolMetrics
+from .replicas import (
+    REPLICA_BIND_PREFIX,
+    ReplicaSet,
+    RoutingSession,
+    create_pin_store,
+)
+
+# Options only understood by QueuePool, SQLite in-memory databases run on
+# StaticPool and reject them
+QUEUE_POOL_OPTIONS = ('pool_size', 'max_overflow', 'pool_timeout')
+
+
+def set_statement_timeout(engine: Engine, timeout_ms: int) -> None:
+    """
+    Makes the server cancel statements running longer than `timeout_ms`.
+    Only PostgreSQL supports a server-side timeout, other dialects are
+    left as they are.
+    """
+    if engine.dialect.name != 'postgresql':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def on_connect(dbapi_connection: Any, _: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute('SET statement_timeout = %s', (timeout_ms,))
+        cursor.close()
+        # psycopg2 opened a transaction for the SET, and the pool's reset
+        # on checkin would roll it back
+        dbapi_connection.commit()
+
+
+class Database(SQLAlchemy):
+    """
+    SQLAlchemy extension that applies the pool options each engine's pool
+    supports, sets the statement timeout and records pool metrics in
+    `app.extensions['pool_metrics']`. Sessions route replica reads to the
+    `replica_*` binds, collected in `app.extensions['replicas']`, and
+    read-your-writes pins in `app.extensions['replica_pins']`.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        session_options = kwargs.setdefault('session_options', {})
+        session_options.setdefault('class_', RoutingSession)
+        super().__init__(**kwargs)
+
+    def init_app(self, app: Flask) -> None:
+        super().init_app(app)
+        with app.app_context():
+            replicas = [
+                engine
+                for key, engine in self.engines.items()
+                if key and key.startswith(REPLICA_BIND_PREFIX)
+            ]
+        if replicas:
+            app.extensions['replica_pins'] = create_pin_store(app)
+            app.extensions['replicas'] = ReplicaSet(
+                replicas,
+                retry_after=app.config.get('REPLICA_RETRY_SECONDS', 30),
+            )
+
+    def _make_metadata(self, bind_key: str | None) -> MetaData:
+        # Replicas mirror the primary's tables, so create_all and drop_all
+        # must not treat them as databases of their own
+        if bind_key is not None and bind_key.startswith(REPLICA_BIND_PREFIX):
+            return self._make_metadata(None)
+        return super()._make_metadata(bind_key)
+
+    def _make_engine(
+        self, bind_key: str | None, options: Dict[str, Any], app: Flask
+    ) -> Engine:
+        poolclass = options.setdefault('poolclass', InstrumentedQueuePool)
+        if not issubclass(poolclass, QueuePool):
+            for key in QUEUE_POOL_OPTIONS:
+                options.pop(key, None)
+
+        engine = super()._make_engine(bind_key, options, app)
+
+        timeout_ms = app.config.get('DATABASE_STATEMENT_TIMEOUT', 0)
+        if timeout_ms:
+            set_statement_timeout(engine, timeout_ms)
+
+        metrics = PoolMetrics(bind_key or 'default')
+        metrics.attach(engine)
+        app.extensions.setdefault('pool_metrics', {})[metrics.name] = metrics
+        return engine
@@ -0,0 +1,20 @@
+import re
+
+GENRE_SEPARATORS = re.compile(r'[,/|]')
+
+
+def genre_slug(name: str) -> str:
+    return ' '.join(name.split()).lower()
+
+
+def parse_genre_names(raw: str) -> list[str]:
+    """
+    Split a free-text genre field such as `"Drama, Sci-Fi"` into distinct
+    genre names, keeping the first spelling seen for each slug.
+    """
+    names: dict[str, str] = {}
+    for part in GENRE_SEPARATORS.split(raw):
+        name = ' '.join(part.split())
+        if name:
+            names.setdefault(genre_slug(name), name)
+    return list(names.values())
@@ -0,0 +1,60 @@
+from typing import Any
+
+from flask import Flask, current_app
+
+from ..dtos.user_dto import UserIdentityDto
+from ..extensions import jwt, revocations
+from ..repositories.user_repository import UserRepository
+from .cache import MemoryCache
+
+USER_CACHE_KEY = 'user:{user_id}:{version}'
+
+
+def user_cache() -> MemoryCache:
+    cache: MemoryCache = current_app.extensions['user_cache']
+    return cache
+
+
+def load_user(jwt_header: dict[str, Any], jwt_data: dict[str, Any]) -> Any:
+    """
+    Resolves the token's user through a short-lived in-process cache keyed
+    by id and token version, so authenticated requests rarely touch the
+    users table. Tokens whose version no longer matches the user's are
+    rejected once the cached entry expires.
+    """
+    user_id = jwt_data['sub']
+    version = jwt_data.get('ver', 0)
+    identity = user_cache().get(
+        USER_CACHE_KEY.format(user_id=user_id, version=version)
+    )
+    if identity is None:
+        user = UserRepository().find_identity(user_id)
+        if user is None or user.token_version != version:
+            return None
+        identity = UserIdentityDto.from_model(user)
+        remember_user(identity)
+    return identity
+
+
+def remember_user(identity: UserIdentityDto) -> None:
+    user_cache().set(
+        USER_CACHE_KEY.format(
+            user_id=identity.id, version=identity.token_version
+        ),
+        identity,
+    )
+
+
+def is_token_revoked(
+    jwt_header: dict[str, Any], jwt_data: dict[str, Any]
+) -> bool:
+    return revocations.is_revoked(jwt_data)
+
+
+def init_identity(app: Flask) -> None:
+    app.extensions['user_cache'] = MemoryCache(
+        max_entries=app.config.get('USER_CACHE_MAX_ENTRIES', 4096),
+        default_ttl=app.config.get('USER_CACHE_TTL', 60),
+    )
+    jwt.user_lookup_loader(load_user)
+    jwt.token_in_blocklist_loader(is_token_revoked)
@@ -0,0 +1,62 @@
+from typing import Any, cast
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without the extra
+    orjson = None  # type: ignore[assignment]
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson. Dataclass DTOs are serialized natively
+    straight to bytes instead of being copied into dicts by
+    `dataclasses.asdict` first, and responses skip the str round-trip.
+    Output is UTF-8 rather than ASCII-escaped.
+    """
+
+    def _options(self, indent: bool = False) -> int:
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=self._options(bool(kwargs.get('indent'))),
+        ).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (
+            self.compact is None and self._app.debug
+        )
+        body = orjson.dumps(
+            obj,
+            default=self.default,
+            option=self._options(indent) | orjson.OPT_APPEND_NEWLINE,
+        )
+        # Only ever installed on a Flask app, see `init_json_provider`.
+        app = cast(Flask, self._app)
+        return app.response_class(body, mimetype=self.mimetype)
+
+
+def init_json_provider(app: Flask) -> None:
+    """
+    Selects the JSON provider from `JSON_PROVIDER`. `orjson` falls back to
+    Flask's stdlib provider when the package is not installed.
+    """
+    provider = app.config.get('JSON_PROVIDER', 'orjson')
+    if provider == 'orjson' and orjson is not None:
+        app.json = OrjsonProvider(app)
+    elif provider not in ('orjson', 'default'):
+        raise ValueError(f'Unknown JSON_PROVIDER: {provider}')
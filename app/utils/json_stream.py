@@ -0,0 +1,131 @@
+import codecs
+import json
+from typing import IO, Any, Iterator
+
+READ_SIZE = 64 * 1024
+# Largest single item accepted, so a malformed or endless one cannot pull
+# the whole upload into memory while waiting for it to end
+MAX_ITEM_SIZE = 1024 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\r\n'
+
+
+class InvalidJson:
+    """Stands in for a value that could not be decoded"""
+
+    __slots__ = ('message',)
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+
+def iter_ndjson(stream: IO[bytes]) -> Iterator[Any]:
+    """
+    Decodes one JSON value per line, skipping blank lines. A line that is
+    not valid JSON or longer than `MAX_ITEM_SIZE` yields an `InvalidJson`
+    and the following lines are still read.
+    """
+    while line := stream.readline(MAX_ITEM_SIZE + 1):
+        if len(line) > MAX_ITEM_SIZE and not line.endswith(b'\n'):
+            # Discard the rest of the line a bounded read at a time
+            while line and not line.endswith(b'\n'):
+                line = stream.readline(MAX_ITEM_SIZE + 1)
+            yield InvalidJson(f'Item larger than {MAX_ITEM_SIZE} bytes')
+            continue
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            yield InvalidJson(e.msg)
+        except ValueError as e:
+            yield InvalidJson(str(e))
+
+
+def iter_json_array(
+    stream: IO[bytes], read_size: int = READ_SIZE
+) -> Iterator[Any]:
+    """
+    Decodes the items of a top-level JSON array as they arrive, holding at
+    most one item and one read of the stream in memory. Malformed input
+    yields an `InvalidJson` and ends the iteration, there is no telling
+    where the next item would start.
+    """
+    decoder = _IncrementalDecoder(stream, read_size)
+    try:
+        if not decoder.expect('['):
+            yield InvalidJson('Expected a JSON array')
+            return
+        if decoder.expect(']'):
+            return
+        while True:
+            yield decoder.value()
+            if decoder.expect(']'):
+                return
+            if not decoder.expect(','):
+                yield InvalidJson("Expected ',' or ']' after an array item")
+                return
+    except ValueError as e:
+        yield InvalidJson(str(e))
+
+
+class _IncrementalDecoder:
+    def __init__(self, stream: IO[bytes], read_size: int) -> None:
+        self.stream = stream
+        self.read_size = read_size
+        self.buffer = ''
+        self.position = 0
+        self.exhausted = False
+        # Keeps multi-byte characters split across reads for the next one
+        self.text = codecs.getincrementaldecoder('utf-8')()
+
+    def _read(self) -> bool:
+        if self.exhausted:
+            return False
+        if len(self.buffer) - self.position > MAX_ITEM_SIZE:
+            raise ValueError(f'Item larger than {MAX_ITEM_SIZE} bytes')
+        chunk = self.stream.read(self.read_size)
+        self.exhausted = not chunk
+        try:
+            text = self.text.decode(chunk, final=self.exhausted)
+        except UnicodeDecodeError as e:
+            raise ValueError(str(e)) from e
+        self.buffer = self.buffer[self.position :] + text
+        self.position = 0
+        return not self.exhausted
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            while (
+                self.position < len(self.buffer)
+                and self.buffer[self.position] in _WHITESPACE
+            ):
+                self.position += 1
+            if self.position < len(self.buffer) or not self._read():
+                return
+
+    def expect(self, character: str) -> bool:
+        self._skip_whitespace()
+        if self.buffer[self.position : self.position + 1] == character:
+            self.position += 1
+            return True
+        return False
+
+    def value(self) -> Any:
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as e:
+                # Most likely an item cut by the read size, read more.
+                # Positions are relative to the buffer, leave them out
+                if not self._read():
+                    raise ValueError(e.msg) from e
+                continue
+            # A number or literal ending the buffer may continue in the
+            # next read
+            if end == len(self.buffer) and self._read():
+                continue
+            self.position = end
+            return value
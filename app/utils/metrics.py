@@ -0,0 +1,193 @@
+import hmac
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from flask import Flask, Response, abort, current_app, g, request
+from sqlalchemy import event
+
+from ..extensions import db
+from ..types.error import ApiErrorCodes
+from .exceptions import CustomException
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:  # pragma: no cover - exercised without the extra
+    prometheus_client = None  # type: ignore[assignment]
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+
+
+class RequestMetrics:
+    """
+    Prometheus request metrics labelled by endpoint name. Collectors live
+    in the default registry, which is process wide, so they are created
+    once and shared by every app in the process. Under gunicorn,
+    PROMETHEUS_MULTIPROC_DIR makes each worker write its values to shared
+    memory-mapped files that `/metrics` aggregates.
+    """
+
+    def __init__(self) -> None:
+        self.requests = prometheus_client.Counter(
+            'http_requests_total',
+            'Requests handled, by endpoint, method and status code.',
+            ['endpoint', 'method', 'status'],
+        )
+        self.latency = prometheus_client.Histogram(
+            'http_request_duration_seconds',
+            'Time spent handling requests, by endpoint and method.',
+            ['endpoint', 'method'],
+            buckets=LATENCY_BUCKETS,
+        )
+        self.db_time = prometheus_client.Histogram(
+            'http_request_db_duration_seconds',
+            'Time spent in database statements per request, by endpoint.',
+            ['endpoint'],
+            buckets=DB_BUCKETS,
+        )
+        self.in_flight = prometheus_client.Gauge(
+            'http_requests_in_flight',
+            'Requests being handled, by endpoint.',
+            ['endpoint'],
+            multiprocess_mode='livesum',
+        )
+        # Labelled children, resolved once per endpoint instead of going
+        # through the collectors' locked lookups on every request
+        self._children: Dict[Tuple[str, str], Tuple[Any, Any, Any]] = {}
+
+    def children(self, endpoint: str, method: str) -> Tuple[Any, Any, Any]:
+        key = (endpoint, method)
+        children = self._children.get(key)
+        if children is None:
+            children = self._children[key] = (
+                self.latency.labels(endpoint, method),
+                self.db_time.labels(endpoint),
+                self.in_flight.labels(endpoint),
+            )
+        return children
+
+
+_metrics: Optional[RequestMetrics] = None
+
+
+def endpoint_label() -> str:
+    # Unmatched URLs share one label so scanners cannot grow the series
+    if request.endpoint is None:
+        return 'unmatched'
+    return request.endpoint.removeprefix('api.')
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    context.metrics_start = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    if 'metrics_db_time' in g:
+        g.metrics_db_time += time.perf_counter() - context.metrics_start
+
+
+def _start_request() -> None:
+    if _metrics is None or request.endpoint == 'metrics':
+        return
+    latency, db_time, in_flight = _metrics.children(
+        endpoint_label(), request.method
+    )
+    in_flight.inc()
+    g.metrics_start = time.perf_counter()
+    g.metrics_db_time = 0.0
+
+
+def _finish_request(response: Response) -> Response:
+    start = g.pop('metrics_start', None)
+    if _metrics is None or start is None:
+        return response
+
+    endpoint = endpoint_label()
+    latency, db_time, in_flight = _metrics.children(endpoint, request.method)
+    latency.observe(time.perf_counter() - start)
+    db_time.observe(g.pop('metrics_db_time', 0.0))
+    in_flight.dec()
+    _metrics.requests.labels(
+        endpoint, request.method, str(response.status_code)
+    ).inc()
+    return response
+
+
+def _abort_request(_: Optional[BaseException]) -> None:
+    # Requests whose after_request hooks never ran still leave in-flight
+    if _metrics is not None and g.pop('metrics_start', None) is not None:
+        _, _, in_flight = _metrics.children(endpoint_label(), request.method)
+        in_flight.dec()
+
+
+def authorize_metrics() -> None:
+    """
+    Answers 404 unless METRICS_ENABLED is on and, when METRICS_TOKEN is
+    set, 401 unless the request carries it as a bearer token.
+    """
+    if not current_app.config.get('METRICS_ENABLED'):
+        abort(404)
+    token = current_app.config.get('METRICS_TOKEN')
+    if token and not hmac.compare_digest(
+        request.headers.get('Authorization', '').encode(),
+        f'Bearer {token}'.encode(),
+    ):
+        raise CustomException(ApiErrorCodes.USER_NOT_AUTHENTICATED)
+
+
+def export_metrics() -> Response:
+    authorize_metrics()
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = prometheus_client.CollectorRegistry()
+        # prometheus_client ships no annotations for the multiprocess mode
+        multiprocess.MultiProcessCollector(  # type: ignore[no-untyped-call]
+            registry
+        )
+    else:
+        registry = prometheus_client.REGISTRY
+    return Response(
+        prometheus_client.generate_latest(registry),
+        mimetype=prometheus_client.CONTENT_TYPE_LATEST,
+    )
+
+
+def init_metrics(app: Flask) -> None:
+    """
+    Records request metrics and serves them at `/metrics` when
+    METRICS_ENABLED is on and prometheus_client is installed.
+    """
+    global _metrics
+
+    if not app.config.get('METRICS_ENABLED') or prometheus_client is None:
+        return
+    if _metrics is None:
+        _metrics = RequestMetrics()
+
+    with app.app_context():
+        for engine in db.engines.values():
+            event.listen(
+                engine, 'before_cursor_execute', _before_cursor_execute
+            )
+            event.listen(
+                engine, 'after_cursor_execute', _after_cursor_execute
+            )
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    app.teardown_request(_abort_request)
+    app.add_url_rule('/metrics', 'metrics', export_metrics)
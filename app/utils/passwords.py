@@ -0,0 +1,103 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, TypeVar
+
+from flask import Flask
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from ..types.error import ApiErrorCodes
+from .exceptions import CustomException
+
+T = TypeVar('T')
+
+
+class PasswordHasher:
+    """
+    Hashes and verifies passwords with werkzeug on a dedicated process pool.
+
+    scrypt is CPU-bound and holds the GIL, so hashing inline pins the
+    request worker for its whole duration. With `PASSWORD_HASH_WORKERS`
+    set, each worker process owns a small pool and at most
+    `PASSWORD_HASH_QUEUE` hashes wait on it; beyond that requests fail fast
+    instead of queueing behind a login burst. With 0 workers (development
+    and tests) hashing runs inline.
+    """
+
+    def __init__(self) -> None:
+        self.method = 'scrypt:32768:8:1'
+        self.salt_length = 16
+        self.workers = 0
+        self.timeout = 10.0
+        self._slots = threading.BoundedSemaphore(32)
+        self._executor: Executor | None = None
+        self._pid = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        self.method = app.config.get('PASSWORD_HASH_METHOD', self.method)
+        self.salt_length = app.config.get(
+            'PASSWORD_SALT_LENGTH', self.salt_length
+        )
+        self.workers = app.config.get('PASSWORD_HASH_WORKERS', self.workers)
+        self.timeout = app.config.get('PASSWORD_HASH_TIMEOUT', self.timeout)
+        queue = app.config.get('PASSWORD_HASH_QUEUE', 32)
+        self._slots = threading.BoundedSemaphore(max(queue, self.workers, 1))
+        self.shutdown()
+
+    def hash(self, password: str) -> str:
+        return self._run(
+            generate_password_hash, password, self.method, self.salt_length
+        )
+
+    def verify(self, password_hash: str, password: str) -> bool:
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """
+        Whether `password_hash` was produced with other parameters than
+        the configured `method`, e.g. after the cost was raised.
+        """
+        return password_hash.split('$', 1)[0] != self.method
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None and self._pid == os.getpid():
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> Executor:
+        # Pools do not survive a fork, so each gunicorn worker lazily
+        # starts its own after it has been forked from the master.
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+                self._pid = os.getpid()
+            return self._executor
+
+    def _run(self, function: Callable[..., T], *args: Any) -> T:
+        if self.workers <= 0:
+            return function(*args)
+
+        # A full queue answers at once, waiting for a slot would only move
+        # the queue into the request threads
+        if not self._slots.acquire(blocking=False):
+            raise CustomException(ApiErrorCodes.AUTHENTICATION_UNAVAILABLE)
+        try:
+            future = self._pool().submit(function, *args)
+            try:
+                return future.result(self.timeout)
+            except FutureTimeoutError as e:
+                # Nobody waits for the hash anymore, drop it if it has not
+                # started yet
+                future.cancel()
+                raise CustomException(
+                    ApiErrorCodes.AUTHENTICATION_UNAVAILABLE
+                ) from e
+        finally:
+            self._slots.release()
@@ -0,0 +1,145 @@
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# Upper bounds, in seconds, of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+
+class Histogram:
+    """
+    Cumulative bucketed histogram in the Prometheus layout: each bucket
+    counts the observations less than or equal to its bound.
+    """
+
+    def __init__(self, buckets: Sequence[float] = WAIT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative: Dict[str, int] = {}
+        running = 0
+        for bound, count in zip([*map(str, self.buckets), '+Inf'], counts):
+            running += count
+            cumulative[bound] = running
+        return {'buckets': cumulative, 'sum': total, 'count': running}
+
+
+class PoolMetrics:
+    """
+    Connection pool counters for one engine, fed by SQLAlchemy pool events.
+    Checkout wait times come from `InstrumentedQueuePool`, as no pool event
+    fires before a checkout starts waiting.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.checked_out = 0
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait = Histogram()
+        self.pool: Any = None
+        self._lock = threading.Lock()
+
+    def attach(self, engine: Engine) -> None:
+        self.pool = engine.pool
+        if isinstance(engine.pool, InstrumentedQueuePool):
+            engine.pool.metrics = self
+        event.listen(engine, 'connect', self._on_connect)
+        event.listen(engine, 'checkout', self._on_checkout)
+        event.listen(engine, 'checkin', self._on_checkin)
+        event.listen(engine, 'invalidate', self._on_invalidate)
+
+    def _on_connect(self, *_: Any) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, *_: Any) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+
+    def _on_checkin(self, *_: Any) -> None:
+        with self._lock:
+            self.checked_out -= 1
+
+    def _on_invalidate(self, *_: Any) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        pool = self.pool
+        is_queue = isinstance(pool, QueuePool)
+        with self._lock:
+            return {
+                'name': self.name,
+                'pool': type(pool).__name__,
+                'size': pool.size() if is_queue else None,
+                'checked_out': self.checked_out,
+                'overflow': max(pool.overflow(), 0) if is_queue else None,
+                'checkouts': self.checkouts,
+                'connects': self.connects,
+                'invalidations': self.invalidations,
+                'timeouts': self.timeouts,
+                'wait_seconds': self.wait.snapshot(),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that times how long each checkout waits for a connection,
+    including the time spent opening a new one.
+    """
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self) -> Any:
+        if self.metrics is None:
+            return super()._do_get()
+
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            self.metrics.wait.observe(time.perf_counter() - start)
+        return connection
+
+    def recreate(self) -> QueuePool:
+        # Engine.dispose() swaps in a fresh pool built by this method
+        pool = super().recreate()
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics.pool = pool
+        return pool
+
+
+def pool_metrics(app: Any) -> List[PoolMetrics]:
+    metrics: Dict[str, PoolMetrics] = app.extensions.get('pool_metrics', {})
+    return list(metrics.values())
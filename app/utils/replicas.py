@@ -0,0 +1,217 @@
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from flask import Flask, current_app, has_request_context
+from flask_jwt_extended import get_jwt  # pyright: ignore
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import ORMExecuteState
+from sqlalchemy.sql import Select
+
+from .cache import redis_client, require_shared
+from .exceptions import CustomException
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+# Engines bound under these SQLALCHEMY_BINDS keys serve replica reads
+REPLICA_BIND_PREFIX = 'replica_'
+
+
+class ReplicaSet:
+    """
+    Round-robin over replica engines. A replica whose connection fails is
+    skipped for `retry_after` seconds, then probed with `SELECT 1` before
+    it gets traffic again.
+    """
+
+    def __init__(self, engines: List[Engine], retry_after: float = 30):
+        self.engines = engines
+        self.retry_after = retry_after
+        self._down_until: Dict[Engine, float] = {}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def pick(self) -> Optional[Engine]:
+        for _ in range(len(self.engines)):
+            with self._lock:
+                engine = self.engines[self._next % len(self.engines)]
+                self._next += 1
+                down_until = self._down_until.get(engine)
+            if down_until is None:
+                return engine
+            if down_until <= time.monotonic() and self.probe(engine):
+                return engine
+        return None
+
+    def probe(self, engine: Engine) -> bool:
+        try:
+            with engine.connect() as connection:
+                connection.execute(text('SELECT 1'))
+        except DBAPIError:
+            self.mark_down(engine)
+            return False
+        with self._lock:
+            self._down_until.pop(engine, None)
+        return True
+
+    def mark_down(self, engine: Engine) -> None:
+        with self._lock:
+            self._down_until[engine] = time.monotonic() + self.retry_after
+
+
+class PinStore:
+    """
+    Users whose last commit is recent enough that replicas may not have it.
+    Kept apart from the cache, which may be disabled or evict entries, so
+    a pin lasts exactly `seconds`. Each pin is a key that expires with it.
+    """
+
+    def __init__(self, client: Any, prefix: str = 'filmes:pin:'):
+        self.client = client
+        self.prefix = prefix
+
+    def pin(self, user_id: str, seconds: int) -> None:
+        self.client.set(self.prefix + user_id, b'1', ex=seconds)
+
+    def is_pinned(self, user_id: str) -> bool:
+        return self.client.get(self.prefix + user_id) is not None
+
+
+def create_pin_store(app: Flask) -> PinStore:
+    url = (
+        app.config.get('REPLICA_PIN_REDIS_URL')
+        or app.config.get('CACHE_REDIS_URL')
+        or 'memory://'
+    )
+    # Each worker only honours the pins of other workers through a shared
+    # server
+    if url.startswith('memory://'):
+        require_shared(app, 'REPLICA_PIN_REDIS_URL')
+    return PinStore(redis_client(url))
+
+
+def pin_store() -> PinStore:
+    pins: PinStore = current_app.extensions['replica_pins']
+    return pins
+
+
+def replica_set() -> Optional[ReplicaSet]:
+    replicas: Optional[ReplicaSet] = current_app.extensions.get('replicas')
+    return replicas
+
+
+def _token_subject() -> Optional[str]:
+    if not has_request_context():
+        return None
+    try:
+        subject: Optional[str] = get_jwt().get('sub')
+    except RuntimeError:
+        return None
+    return subject
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads made inside `replica_read` to a replica and
+    everything else to the primary. Once a session has written, and for
+    `REPLICA_PIN_SECONDS` after a user's commit, reads stay on the primary
+    so callers see their own writes despite replication lag.
+    """
+
+    def get_bind(
+        self,
+        mapper: Any | None = None,
+        clause: Any | None = None,
+        bind: Engine | Connection | None = None,
+        **kwargs: Any,
+    ) -> Engine | Connection:
+        if (
+            bind is None
+            and self.info.get('replica_reads')
+            and not self._flushing
+            and (clause is None or isinstance(clause, Select))
+            and not self.reads_from_primary()
+        ):
+            replicas = replica_set()
+            engine = replicas.pick() if replicas else None
+            if engine is not None:
+                self.info['replica'] = engine
+                return engine
+        return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+
+    def reads_from_primary(self) -> bool:
+        if self.info.get('wrote'):
+            return True
+        if 'pinned' not in self.info:
+            user_id = _token_subject()
+            self.info['pinned'] = bool(
+                user_id and pin_store().is_pinned(user_id)
+            )
+        pinned: bool = self.info['pinned']
+        return pinned
+
+
+@event.listens_for(RoutingSession, 'do_orm_execute')
+def _track_statement_writes(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info['wrote'] = True
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _track_flush_writes(session: RoutingSession, _: Any) -> None:
+    session.info['wrote'] = True
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _pin_writer_to_primary(session: RoutingSession) -> None:
+    if not session.info.get('wrote') or replica_set() is None:
+        return
+    user_id = _token_subject()
+    if user_id:
+        pin_store().pin(
+            user_id, current_app.config.get('REPLICA_PIN_SECONDS', 5)
+        )
+
+
+def replica_read(func: F) -> F:
+    """
+    Runs a repository read on a replica when one is configured. If the
+    replica cannot be reached it is taken out of rotation and the read is
+    retried on the primary.
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        session = current_app.extensions['sqlalchemy'].session()
+        if session.info.get('replica_reads') or replica_set() is None:
+            return func(*args, **kwargs)
+
+        session.info['replica_reads'] = True
+        try:
+            return func(*args, **kwargs)
+        except (DBAPIError, CustomException) as e:
+            replica = session.info.get('replica')
+            if replica is None or not _is_unreachable(e):
+                raise
+            replica_set().mark_down(replica)  # type: ignore[union-attr]
+        finally:
+            session.info['replica_reads'] = False
+            session.info.pop('replica', None)
+        return func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _is_unreachable(error: BaseException) -> bool:
+    # Repositories wrap database errors in CustomException
+    if isinstance(error, CustomException):
+        error = error.__cause__  # type: ignore[assignment]
+    if not isinstance(error, DBAPIError):
+        return False
+    # Errors raised while connecting carry no statement, the others are
+    # from queries and would fail on the primary as well
+    return error.connection_invalidated or error.statement is None
@@ -0,0 +1,203 @@
+import hashlib
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator
+
+from flask import Flask, current_app
+
+from .cache import redis_client, require_shared
+
+
+class BloomFilter:
+    """
+    Fixed-size set membership sketch. `in` never misses a key that was
+    added and wrongly reports an absent key with roughly `error_rate`
+    probability while fewer than `capacity` keys are stored.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float = 0.001,
+        keys: Iterable[str] = (),
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(
+            8,
+            math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2),
+        )
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        for key in keys:
+            self.add(key)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        # Double hashing over one digest instead of `hashes` digests
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        step = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hashes):
+            yield (first + i * step) % self.size
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+class RevocationStore(ABC):
+    """
+    Set of revoked token ids. Entries only need to outlive the token they
+    revoke, so each one is dropped once its `expires_at` (epoch seconds,
+    the token's `exp` claim) has passed.
+    """
+
+    @abstractmethod
+    def revoke(self, jti: str, expires_at: int) -> None:
+        ...
+
+    @abstractmethod
+    def is_revoked(self, jti: str) -> bool:
+        ...
+
+    @abstractmethod
+    def claim(self, jti: str, expires_at: int) -> bool:
+        """
+        Revokes `jti` unless it already was, in one atomic step. Only the
+        first caller gets True, so a single-use token is spent once even
+        when concurrent requests all passed `is_revoked`.
+        """
+
+
+class MemoryRevocationStore(RevocationStore):
+    """
+    Per-process store. Lookups go through a bloom filter first, so the
+    common case of a token that was never revoked is answered without
+    taking the lock. Revocations are only seen by the worker that made
+    them; run a single worker or use the redis backend.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._entries: Dict[str, int] = {}
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._lock = threading.Lock()
+
+    def revoke(self, jti: str, expires_at: int) -> None:
+        with self._lock:
+            if len(self._entries) >= self.capacity:
+                self._purge()
+            self._entries[jti] = expires_at
+            self._bloom.add(jti)
+
+    def is_revoked(self, jti: str) -> bool:
+        if jti not in self._bloom:
+            return False
+        with self._lock:
+            expires_at = self._entries.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def claim(self, jti: str, expires_at: int) -> bool:
+        now = time.time()
+        with self._lock:
+            if expires_at <= now or self._entries.get(jti, 0) > now:
+                return False
+            if len(self._entries) >= self.capacity:
+                self._purge()
+            self._entries[jti] = expires_at
+            self._bloom.add(jti)
+        return True
+
+    def _purge(self) -> None:
+        # Bloom filters cannot forget keys, so expired entries are dropped
+        # by rebuilding the filter from the ones still alive
+        now = time.time()
+        self._entries = {
+            jti: expires_at
+            for jti, expires_at in self._entries.items()
+            if expires_at > now
+        }
+        self._bloom = BloomFilter(
+            self.capacity, self.error_rate, self._entries
+        )
+
+
+class RedisRevocationStore(RevocationStore):
+    """
+    Store shared by every worker through a Redis-compatible server. Each
+    revocation is a key that expires with its token, and a check is a
+    single GET.
+    """
+
+    def __init__(self, client: Any, prefix: str = 'filmes:revoked:'):
+        self.client = client
+        self.prefix = prefix
+
+    def revoke(self, jti: str, expires_at: int) -> None:
+        ttl = math.ceil(expires_at - time.time())
+        if ttl > 0:
+            self.client.set(self.prefix + jti, b'1', ex=ttl)
+
+    def is_revoked(self, jti: str) -> bool:
+        return self.client.get(self.prefix + jti) is not None
+
+    def claim(self, jti: str, expires_at: int) -> bool:
+        ttl = math.ceil(expires_at - time.time())
+        if ttl <= 0:
+            return False
+        # SET NX only writes the key if no other request has
+        return bool(self.client.set(self.prefix + jti, b'1', ex=ttl, nx=True))
+
+
+def create_revocation_store(app: Flask) -> RevocationStore:
+    backend = app.config.get('REVOCATION_BACKEND', 'memory')
+
+    if backend == 'memory':
+        require_shared(app, 'REVOCATION_BACKEND=memory')
+        return MemoryRevocationStore(
+            capacity=app.config.get('REVOCATION_BLOOM_CAPACITY', 100_000),
+            error_rate=app.config.get('REVOCATION_BLOOM_ERROR_RATE', 0.001),
+        )
+    if backend == 'redis':
+        url = (
+            app.config.get('REVOCATION_REDIS_URL')
+            or app.config.get('CACHE_REDIS_URL')
+            or 'memory://'
+        )
+        if url.startswith('memory://'):
+            require_shared(app, 'REVOCATION_REDIS_URL')
+        return RedisRevocationStore(redis_client(url))
+    raise ValueError(f'Unknown REVOCATION_BACKEND: {backend}')
+
+
+class RevocationExtension:
+    """
+    Flask extension exposing the revocation store configured for the
+    current app.
+    """
+
+    def init_app(self, app: Flask) -> None:
+        app.extensions['revocations'] = create_revocation_store(app)
+
+    @property
+    def backend(self) -> RevocationStore:
+        backend: RevocationStore = current_app.extensions['revocations']
+        return backend
+
+    def revoke(self, jwt_data: Dict[str, Any]) -> None:
+        self.backend.revoke(jwt_data['jti'], jwt_data['exp'])
+
+    def is_revoked(self, jwt_data: Dict[str, Any]) -> bool:
+        return self.backend.is_revoked(jwt_data['jti'])
+
+    def claim(self, jwt_data: Dict[str, Any]) -> bool:
+        return self.backend.claim(jwt_data['jti'], jwt_data['exp'])
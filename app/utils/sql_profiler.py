@@ -0,0 +1,150 @@
+import json
+import logging
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from flask import Flask, Response, current_app, g, has_request_context, request
+from sqlalchemy import event
+
+from ..extensions import db
+
+logger = logging.getLogger('app.sql')
+
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_NUMBERS = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDERS = re.compile(r'%\(\w+\)s|%s|\$\d+|:\w+|\?')
+_LISTS = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_SPACES = re.compile(r'\s+')
+
+
+class NPlusOneQueryError(AssertionError):
+    pass
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Reduces a statement to its shape: literals and bound parameters become
+    `?` and expanded IN lists collapse to one, so the same query issued
+    for different rows shares a fingerprint.
+    """
+    statement = _STRINGS.sub('?', statement)
+    statement = _NUMBERS.sub('?', statement)
+    statement = _PLACEHOLDERS.sub('?', statement)
+    statement = _LISTS.sub('(?)', statement)
+    return _SPACES.sub(' ', statement).strip()
+
+
+class QueryProfile:
+    __slots__ = ('count', 'duration', 'statements')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[fingerprint(statement)] += 1
+
+    def repeated(self, threshold: int) -> Dict[str, int]:
+        return {
+            statement: count
+            for statement, count in self.statements.items()
+            if count >= threshold
+        }
+
+
+def current_profile() -> Optional[QueryProfile]:
+    if not has_request_context():
+        return None
+    profile: Optional[QueryProfile] = g.get('sql_profile')
+    return profile
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    # Kept on the execution context, which is discarded along with failed
+    # statements that never reach after_cursor_execute
+    context.sql_profiler_start = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    profile = current_profile()
+    if profile is not None:
+        duration = time.perf_counter() - context.sql_profiler_start
+        profile.record(statement, duration)
+
+
+def _start_profile() -> None:
+    g.sql_profile = QueryProfile()
+
+
+def _finish_profile(response: Response) -> Response:
+    profile: Optional[QueryProfile] = g.pop('sql_profile', None)
+    if profile is None:
+        return response
+
+    duration_ms = profile.duration * 1000
+    response.headers.add(
+        'Server-Timing',
+        f'db;dur={duration_ms:.2f};desc="{profile.count} queries"',
+    )
+
+    threshold = current_app.config.get('SQL_PROFILER_N_PLUS_ONE', 5)
+    repeated = profile.repeated(threshold)
+    logger.log(
+        logging.WARNING if repeated else logging.INFO,
+        json.dumps(
+            {
+                'event': 'sql_profile',
+                'method': request.method,
+                'endpoint': request.endpoint,
+                'status': response.status_code,
+                'queries': profile.count,
+                'db_ms': round(duration_ms, 2),
+                'repeated': repeated,
+            }
+        ),
+    )
+    if repeated and current_app.config.get('SQL_PROFILER_RAISE'):
+        statement, count = max(repeated.items(), key=lambda item: item[1])
+        raise NPlusOneQueryError(
+            f'{request.method} {request.path} ran {count} times: {statement}'
+        )
+    return response
+
+
+def init_sql_profiler(app: Flask) -> None:
+    """
+    Records the statements each request runs when SQL_PROFILER is on. The
+    listeners are only installed then, a disabled profiler costs nothing.
+    """
+    if not app.config.get('SQL_PROFILER'):
+        return
+
+    with app.app_context():
+        for engine in db.engines.values():
+            event.listen(
+                engine, 'before_cursor_execute', _before_cursor_execute
+            )
+            event.listen(
+                engine, 'after_cursor_execute', _after_cursor_execute
+            )
+    app.before_request(_start_profile)
+    app.after_request(_finish_profile)
@@ -0,0 +1,16 @@
+"""
+ASGI entry point for uvicorn. The Flask app stays a WSGI app: each request
+runs on a thread from the middleware's pool while the event loop handles
+the sockets.
+
+    uvicorn asgi:app --workers 4
+"""
+from os import environ
+
+from uvicorn.middleware.wsgi import WSGIMiddleware
+
+from main import app as wsgi_app
+
+app = WSGIMiddleware(
+    wsgi_app, workers=int(environ.get('ASGI_THREADS', '8'))
+)
@@ -0,0 +1,171 @@
+"""
+DTO building benchmark for a movie list page with embedded reviews.
+
+Seeds an in-memory SQLite database with 100 movies x 50 reviews and compares
+the previous path (ORM entities eager-loaded with their reviews and authors,
+copied into plain dataclasses) with the current one (movie and review
+column projections, copied into slotted frozen DTOs). Reports time per page
+and the memory allocated while building it.
+
+    uv run python -m benchmarks.bench_dtos [--movies N] [--reviews N]
+"""
+import argparse
+import os
+import timeit
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+os.environ.setdefault('JWT_SECRET_KEY', 'benchmark')
+
+from sqlalchemy.orm import joinedload, selectinload  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.dtos.movie_dto import ListMovieResponseDto  # noqa: E402
+from app.extensions import db  # noqa: E402
+from app.models import Movie, Review, User  # noqa: E402
+from app.repositories import MovieRepository, ReviewRepository  # noqa: E402
+from app.schemas.movie.get_movie_request_schema import (  # noqa: E402
+    GetMovieRequest,
+)
+
+
+@dataclass
+class LegacyReviewDto:
+    id: Optional[int] = None
+    created_at: Optional[str] = None
+    rating: float = 0
+    comment: Optional[str] = None
+    user_name: Optional[str] = None
+
+
+@dataclass
+class LegacyMovieDto:
+    id: str
+    title: str
+    year: int
+    created_at: str | None = None
+    description: str | None = None
+    duration_minutes: int | None = None
+    genre: str | None = None
+    total_reviews: int | None = None
+    average_rating: float | None = None
+    rented_at: str | None = None
+    reviews: List[LegacyReviewDto] = field(default_factory=list)
+
+
+def seed(movies: int, reviews: int) -> None:
+    users = [
+        User(
+            username=f'user{index}',
+            email=f'user{index}@example.com',
+            password='hashed',
+            name=f'Reviewer {index}',
+        )
+        for index in range(reviews)
+    ]
+    db.session.add_all(users)
+    for index in range(movies):
+        movie = Movie(
+            title=f'Movie {index}',
+            year=2000 + index % 25,
+            genre='Drama',
+            duration_minutes=100,
+            description='Uma descrição razoavelmente longa. ' * 4,
+            total_reviews=reviews,
+        )
+        db.session.add(movie)
+        db.session.add_all(
+            Review(user=user, movie=movie, rating=4, comment='Ótimo filme!')
+            for user in users
+        )
+    db.session.commit()
+
+
+def legacy_page(limit: int) -> list[LegacyMovieDto]:
+    movies = (
+        db.session.query(Movie)
+        .options(selectinload(Movie.reviews).joinedload(Review.user))
+        .order_by(Movie.created_at, Movie.id)
+        .limit(limit)
+        .all()
+    )
+    return [
+        LegacyMovieDto(
+            id=movie.id,
+            title=movie.title,
+            year=movie.year,
+            created_at=movie.created_at.isoformat(),
+            description=movie.description,
+            duration_minutes=movie.duration_minutes,
+            genre=movie.genre,
+            total_reviews=movie.total_reviews,
+            average_rating=movie.average_rating,
+            reviews=[
+                LegacyReviewDto(
+                    id=review.id,
+                    created_at=review.created_at.isoformat(),
+                    rating=review.rating,
+                    comment=review.comment,
+                    user_name=review.user.name,
+                )
+                for review in movie.reviews
+            ],
+        )
+        for movie in movies
+    ]
+
+
+def current_page(limit: int) -> ListMovieResponseDto:
+    page = MovieRepository().find_page(
+        GetMovieRequest(limit=limit, view='detail')
+    )
+    reviews = ReviewRepository().find_rows_by_movie_ids(
+        [movie.id for movie in page.items]
+    )
+    return ListMovieResponseDto.from_rows(page.items, reviews)
+
+
+def measure(label: str, build: Callable[[], Any], number: int) -> None:
+    def run() -> Any:
+        try:
+            return build()
+        finally:
+            db.session.expunge_all()
+
+    seconds = min(timeit.repeat(run, number=number, repeat=5)) / number
+
+    tracemalloc.start()
+    page = build()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del page
+    db.session.expunge_all()
+
+    print(
+        f'{label:<8} {seconds * 1000:9.2f} ms/page '
+        f'{peak / 1024:9.0f} KiB peak {retained / 1024:9.0f} KiB retained'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--movies', type=int, default=100)
+    parser.add_argument('--reviews', type=int, default=50)
+    parser.add_argument('--number', type=int, default=5)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        seed(args.movies, args.reviews)
+        db.session.expunge_all()
+
+        print(f'{args.movies} movies x {args.reviews} reviews')
+        measure('legacy', lambda: legacy_page(args.movies), args.number)
+        measure('current', lambda: current_page(args.movies), args.number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Password verification throughput, the CPU cost of one login.
+
+Measures logins/sec for the configured hash method inline on one core and
+through `PasswordHasher`'s process pool, and reports the pool figure per
+core it could use.
+
+    uv run python -m benchmarks.bench_passwords [--workers N] [--logins N]
+        [--method scrypt:32768:8:1]
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from app.utils.passwords import PasswordHasher
+
+
+def logins_per_second(
+    verify: Callable[[], bool], logins: int, threads: int
+) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        assert all(executor.map(lambda _: verify(), range(logins)))
+    return logins / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--method', default='scrypt:32768:8:1')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--logins', type=int, default=64)
+    args = parser.parse_args()
+
+    password_hash = generate_password_hash('Secret123', args.method)
+    print(f'{args.method}, {args.logins} logins')
+
+    inline = logins_per_second(
+        lambda: check_password_hash(password_hash, 'Secret123'),
+        args.logins,
+        threads=1,
+    )
+    print(f'inline     {inline:8.1f} logins/s  {inline:8.1f} per core')
+
+    hasher = PasswordHasher()
+    hasher.method = args.method
+    hasher.workers = args.workers
+    try:
+        hasher.verify(password_hash, 'Secret123')  # start the pool
+        pooled = logins_per_second(
+            lambda: hasher.verify(password_hash, 'Secret123'),
+            args.logins,
+            threads=args.workers * 2,
+        )
+    finally:
+        hasher.shutdown()
+    cores = min(args.workers, os.cpu_count() or 1)
+    print(
+        f'pool({args.workers:>2})   {pooled:8.1f} logins/s  '
+        f'{pooled / cores:8.1f} per core'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Serialization micro-benchmark for a full movie list page.
+
+Compares Flask's stdlib JSON provider, which walks nested DTOs with
+`dataclasses.asdict`, against the orjson provider on a page of 100 movies
+with 50 reviews each. No database is needed.
+
+    uv run python -m benchmarks.bench_serialization [--movies N] [--reviews N]
+"""
+import argparse
+import timeit
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any, Callable, cast
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+
+from app.dtos.movie_dto import ListMovieResponseDto, MovieResponseDto
+from app.dtos.review_dto import ListReviewResponseDto, ReviewDto
+from app.utils.json_provider import OrjsonProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def build_page(movies: int, reviews: int) -> dict[str, Any]:
+    created_at = datetime.now(timezone.utc).isoformat()
+    return {
+        'code': 200,
+        'message': '',
+        'movies': ListMovieResponseDto(
+            data=[
+                MovieResponseDto(
+                    id=f'{index:08d}-0000-4000-8000-000000000000',
+                    title=f'Movie {index}',
+                    year=2000 + index % 25,
+                    created_at=created_at,
+                    description='Uma descrição razoavelmente longa. ' * 4,
+                    duration_minutes=90 + index % 60,
+                    genre='Drama, Sci-Fi',
+                    total_reviews=reviews,
+                    average_rating=4.2,
+                    reviews=ListReviewResponseDto(
+                        data=[
+                            ReviewDto(
+                                id=review,
+                                created_at=created_at,
+                                rating=review % 5 + 1,
+                                comment='Ótimo filme, recomendo!',
+                                user_name=f'Reviewer {review}',
+                            )
+                            for review in range(reviews)
+                        ]
+                    ),
+                )
+                for index in range(movies)
+            ]
+        ),
+    }
+
+
+def render_page(provider: DefaultJSONProvider, page: dict[str, Any]) -> bytes:
+    return cast(Response, provider.response(page)).get_data()
+
+
+def measure(label: str, render: Callable[[], bytes], number: int) -> float:
+    size = len(render())
+    seconds = min(timeit.repeat(render, number=number, repeat=5)) / number
+    print(f'{label:<10} {seconds * 1000:9.2f} ms/page {size / 1024:9.1f} KiB')
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--movies', type=int, default=100)
+    parser.add_argument('--reviews', type=int, default=50)
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    page = build_page(args.movies, args.reviews)
+    providers = {'stdlib': DefaultJSONProvider(app)}
+    if orjson is not None:
+        providers['orjson'] = OrjsonProvider(app)
+
+    print(f'{args.movies} movies x {args.reviews} reviews')
+    with app.app_context():
+        results = {
+            label: measure(
+                label, partial(render_page, provider, page), args.number
+            )
+            for label, provider in providers.items()
+        }
+
+    if 'orjson' in results:
+        print(f"speedup    {results['stdlib'] / results['orjson']:9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Compares two benchmark suite results, typically the same suite run on two
+commits, printing each scenario's metrics side by side with the relative
+change. Latency and query increases, and throughput drops, beyond
+`--threshold` percent are flagged.
+
+    uv run python -m benchmarks.compare benchmarks/results/BASE-client.json
+        benchmarks/results/HEAD-client.json [--threshold 10]
+"""
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Metric and whether a higher value is better
+METRICS = (
+    ('throughput', True),
+    ('p50_ms', False),
+    ('p95_ms', False),
+    ('p99_ms', False),
+    ('queries_per_request', False),
+)
+
+
+def load(path: Path) -> Dict[str, Any]:
+    report: Dict[str, Any] = json.loads(path.read_text())
+    return report
+
+
+def describe(report: Dict[str, Any]) -> str:
+    commit = report.get('commit') or 'unknown'
+    if report.get('dirty'):
+        commit += '-dirty'
+    return f'{commit} on {report["target"]} x{report["concurrency"]}'
+
+
+def change(base: Optional[float], head: Optional[float]) -> Optional[float]:
+    if base is None or head is None or base == 0:
+        return None
+    return (head - base) / base * 100
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('base', type=Path)
+    parser.add_argument('head', type=Path)
+    parser.add_argument('--threshold', type=float, default=10)
+    args = parser.parse_args()
+
+    base, head = load(args.base), load(args.head)
+    print(f'base {describe(base)}\nhead {describe(head)}')
+    for key in ('target', 'concurrency', 'dataset'):
+        if base[key] != head[key]:
+            print(f'{key} differs, results are not comparable')
+
+    regressions = 0
+    for name, head_result in head['scenarios'].items():
+        base_result = base['scenarios'].get(name)
+        if base_result is None:
+            print(f'\n{name}: not in base')
+            continue
+        print(f'\n{name}')
+        for metric, higher_is_better in METRICS:
+            before, after = base_result.get(metric), head_result.get(metric)
+            delta = change(before, after)
+            flag = ''
+            if delta is not None:
+                worse = -delta if higher_is_better else delta
+                if worse > args.threshold:
+                    flag = '  <- regression'
+                    regressions += 1
+            print(
+                f'  {metric:<20} {before!s:>10} -> {after!s:>10}'
+                f'  {"" if delta is None else f"{delta:+.1f}%":>8}{flag}'
+            )
+
+    if regressions:
+        raise SystemExit(f'\n{regressions} metrics regressed')
+
+
+if __name__ == '__main__':
+    main()
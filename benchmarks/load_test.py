@@ -0,0 +1,148 @@
+"""
+HTTP load test against a running server, used to compare server profiles.
+
+Registers a throwaway user, logs in once and then keeps `--concurrency`
+keep-alive connections busy requesting `--path` for `--duration` seconds,
+reporting throughput and latency percentiles. Run the client on another
+machine than the server when possible, otherwise both compete for the same
+cores.
+
+    SERVER_PROFILE=gthread ./entrypoint.sh
+    uv run python -m benchmarks.load_test --url http://localhost:5000
+        [--path /api/movies/] [--concurrency 32] [--duration 30]
+"""
+import argparse
+import http.client
+import json
+import threading
+import time
+import uuid
+from typing import Any, Dict, List
+from urllib.parse import urlsplit
+
+
+def request(
+    connection: http.client.HTTPConnection,
+    method: str,
+    path: str,
+    headers: Dict[str, str],
+    body: Any = None,
+) -> tuple[int, bytes]:
+    payload = json.dumps(body) if body is not None else None
+    if payload is not None:
+        headers = {**headers, 'Content-Type': 'application/json'}
+    connection.request(method, path, body=payload, headers=headers)
+    response = connection.getresponse()
+    return response.status, response.read()
+
+
+def login(host: str, port: int) -> str:
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    suffix = uuid.uuid4().hex[:12]
+    email = f'load-{suffix}@example.com'
+    request(
+        connection,
+        'POST',
+        '/api/register',
+        {},
+        {
+            'username': f'load{suffix}',
+            'name': 'Load Test',
+            'email': email,
+            'password': 'LoadTest123',
+        },
+    )
+    status, body = request(
+        connection,
+        'POST',
+        '/api/login',
+        {},
+        {'email': email, 'password': 'LoadTest123'},
+    )
+    connection.close()
+    if status != 200:
+        raise SystemExit(f'login failed with {status}: {body!r}')
+    token: str = json.loads(body)['access_token']
+    return token
+
+
+def run_client(
+    host: str,
+    port: int,
+    path: str,
+    headers: Dict[str, str],
+    deadline: float,
+    latencies: List[float],
+    errors: List[int],
+) -> None:
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            status, _ = request(connection, 'GET', path, headers)
+        except (OSError, http.client.HTTPException):
+            # A recycled worker closes its keep-alive connections, retry
+            # once on a new one like HTTP client libraries do
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+            try:
+                status, _ = request(connection, 'GET', path, headers)
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection = http.client.HTTPConnection(
+                    host, port, timeout=30
+                )
+                status = 0
+        if status == 200:
+            latencies.append(time.perf_counter() - start)
+        else:
+            errors.append(status)
+    connection.close()
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', default='http://localhost:5000')
+    parser.add_argument('--path', default='/api/movies/')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=30)
+    args = parser.parse_args()
+
+    url = urlsplit(args.url)
+    host, port = url.hostname or 'localhost', url.port or 80
+    headers = {'Authorization': f'Bearer {login(host, port)}'}
+
+    latencies: List[float] = []
+    errors: List[int] = []
+    deadline = time.perf_counter() + args.duration
+    clients = [
+        threading.Thread(
+            target=run_client,
+            args=(host, port, args.path, headers, deadline, latencies, errors),
+        )
+        for _ in range(args.concurrency)
+    ]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+
+    latencies.sort()
+    print(
+        f'{args.path} x{args.concurrency} for {args.duration:.0f}s: '
+        f'{len(latencies) / args.duration:8.1f} req/s, {len(errors)} errors'
+    )
+    if latencies:
+        print(
+            f'latency p50 {percentile(latencies, 0.50) * 1000:7.1f} ms  '
+            f'p90 {percentile(latencies, 0.90) * 1000:7.1f} ms  '
+            f'p99 {percentile(latencies, 0.99) * 1000:7.1f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
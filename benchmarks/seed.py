@@ -0,0 +1,301 @@
+"""
+Benchmark data generator.
+
+Seeds `--movies` movies tagged with one or two genres and `--users` users
+sharing one password. Each user rents `--rentals` movies and reviews the
+first `--reviews` of them, with the movie and genre aggregates kept
+consistent. Rows are generated from `--seed`, so two runs with the same
+arguments produce the same database.
+
+The benchmark suite seeds its own in-memory database when run against the
+Flask test client. To benchmark a server, seed the database it uses and
+pass the written manifest to the suite:
+
+    DATABASE_URL=postgresql://... uv run python -m benchmarks.seed
+        [--movies 2000] [--users 64] [--rentals 20] [--reviews 10]
+        [--output benchmarks/results/dataset.json]
+"""
+import argparse
+import json
+import os
+import random
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, TypedDict
+
+# Long enough for PyJWT not to warn on every token
+os.environ.setdefault('JWT_SECRET_KEY', 'benchmark-key-0123456789abcdefghij')
+
+from sqlalchemy import insert, select, update  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.extensions import db, passwords  # noqa: E402
+from app.models import (  # noqa: E402
+    Genre,
+    Movie,
+    Rental,
+    Review,
+    User,
+    movie_genres,
+)
+from app.utils.genres import genre_slug  # noqa: E402
+
+PASSWORD = 'BenchPass123'
+GENRES = (
+    'Ação',
+    'Animação',
+    'Comédia',
+    'Documentário',
+    'Drama',
+    'Ficção Científica',
+    'Suspense',
+    'Terror',
+)
+ADJECTIVES = (
+    'Silent',
+    'Broken',
+    'Golden',
+    'Hidden',
+    'Last',
+    'Midnight',
+    'Lost',
+    'Crimson',
+)
+NOUNS = (
+    'River',
+    'Empire',
+    'Garden',
+    'Signal',
+    'Harbor',
+    'Witness',
+    'Frontier',
+    'Machine',
+)
+CHUNK_SIZE = 1000
+
+
+class MovieRow(TypedDict):
+    """A seeded movie, kept until its review aggregates are final."""
+
+    id: str
+    title: str
+    year: int
+    genre: str
+    duration_minutes: int
+    description: str
+    total_reviews: int
+    rating_sum: float
+    average_rating: float
+
+
+@dataclass
+class Dataset:
+    """
+    What was seeded, enough for scenarios to pick rows without querying:
+    user `n` logs in as `email(n)` and owns the rentals listed by
+    `rented(n)`, of which `unreviewed(n)` can still be rated.
+    """
+
+    movie_ids: List[str]
+    users: int
+    rentals: int
+    reviews: int
+    search_terms: List[str]
+    password: str = PASSWORD
+
+    def email(self, user: int) -> str:
+        return f'bench{user}@example.com'
+
+    def rented(self, user: int) -> List[str]:
+        start = user * self.rentals
+        return [
+            self.movie_ids[(start + offset) % len(self.movie_ids)]
+            for offset in range(self.rentals)
+        ]
+
+    def unreviewed(self, user: int) -> List[str]:
+        return self.rented(user)[self.reviews :]
+
+    def unrented(self, user: int) -> List[str]:
+        start = user * self.rentals + self.rentals
+        return [
+            self.movie_ids[(start + offset) % len(self.movie_ids)]
+            for offset in range(len(self.movie_ids) - self.rentals)
+        ]
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            'movies': len(self.movie_ids),
+            'users': self.users,
+            'rentals': self.users * self.rentals,
+            'reviews': self.users * self.reviews,
+        }
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(asdict(self)))
+
+    @classmethod
+    def load(cls, path: Path) -> 'Dataset':
+        return cls(**json.loads(path.read_text()))
+
+
+def chunks(
+    rows: Iterable[Mapping[str, Any]]
+) -> Iterator[List[Mapping[str, Any]]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, CHUNK_SIZE)):
+        yield chunk
+
+
+def insert_rows(table: Any, rows: Iterable[Mapping[str, Any]]) -> None:
+    for chunk in chunks(rows):
+        db.session.execute(insert(table), chunk)
+
+
+def seed(
+    movies: int, users: int, rentals: int, reviews: int, seed: int = 0
+) -> Dataset:
+    """
+    Inserts the dataset into the current app's database, which must not
+    hold any movies yet. Runs inside an application context.
+    """
+    if rentals > movies:
+        raise ValueError('rentals per user cannot exceed the movies')
+    if reviews > rentals:
+        raise ValueError('reviews per user cannot exceed their rentals')
+    if db.session.scalar(select(Movie.id).limit(1)) is not None:
+        raise ValueError('the database already has movies')
+
+    rng = random.Random(seed)
+
+    def new_id() -> str:
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+    genre_ids = {
+        name: db.session.scalar(
+            insert(Genre)
+            .values(name=name, slug=genre_slug(name), movie_count=0)
+            .returning(Genre.id)
+        )
+        for name in GENRES
+    }
+    genre_counts = dict.fromkeys(GENRES, 0)
+
+    movie_rows: List[MovieRow] = []
+    tag_rows: List[Dict[str, Any]] = []
+    for index in range(movies):
+        tags = rng.sample(GENRES, rng.randint(1, 2))
+        movie: MovieRow = {
+            'id': new_id(),
+            'title': f'{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {index}',
+            'year': rng.randint(1950, 2024),
+            'genre': ', '.join(tags),
+            'duration_minutes': rng.randint(80, 180),
+            'description': 'Filme gerado para o benchmark. ' * 3,
+            'total_reviews': 0,
+            'rating_sum': 0.0,
+            'average_rating': 0.0,
+        }
+        movie_rows.append(movie)
+        for tag in tags:
+            genre_counts[tag] += 1
+            tag_rows.append(
+                {'movie_id': movie['id'], 'genre_id': genre_ids[tag]}
+            )
+
+    dataset = Dataset(
+        movie_ids=[movie['id'] for movie in movie_rows],
+        users=users,
+        rentals=rentals,
+        reviews=reviews,
+        search_terms=[noun.lower() for noun in NOUNS],
+    )
+
+    password = passwords.hash(PASSWORD)
+    user_ids = [new_id() for _ in range(users)]
+    movies_by_id = {movie['id']: movie for movie in movie_rows}
+    rented_at = datetime.now(timezone.utc)
+    rental_rows, review_rows = [], []
+    for user, user_id in enumerate(user_ids):
+        for position, movie_id in enumerate(dataset.rented(user)):
+            rental_rows.append(
+                {
+                    'id': new_id(),
+                    'user_id': user_id,
+                    'movie_id': movie_id,
+                    'rented_at': rented_at,
+                    'expires_at': rented_at + timedelta(days=7),
+                }
+            )
+            if position >= reviews:
+                continue
+            rating = rng.randint(1, 10)
+            review_rows.append(
+                {
+                    'user_id': user_id,
+                    'movie_id': movie_id,
+                    'rating': rating,
+                    'comment': 'Avaliação gerada para o benchmark.',
+                }
+            )
+            movie = movies_by_id[movie_id]
+            movie['total_reviews'] += 1
+            movie['rating_sum'] += rating
+            movie['average_rating'] = (
+                movie['rating_sum'] / movie['total_reviews']
+            )
+
+    insert_rows(Movie, movie_rows)
+    insert_rows(movie_genres, tag_rows)
+    for name, count in genre_counts.items():
+        db.session.execute(
+            update(Genre)
+            .where(Genre.id == genre_ids[name])
+            .values(movie_count=count)
+        )
+    insert_rows(
+        User,
+        (
+            {
+                'id': user_id,
+                'username': f'bench{user}',
+                'email': dataset.email(user),
+                'password': password,
+                'name': f'Bench User {user}',
+            }
+            for user, user_id in enumerate(user_ids)
+        ),
+    )
+    insert_rows(Rental, rental_rows)
+    insert_rows(Review, review_rows)
+    db.session.commit()
+    return dataset
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--movies', type=int, default=2000)
+    parser.add_argument('--users', type=int, default=64)
+    parser.add_argument('--rentals', type=int, default=20)
+    parser.add_argument('--reviews', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--output', type=Path, default=Path('benchmarks/results/dataset.json')
+    )
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        dataset = seed(
+            args.movies, args.users, args.rentals, args.reviews, args.seed
+        )
+    dataset.save(args.output)
+    print(f'seeded {dataset.counts()}, manifest written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
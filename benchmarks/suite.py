@@ -0,0 +1,428 @@
+"""
+API benchmark suite.
+
+Runs the list, search, detail, rent, rate and login scenarios and reports
+throughput, p50/p95/p99 latency and database queries per request for each,
+writing the results as JSON so runs can be compared across commits with
+`benchmarks.compare`.
+
+Without `--url` the requests go through the Flask test client, one at a
+time, against an in-memory database (or DATABASE_URL, when set) seeded by
+`benchmarks.seed`. That measures the application without a server or
+network in the way. With `--url` they are sent by `--concurrency`
+keep-alive connections to a running server whose database was seeded
+beforehand. Query counts are read
+from the Server-Timing header, so start the server with SQL_PROFILER=true.
+
+    uv run python -m benchmarks.suite [--requests 200]
+        [--scenarios list,search,detail,rent,rate,login]
+
+    SQL_PROFILER=true SERVER_PROFILE=gthread ./entrypoint.sh
+    uv run python -m benchmarks.suite --url http://localhost:5000
+        --dataset benchmarks/results/dataset.json [--concurrency 16]
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import re
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+from urllib.parse import urlsplit
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+# Long enough for PyJWT not to warn on every token
+os.environ.setdefault('JWT_SECRET_KEY', 'benchmark-key-0123456789abcdefghij')
+os.environ.setdefault('SQL_PROFILER', 'true')
+
+from benchmarks.seed import Dataset, seed  # noqa: E402
+
+SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+RESULTS_DIR = Path('benchmarks/results')
+
+Headers = Dict[str, str]
+Body = Optional[Dict[str, Any]]
+
+
+class Transport(Protocol):
+    def send(
+        self, method: str, path: str, headers: Headers, body: Body
+    ) -> Tuple[int, Optional[str], Any]:
+        """Returns the status, the Server-Timing header and the JSON body"""
+
+
+class ClientTransport:
+    def __init__(self, app: Any) -> None:
+        self.client = app.test_client()
+
+    def send(
+        self, method: str, path: str, headers: Headers, body: Body
+    ) -> Tuple[int, Optional[str], Any]:
+        response = self.client.open(
+            path, method=method, headers=headers, json=body
+        )
+        return (
+            response.status_code,
+            response.headers.get('Server-Timing'),
+            response.get_json(silent=True),
+        )
+
+
+class HttpTransport:
+    def __init__(self, host: str, port: int) -> None:
+        self.host, self.port = host, port
+        self.connection = self._connect()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        return http.client.HTTPConnection(self.host, self.port, timeout=30)
+
+    def send(
+        self, method: str, path: str, headers: Headers, body: Body
+    ) -> Tuple[int, Optional[str], Any]:
+        payload = json.dumps(body) if body is not None else None
+        if payload is not None:
+            headers = {**headers, 'Content-Type': 'application/json'}
+        try:
+            return self._send(method, path, headers, payload)
+        except (OSError, http.client.HTTPException):
+            # A recycled worker closes its keep-alive connections, retry
+            # once on a new one like HTTP client libraries do
+            self.connection.close()
+            self.connection = self._connect()
+            return self._send(method, path, headers, payload)
+
+    def _send(
+        self, method: str, path: str, headers: Headers, payload: Any
+    ) -> Tuple[int, Optional[str], Any]:
+        self.connection.request(method, path, body=payload, headers=headers)
+        response = self.connection.getresponse()
+        content = response.read()
+        try:
+            data = json.loads(content)
+        except ValueError:
+            data = None
+        return response.status, response.getheader('Server-Timing'), data
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+@dataclass
+class Worker:
+    """One simulated client, logged in as its own seeded user"""
+
+    user: int
+    dataset: Dataset
+    transport: Transport
+    token: str = ''
+    unrented: List[str] = field(init=False)
+    unreviewed: List[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.unrented = self.dataset.unrented(self.user)
+        self.unreviewed = self.dataset.unreviewed(self.user)
+
+    def login(self) -> None:
+        status, _, data = self.transport.send(
+            'POST', '/api/login', {}, self.credentials()
+        )
+        if status != 200:
+            raise SystemExit(f'login failed with {status}: {data!r}')
+        self.token = data['access_token']
+
+    def credentials(self) -> Dict[str, str]:
+        return {
+            'email': self.dataset.email(self.user),
+            'password': self.dataset.password,
+        }
+
+    def headers(self) -> Headers:
+        return {'Authorization': f'Bearer {self.token}'}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    A request repeated by every worker. `build` returns the path and body
+    of the worker's n-th request, `capacity` bounds how many it can make
+    when each one consumes seeded state, as renting and rating do.
+    """
+
+    name: str
+    method: str
+    build: Callable[[Worker, int], Tuple[str, Body]]
+    authenticated: bool = True
+    capacity: Optional[Callable[[Worker], int]] = None
+
+
+def movie_at(worker: Worker, index: int) -> str:
+    movie_ids = worker.dataset.movie_ids
+    return movie_ids[(worker.user * 7919 + index) % len(movie_ids)]
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            'list',
+            'GET',
+            lambda worker, index: (
+                f'/api/movies/?limit=20&page={index % 5 + 1}',
+                None,
+            ),
+        ),
+        Scenario(
+            'search',
+            'GET',
+            lambda worker, index: (
+                '/api/movies/?limit=20&search='
+                + worker.dataset.search_terms[
+                    index % len(worker.dataset.search_terms)
+                ],
+                None,
+            ),
+        ),
+        Scenario(
+            'detail',
+            'GET',
+            lambda worker, index: (
+                f'/api/movies/{movie_at(worker, index)}',
+                None,
+            ),
+        ),
+        Scenario(
+            'rent',
+            'POST',
+            lambda worker, index: (
+                f'/api/movies/{worker.unrented[index]}/rent',
+                None,
+            ),
+            capacity=lambda worker: len(worker.unrented),
+        ),
+        Scenario(
+            'rate',
+            'POST',
+            lambda worker, index: (
+                f'/api/movies/{worker.unreviewed[index]}/rate',
+                {'rating': index % 10 + 1, 'comment': 'Benchmark'},
+            ),
+            capacity=lambda worker: len(worker.unreviewed),
+        ),
+        Scenario(
+            'login',
+            'POST',
+            lambda worker, index: ('/api/login', worker.credentials()),
+            authenticated=False,
+        ),
+    )
+}
+
+
+@dataclass
+class Samples:
+    latencies: List[float] = field(default_factory=list)
+    queries: List[int] = field(default_factory=list)
+    errors: Dict[str, int] = field(default_factory=dict)
+
+    def record(
+        self, status: int, server_timing: Optional[str], seconds: float
+    ) -> None:
+        if status != 200:
+            self.errors[str(status)] = self.errors.get(str(status), 0) + 1
+            return
+        self.latencies.append(seconds)
+        match = SERVER_TIMING_QUERIES.search(server_timing or '')
+        if match:
+            self.queries.append(int(match.group(1)))
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def run_worker(
+    scenario: Scenario, worker: Worker, requests: int, samples: Samples
+) -> None:
+    if scenario.capacity is not None:
+        requests = min(requests, scenario.capacity(worker))
+    headers = worker.headers() if scenario.authenticated else {}
+    for index in range(requests):
+        path, body = scenario.build(worker, index)
+        start = time.perf_counter()
+        try:
+            status, server_timing, _ = worker.transport.send(
+                scenario.method, path, headers, body
+            )
+        except (OSError, http.client.HTTPException):
+            status, server_timing = 0, None
+        samples.record(status, server_timing, time.perf_counter() - start)
+
+
+def run_scenario(
+    scenario: Scenario, workers: List[Worker], requests: int
+) -> Dict[str, Any]:
+    per_worker = max(1, requests // len(workers))
+    samples = [Samples() for _ in workers]
+    threads = [
+        threading.Thread(
+            target=run_worker,
+            args=(scenario, worker, per_worker, worker_samples),
+        )
+        for worker, worker_samples in zip(workers, samples)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(
+        latency for sample in samples for latency in sample.latencies
+    )
+    queries = [count for sample in samples for count in sample.queries]
+    errors: Dict[str, int] = {}
+    for sample in samples:
+        for status, count in sample.errors.items():
+            errors[status] = errors.get(status, 0) + count
+
+    result: Dict[str, Any] = {
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput': round(len(latencies) / elapsed, 1),
+        'queries_per_request': (
+            round(sum(queries) / len(queries), 2) if queries else None
+        ),
+    }
+    for name, fraction in (('p50', 0.50), ('p95', 0.95), ('p99', 0.99)):
+        result[f'{name}_ms'] = (
+            round(percentile(latencies, fraction) * 1000, 2)
+            if latencies
+            else None
+        )
+    return result
+
+
+def git_revision() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(
+                ['git', 'status', '--porcelain', '--untracked-files=no'],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'dirty': None}
+    return {'commit': commit, 'dirty': dirty}
+
+
+def in_process_workers(args: argparse.Namespace) -> List[Worker]:
+    from app import create_app
+    from app.extensions import db
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        dataset = seed(
+            args.movies, args.users, args.rentals, args.reviews, args.seed
+        )
+    # The test client shares one in-memory connection, so requests are
+    # made one at a time
+    return [Worker(0, dataset, ClientTransport(app))]
+
+
+def http_workers(args: argparse.Namespace) -> List[Worker]:
+    if args.dataset is None:
+        raise SystemExit('--url needs the --dataset written by seeding')
+    dataset = Dataset.load(args.dataset)
+    if args.concurrency > dataset.users:
+        raise SystemExit(
+            f'--concurrency {args.concurrency} needs as many seeded users, '
+            f'the dataset has {dataset.users}'
+        )
+    url = urlsplit(args.url)
+    host, port = url.hostname or 'localhost', url.port or 80
+    return [
+        Worker(user, dataset, HttpTransport(host, port))
+        for user in range(args.concurrency)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('--url')
+    parser.add_argument('--dataset', type=Path)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument(
+        '--requests', type=int, default=200, help='requests per scenario'
+    )
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--movies', type=int, default=2000)
+    parser.add_argument('--users', type=int, default=64)
+    parser.add_argument('--rentals', type=int, default=20)
+    parser.add_argument('--reviews', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path)
+    args = parser.parse_args()
+
+    names = args.scenarios.split(',')
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f'unknown scenarios: {", ".join(sorted(unknown))}')
+
+    workers = http_workers(args) if args.url else in_process_workers(args)
+    for worker in workers:
+        worker.login()
+
+    report: Dict[str, Any] = {
+        **git_revision(),
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'target': args.url or 'test-client',
+        'concurrency': len(workers),
+        'dataset': workers[0].dataset.counts(),
+        'scenarios': {},
+    }
+    for name in names:
+        result = run_scenario(SCENARIOS[name], workers, args.requests)
+        report['scenarios'][name] = result
+        print(
+            f'{name:<8} {result["throughput"]:8.1f} req/s  '
+            f'p50 {result["p50_ms"]} ms  p95 {result["p95_ms"]} ms  '
+            f'p99 {result["p99_ms"]} ms  '
+            f'{result["queries_per_request"]} queries/req  '
+            f'errors {result["errors"] or 0}'
+        )
+
+    for worker in workers:
+        if isinstance(worker.transport, HttpTransport):
+            worker.transport.close()
+
+    output = args.output or RESULTS_DIR / (
+        f'{report["commit"] or "unknown"}'
+        f'{"-dirty" if report["dirty"] else ""}'
+        f'-{"http" if args.url else "client"}.json'
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f'results written to {output}')
+
+
+if __name__ == '__main__':
+    main()
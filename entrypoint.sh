@@ -3,4 +3,20 @@ echo "Aguardando o banco de dados..."
 
 uv run flask db upgrade
 
-exec uv run gunicorn main:app -b 0.0.0.0:5000
+# Worker metric files from a previous run would be summed into this one
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
+if [ "$SERVER_PROFILE" = "asgi" ]; then
+    workers="${WEB_CONCURRENCY:-$(nproc)}"
+    # uvicorn only replaces recycled workers when it supervises several
+    [ "$workers" -lt 2 ] && workers=2
+    exec uv run uvicorn asgi:app --host 0.0.0.0 --port 5000 \
+        --workers "$workers" \
+        --limit-max-requests "${GUNICORN_MAX_REQUESTS:-1000}" \
+        --timeout-keep-alive 5
+fi
+
+exec uv run gunicorn -c gunicorn_config.py
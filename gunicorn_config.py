@@ -0,0 +1,112 @@
+"""
+Gunicorn settings, picked by the SERVER_PROFILE environment variable.
+
+- sync: one request at a time per process, 2 * cores + 1 processes. The
+  safest choice when requests are CPU bound.
+- gthread (default): cores + 1 processes with GUNICORN_THREADS threads
+  each. Requests mostly wait on PostgreSQL, so threads overlap that wait
+  at a fraction of the memory of extra processes.
+- gevent: one process per core serving up to GUNICORN_CONNECTIONS
+  greenlets, for many slow or idle clients. Needs `uv sync --extra
+  gevent`. Concurrency is still capped by the SQLAlchemy pool.
+
+WEB_CONCURRENCY overrides the process count of every profile. The ASGI
+profile is served by uvicorn instead, see asgi.py and entrypoint.sh.
+"""
+import multiprocessing
+import os
+from typing import Any, Dict
+
+_cores = multiprocessing.cpu_count()
+
+_PROFILES: Dict[str, Dict[str, Any]] = {
+    'sync': {
+        'worker_class': 'sync',
+        'workers': 2 * _cores + 1,
+        'threads': 1,
+        'preload_app': True,
+    },
+    'gthread': {
+        'worker_class': 'gthread',
+        'workers': _cores + 1,
+        'threads': int(os.getenv('GUNICORN_THREADS', '4')),
+        'preload_app': True,
+    },
+    'gevent': {
+        'worker_class': 'gevent',
+        'workers': _cores,
+        'threads': 1,
+        # gevent patches the standard library when the worker starts, so
+        # the app must be imported after that and not in the master
+        'preload_app': False,
+    },
+}
+
+_profile_name = os.getenv('SERVER_PROFILE', 'gthread')
+if _profile_name not in _PROFILES:
+    raise ValueError(f'Unknown SERVER_PROFILE: {_profile_name}')
+_profile = _PROFILES[_profile_name]
+
+wsgi_app = 'main:app'
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+worker_class = _profile['worker_class']
+workers = int(os.getenv('WEB_CONCURRENCY', _profile['workers']))
+threads = _profile['threads']
+worker_connections = int(os.getenv('GUNICORN_CONNECTIONS', '100'))
+
+# Loading the app once in the master lets workers share its memory pages
+# copy-on-write instead of each importing everything again
+preload_app = _profile['preload_app']
+
+# Recycle workers now and then so slow leaks cannot pile up, jittered so
+# they do not all restart at once
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = 30
+keepalive = 5
+
+# Heartbeat files on tmpfs, a disk-backed /tmp can stall workers in Docker
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+accesslog = os.getenv('GUNICORN_ACCESS_LOG')
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    if not server.cfg.preload_app:
+        return
+
+    from app.extensions import db
+    from main import app
+
+    # Connections opened by the master while preloading must not be
+    # shared between processes, each worker opens its own
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def post_worker_init(worker: Any) -> None:
+    if worker.cfg.worker_class_str != 'gevent':
+        return
+
+    try:
+        from psycogreen.gevent import patch_psycopg  # pyright: ignore
+    except ImportError:
+        return
+    # psycopg2 blocks the whole process on queries unless told to yield
+    patch_psycopg()
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return
+
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    # Drops the dead worker's in-flight gauge, its counters are kept.
+    # prometheus_client ships no annotations for the multiprocess mode.
+    multiprocess.mark_process_dead(worker.pid)  # type: ignore[no-untyped-call]
@@ -100,6 +100,13 @@ def run_migrations_online():
     connectable = get_engine()
 
     with connectable.connect() as connection:
+        # The application turns SQLite foreign keys on for every connection.
+        # Batch migrations rebuild tables by copying and dropping them,
+        # which fails while the constraints are enforced.
+        if connection.dialect.name == 'sqlite':
+            connection.exec_driver_sql('PRAGMA foreign_keys=OFF')
+            connection.commit()
+
         context.configure(
             connection=connection, target_metadata=get_metadata(), **conf_args
         )
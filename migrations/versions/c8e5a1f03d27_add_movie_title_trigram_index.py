@@ -0,0 +1,39 @@
+"""add movie title trigram index
+
+Revision ID: c8e5a1f03d27
+Revises: b41d7e2a9c53
+Create Date: 2026-10-18 10:02:47.118530
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8e5a1f03d27'
+down_revision = 'b41d7e2a9c53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # pg_trgm lets `title ILIKE '%term%'` use a GIN index and provides
+    # `similarity()` for ranking. Other dialects keep the plain scan.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_movies_title_trgm',
+        'movies',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_movies_title_trgm', table_name='movies')
@@ -1,12 +1,22 @@
-from typing import Any, Dict, Generator
+from typing import Any, Callable, Dict, Generator, List
 import pytest
 from flask import Flask
 from flask.testing import FlaskClient
 from werkzeug.datastructures import Headers
 
 from app import create_app
+from app.config import config
 from app.extensions import db
 
+
+@pytest.fixture(autouse=True)
+def sql_profiler(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Every request made by the suite fails if it repeats a statement the
+    # way an N+1 lazy load does.
+    monkeypatch.setattr(config['development'], 'SQL_PROFILER', True)
+    monkeypatch.setattr(config['development'], 'SQL_PROFILER_RAISE', True)
+
+
 @pytest.fixture
 def app() -> Generator[Flask]:
     app = create_app()
@@ -19,6 +29,38 @@ def app() -> Generator[Flask]:
         yield app
         db.drop_all()
 
+
+@pytest.fixture
+def make_app(monkeypatch: pytest.MonkeyPatch) -> Generator[Callable[..., Flask]]:
+    """
+    Builds apps on their own database, `make_app(uri, **overrides)`. Engines
+    are created by create_app, so the URI and the overridden settings are
+    patched on the config beforehand. Each app's context stays pushed with
+    its tables created until the test ends.
+    """
+    contexts: List[Any] = []
+
+    def make(uri: str, **overrides: Any) -> Flask:
+        monkeypatch.setattr(config['development'], 'SQLALCHEMY_DATABASE_URI', uri)
+        for name, value in overrides.items():
+            monkeypatch.setattr(config['development'], name, value)
+        app = create_app()
+        app.config['TESTING'] = True
+        context = app.app_context()
+        context.push()
+        contexts.append(context)
+        db.create_all()
+        return app
+
+    yield make
+
+    for context in reversed(contexts):
+        db.session.rollback()
+        db.session.remove()
+        db.drop_all()
+        context.pop()
+
+
 @pytest.fixture
 def client(app: Flask) -> FlaskClient:
     return app.test_client()
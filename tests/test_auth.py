@@ -1,4 +1,20 @@
+import time
+from typing import Any, List
+
+import pytest
+from flask import Flask
 from flask.testing import FlaskClient
+from flask_jwt_extended import decode_token
+from sqlalchemy import event
+from werkzeug.datastructures import Headers
+from werkzeug.security import generate_password_hash
+
+from app import create_app
+from app.config import config
+from app.extensions import db, passwords
+from app.models import User
+from app.utils.exceptions import CustomException
+from app.utils.passwords import PasswordHasher
 
 
 class TestAuthController:
@@ -80,3 +96,191 @@ class TestAuthController:
         print(response.json)
         assert response.status_code == 404
         assert response.json['message'] == "Usuário não encontrado"
+
+    def test_login_rehashes_outdated_password(self, app: Flask, client: FlaskClient):
+        """Test logging in upgrades a hash made with other cost parameters"""
+        old_hash = generate_password_hash("OldPass123", method="pbkdf2:sha256:1000")
+        db.session.add(User(username="legacy", name="Legacy", email="legacy@example.com", password=old_hash))
+        db.session.commit()
+
+        response = client.post('/api/login', json={"email": "legacy@example.com", "password": "OldPass123"})
+        assert response.status_code == 200
+
+        db.session.expire_all()
+        user = db.session.query(User).filter_by(email="legacy@example.com").one()
+        assert user.password.startswith(passwords.method + "$")
+        assert passwords.verify(user.password, "OldPass123")
+
+        again = client.post('/api/login', json={"email": "legacy@example.com", "password": "OldPass123"})
+        assert again.status_code == 200
+
+    def test_login_token_claims(self, app: Flask, client: FlaskClient, auth_headers: Headers):
+        """Test access tokens carry the user's name, role and token version"""
+        token = auth_headers['Authorization'].split()[1]
+        claims = decode_token(token)
+
+        assert claims['name'] == "Test User"
+        assert claims['is_admin'] is False
+        assert claims['ver'] == 0
+
+    def test_token_version_bump_revokes_tokens(self, app: Flask, client: FlaskClient, auth_headers: Headers):
+        """Test tokens issued before a token version bump are rejected"""
+        assert client.get('/api/movies/', headers=auth_headers).status_code == 200
+
+        user = db.session.query(User).filter_by(email="test@example.com").one()
+        user.token_version += 1
+        db.session.commit()
+        app.extensions['user_cache'].clear()
+
+        assert client.get('/api/movies/', headers=auth_headers).status_code == 401
+
+    def test_authenticated_requests_skip_user_lookup(self, app: Flask, client: FlaskClient, auth_headers: Headers):
+        """Test the token's user is served from the identity cache"""
+        statements: List[str] = []
+
+        def before_cursor_execute(*args: Any) -> None:
+            statements.append(args[2])
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            response = client.get('/api/movies/?rented=true', headers=auth_headers)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+        assert response.status_code == 200
+        assert not any('FROM users' in statement for statement in statements)
+
+
+class TestPasswordHasher:
+    def test_hashes_on_process_pool(self):
+        """Test hashing and verifying through the worker pool"""
+        hasher = PasswordHasher()
+        hasher.method = "pbkdf2:sha256:1000"
+        hasher.workers = 1
+        try:
+            password_hash = hasher.hash("Secret123")
+
+            assert password_hash.startswith("pbkdf2:sha256:1000$")
+            assert hasher.verify(password_hash, "Secret123")
+            assert not hasher.verify(password_hash, "Wrong123")
+            assert not hasher.needs_rehash(password_hash)
+        finally:
+            hasher.shutdown()
+
+    def test_rejects_when_queue_is_full(self, app: Flask):
+        """Test hashing fails at once, without waiting, when every slot is taken"""
+        hasher = PasswordHasher()
+        hasher.workers = 1
+        taken = 0
+        while hasher._slots.acquire(blocking=False):
+            taken += 1
+        try:
+            started = time.monotonic()
+            with pytest.raises(CustomException) as error:
+                hasher.hash("Secret123")
+
+            assert error.value.code == 503
+            assert time.monotonic() - started < hasher.timeout
+            assert taken == 32
+            assert hasher._executor is None
+        finally:
+            for _ in range(taken):
+                hasher._slots.release()
+            hasher.shutdown()
+
+
+def login(client: FlaskClient) -> Any:
+    client.post('/api/register', json={
+        "username": "refreshuser",
+        "name": "Refresh User",
+        "email": "refresh@example.com",
+        "password": "RefreshPass123"
+    })
+    response = client.post('/api/login', json={
+        "email": "refresh@example.com",
+        "password": "RefreshPass123"
+    })
+    assert response.status_code == 200
+    return response.json
+
+
+def bearer(token: str) -> Headers:
+    headers = Headers()
+    headers.add('Authorization', f'Bearer {token}')
+    return headers
+
+
+class TestTokenRefresh:
+    def test_login_issues_refresh_token(self, app: Flask, client: FlaskClient):
+        """Test login returns a refresh token carrying the identity claims"""
+        tokens = login(client)
+        claims = decode_token(tokens['refresh_token'])
+
+        assert claims['type'] == 'refresh'
+        assert claims['name'] == "Refresh User"
+        assert claims['ver'] == 0
+
+    def test_refresh_rotates_tokens(self, app: Flask, client: FlaskClient):
+        """Test a refresh token yields a new pair and cannot be replayed"""
+        tokens = login(client)
+
+        response = client.post('/api/refresh', headers=bearer(tokens['refresh_token']))
+        assert response.json
+        assert response.status_code == 200
+        assert response.json['refresh_token'] != tokens['refresh_token']
+        assert client.get('/api/movies/', headers=bearer(response.json['access_token'])).status_code == 200
+
+        replay = client.post('/api/refresh', headers=bearer(tokens['refresh_token']))
+        assert replay.status_code == 401
+
+    def test_refresh_race_is_treated_as_reuse(self, app: Flask, client: FlaskClient, monkeypatch: pytest.MonkeyPatch):
+        """Test a replay that slips past the revocation check still fails"""
+        tokens = login(client)
+        # Both requests check the token before either has revoked it
+        store = app.extensions['revocations']
+        monkeypatch.setattr(store, 'is_revoked', lambda jti: False)
+
+        first = client.post('/api/refresh', headers=bearer(tokens['refresh_token']))
+        second = client.post('/api/refresh', headers=bearer(tokens['refresh_token']))
+
+        assert first.status_code == 200
+        assert second.status_code == 401
+
+    def test_refresh_rejects_access_tokens(self, app: Flask, client: FlaskClient):
+        """Test access tokens cannot be exchanged for new tokens"""
+        tokens = login(client)
+
+        response = client.post('/api/refresh', headers=bearer(tokens['access_token']))
+
+        assert response.status_code == 422
+
+    def test_logout_revokes_token(self, app: Flask, client: FlaskClient):
+        """Test a revoked access token is rejected"""
+        tokens = login(client)
+        headers = bearer(tokens['access_token'])
+
+        response = client.post('/api/logout', headers=headers)
+        assert response.json
+        assert response.status_code == 200
+        assert response.json['message'] == "Token revogado com sucesso"
+
+        assert client.get('/api/movies/', headers=headers).status_code == 401
+        # Tokens from other sessions keep working
+        other = client.post('/api/refresh', headers=bearer(tokens['refresh_token']))
+        assert other.status_code == 200
+
+    def test_redis_revocation_backend(self, monkeypatch: pytest.MonkeyPatch):
+        """Test revocations go through the Redis-compatible store"""
+        monkeypatch.setattr(config['development'], 'SQLALCHEMY_DATABASE_URI', 'sqlite:///:memory:')
+        monkeypatch.setattr(config['development'], 'REVOCATION_BACKEND', 'redis')
+        monkeypatch.setattr(config['development'], 'REVOCATION_REDIS_URL', 'memory://')
+        app = create_app()
+        client = app.test_client()
+        with app.app_context():
+            db.create_all()
+            tokens = login(client)
+
+            client.post('/api/logout', headers=bearer(tokens['refresh_token']))
+
+            assert client.post('/api/refresh', headers=bearer(tokens['refresh_token'])).status_code == 401
+            db.drop_all()
@@ -0,0 +1,146 @@
+import time
+from datetime import timedelta
+from typing import Any, Dict, List
+from wsgiref.headers import Headers
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models import Movie
+from app.utils.cache import Cache, LocalRedis, MemoryCache, RedisCache
+
+
+def count_detail_loads(client: FlaskClient, url: str, headers: Headers) -> int:
+    statements: List[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        response = client.get(url, headers=headers)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    assert response.status_code == 200
+    # Building the body is the only step that reads reviews.
+    return sum('FROM reviews' in statement for statement in statements)
+
+
+@pytest.fixture(params=['memory', 'redis'])
+def backend(request: pytest.FixtureRequest) -> Cache:
+    if request.param == 'memory':
+        return MemoryCache(max_entries=2, default_ttl=60)
+    return RedisCache(LocalRedis(), default_ttl=60)
+
+
+class TestCacheBackends:
+    def test_set_get_delete(self, backend: Cache):
+        """Test values round-trip and can be invalidated"""
+        backend.set('movie:1', {'title': 'Inception', 'reviews': {'data': []}})
+
+        assert backend.get('movie:1') == {'title': 'Inception', 'reviews': {'data': []}}
+
+        backend.delete('movie:1')
+
+        assert backend.get('movie:1') is None
+
+    def test_entries_expire(self, backend: Cache, monkeypatch: pytest.MonkeyPatch):
+        """Test entries are dropped once their TTL elapses"""
+        now = time.monotonic()
+        backend.set('movie:1', {'title': 'Inception'}, ttl=10)
+
+        monkeypatch.setattr(time, 'monotonic', lambda: now + 11)
+
+        assert backend.get('movie:1') is None
+
+    def test_memory_cache_evicts_least_recently_used(self):
+        """Test the in-process cache keeps at most max_entries values"""
+        cache = MemoryCache(max_entries=2, default_ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    def test_redis_clear_keeps_other_keys(self):
+        """Test clearing a Redis cache only drops the keys under its prefix"""
+        client = LocalRedis()
+        cache = RedisCache(client, default_ttl=60)
+        for index in range(1200):
+            cache.set(f'movie:{index}', index)
+        client.set('filmes:revoked:abc', b'1')
+
+        cache.clear()
+
+        assert cache.get('movie:0') is None
+        assert list(client.scan_iter()) == ['filmes:revoked:abc']
+
+
+class TestMovieDetailCache:
+    def test_get_movie_is_served_from_cache(self, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, Any]):
+        """Test repeated movie detail requests skip building the body"""
+        url = f"/api/movies/{test_movie['id']}"
+
+        assert count_detail_loads(client, url, auth_headers) == 1
+        assert count_detail_loads(client, url, auth_headers) == 0
+
+    def test_add_review_invalidates_movie(self, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, Any]):
+        """Test a new review is visible on the next movie detail request"""
+        movie_id = test_movie['id']
+        assert client.get(f'/api/movies/{movie_id}', headers=auth_headers).json['total_reviews'] == 0
+
+        client.post(f'/api/movies/{movie_id}/rent', headers=auth_headers)
+        client.post(f'/api/movies/{movie_id}/rate', json={"rating": 4, "comment": "Bom"}, headers=auth_headers)
+
+        response = client.get(f'/api/movies/{movie_id}', headers=auth_headers)
+        assert response.json
+        assert response.json['total_reviews'] == 1
+        assert response.json['average_rating'] == 4
+        assert [review['comment'] for review in response.json['reviews']['data']] == ["Bom"]
+
+    def test_stale_entry_is_not_served_under_new_etag(self, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, Any]):
+        """Test a change made without invalidating this worker's cache still shows with its own ETag"""
+        url = f"/api/movies/{test_movie['id']}"
+        cached = client.get(url, headers=auth_headers)
+        # Another worker writes, only its own cache is invalidated
+        movie = db.session.get(Movie, test_movie['id'])
+        movie.title = "Inception (Director's Cut)"
+        movie.updated_at = movie.updated_at + timedelta(seconds=1)
+        db.session.commit()
+
+        response = client.get(url, headers={**auth_headers, 'If-None-Match': cached.headers['ETag']})
+
+        assert response.status_code == 200
+        assert response.json['title'] == "Inception (Director's Cut)"
+        assert response.headers['ETag'] != cached.headers['ETag']
+        assert client.get(url, headers={**auth_headers, 'If-None-Match': response.headers['ETag']}).status_code == 304
+        assert client.get(url, headers=auth_headers).json['title'] == "Inception (Director's Cut)"
+
+    def test_rented_at_is_not_shared_between_users(self, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, Any]):
+        """Test the cached body carries each caller's own rented_at"""
+        movie_id = test_movie['id']
+        client.post(f'/api/movies/{movie_id}/rent', headers=auth_headers)
+        rented = client.get(f'/api/movies/{movie_id}', headers=auth_headers)
+
+        client.post('/api/register', json={"username": "other", "name": "Other User", "email": "other@example.com", "password": "TestPass123"})
+        token = client.post('/api/login', json={"email": "other@example.com", "password": "TestPass123"}).json['access_token']
+        other = client.get(f'/api/movies/{movie_id}', headers={'Authorization': f'Bearer {token}'})
+
+        assert rented.json and other.json
+        assert rented.json['rented_at'] is not None
+        assert other.json['rented_at'] is None
+
+    def test_redis_backend(self, app: Flask, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, Any]):
+        """Test the movie detail cache works through the Redis backend"""
+        app.extensions['cache'] = RedisCache(LocalRedis())
+        url = f"/api/movies/{test_movie['id']}"
+
+        assert count_detail_loads(client, url, auth_headers) == 1
+        assert count_detail_loads(client, url, auth_headers) == 0
+        assert client.get(url, headers=auth_headers).json['title'] == "Inception"
@@ -0,0 +1,41 @@
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+
+from app.dtos.movie_dto import MovieResponseDto
+from app.dtos.review_dto import ListReviewResponseDto, ReviewDto
+from app.extensions import db
+from app.models import Movie, Review, User
+from app.repositories import ReviewRepository
+
+
+class TestDtos:
+    def test_review_list_defaults_to_empty(self):
+        """Test the review list default is an empty list"""
+        assert ListReviewResponseDto().data == []
+
+    def test_dtos_are_slotted_and_frozen(self):
+        """Test DTOs carry no per-instance __dict__ and cannot be mutated"""
+        review = ReviewDto(id=1, rating=5)
+
+        assert not hasattr(review, '__dict__')
+        with pytest.raises(FrozenInstanceError):
+            review.rating = 1  # type: ignore[misc]
+
+    def test_movie_from_review_rows(self, app: Flask):
+        """Test embedded reviews are built from projected rows"""
+        user = User(username="critic", email="critic@example.com", password="hashed", name="Crítica")
+        movie = Movie(title="Central do Brasil", year=1998, genre="Drama", duration_minutes=110)
+        review = Review(user=user, movie=movie, rating=5, comment="Lindo", created_at=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        db.session.add_all([user, movie, review])
+        db.session.commit()
+
+        rows = ReviewRepository().find_rows_by_movie_ids([movie.id, "missing"])
+        dto = MovieResponseDto.from_model(movie, reviews=rows[movie.id])
+
+        assert rows["missing"] == []
+        assert dto.reviews.data == [
+            ReviewDto(id=review.id, created_at="2024-01-01T00:00:00", rating=5, comment="Lindo", user_name="Crítica")
+        ]
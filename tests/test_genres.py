@@ -0,0 +1,51 @@
+from typing import Dict, List
+from wsgiref.headers import Headers
+
+from flask.testing import FlaskClient
+
+CreateMovieData = Dict[str, int | str]
+
+
+class TestGenreController:
+    def create_movies(self, client: FlaskClient, auth_headers: Headers) -> None:
+        movies: List[CreateMovieData] = [
+            {"title": "Alien", "year": 1979, "genre": "Sci-Fi, Horror", "duration": 117},
+            {"title": "Arrival", "year": 2016, "genre": "Sci-Fi / Drama", "duration": 116},
+            {"title": "The Shining", "year": 1980, "genre": "horror", "duration": 146},
+        ]
+        for movie in movies:
+            response = client.post('/api/movies/', json=movie, headers=auth_headers)
+            assert response.status_code == 201
+
+    def test_get_genres_counts(self, client: FlaskClient, auth_headers: Headers):
+        """Test listing genres with their movie counts"""
+        self.create_movies(client, auth_headers)
+
+        response = client.get('/api/genres/', headers=auth_headers)
+
+        assert response.json
+        assert response.status_code == 200
+        counts = {genre['name']: genre['movie_count'] for genre in response.json['genres']['data']}
+        assert counts == {"Drama": 1, "Horror": 2, "Sci-Fi": 2}
+
+    def test_get_genres_requires_auth(self, client: FlaskClient):
+        """Test listing genres without a token"""
+        response = client.get('/api/genres/')
+
+        assert response.status_code == 401
+
+    def test_filter_movies_by_multiple_genres(self, client: FlaskClient, auth_headers: Headers):
+        """Test filtering movies matching any or all of several genres"""
+        self.create_movies(client, auth_headers)
+
+        any_response = client.get('/api/movies/?genres=sci-fi,horror', headers=auth_headers)
+        assert any_response.json
+        assert sorted(m['title'] for m in any_response.json['movies']['data']) == ["Alien", "Arrival", "The Shining"]
+
+        all_response = client.get('/api/movies/?genres=sci-fi,horror&genre_match=all', headers=auth_headers)
+        assert all_response.json
+        assert [m['title'] for m in all_response.json['movies']['data']] == ["Alien"]
+
+        genre_response = client.get('/api/movies/?genre=Drama', headers=auth_headers)
+        assert genre_response.json
+        assert [m['title'] for m in genre_response.json['movies']['data']] == ["Arrival"]
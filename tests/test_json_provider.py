@@ -0,0 +1,43 @@
+import json
+from typing import Any, Dict
+from wsgiref.headers import Headers
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from flask.testing import FlaskClient
+
+from app.dtos.movie_dto import MovieResponseDto
+from app.dtos.review_dto import ListReviewResponseDto, ReviewDto
+
+orjson = pytest.importorskip('orjson')
+
+from app.utils.json_provider import OrjsonProvider  # noqa: E402
+
+
+class TestJsonProvider:
+    def test_orjson_provider_is_registered(self, app: Flask):
+        """Test create_app picks the orjson provider when it is installed"""
+        assert isinstance(app.json, OrjsonProvider)
+
+    def test_matches_stdlib_output(self, app: Flask):
+        """Test nested DTOs serialize to the same document as the stdlib provider"""
+        movie = MovieResponseDto(
+            id='1', title='Cidade de Deus', year=2002, genre='Drama',
+            reviews=ListReviewResponseDto(data=[ReviewDto(id=1, rating=5, comment='Ótimo', user_name='Zé')]),
+        )
+        payload = {'code': 200, 'message': 'Filme encontrado', 'movie': movie}
+
+        fast = app.json.response(payload).get_data()
+        stdlib = DefaultJSONProvider(app).response(payload).get_data()
+
+        assert json.loads(fast) == json.loads(stdlib)
+        assert 'Ótimo'.encode() in fast
+
+    def test_responses_use_provider(self, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, Any]):
+        """Test API responses are readable after going through the provider"""
+        response = client.get(f"/api/movies/{test_movie['id']}", headers=auth_headers)
+
+        assert response.json
+        assert response.json['title'] == "Inception"
+        assert response.json['reviews'] == {'data': []}
@@ -0,0 +1,88 @@
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from werkzeug.datastructures import Headers
+
+from app import create_app
+from app.config import ProductionConfig, config
+
+prometheus_client = pytest.importorskip('prometheus_client')
+
+
+def sample(name: str, **labels: str) -> float:
+    # Collectors are shared by every app the suite creates, so tests
+    # compare values before and after their own requests
+    value = prometheus_client.REGISTRY.get_sample_value(name, labels)
+    return value or 0.0
+
+
+class TestRequestMetrics:
+    def test_counts_requests_by_endpoint(self, client: FlaskClient, auth_headers: Headers):
+        """Test requests are counted under their blueprint endpoint name"""
+        labels = {'endpoint': 'movies.movie_api', 'method': 'GET', 'status': '200'}
+        before = sample('http_requests_total', **labels)
+
+        client.get('/api/movies/', headers=auth_headers)
+        client.get('/api/movies/', headers=auth_headers)
+
+        assert sample('http_requests_total', **labels) == before + 2
+
+    def test_records_latency_and_db_time(self, client: FlaskClient, auth_headers: Headers):
+        """Test each request observes its latency and time spent in the database"""
+        latency = sample('http_request_duration_seconds_count', endpoint='genres.genre_api', method='GET')
+        db_time = sample('http_request_db_duration_seconds_count', endpoint='genres.genre_api')
+        db_sum = sample('http_request_db_duration_seconds_sum', endpoint='genres.genre_api')
+
+        client.get('/api/genres/', headers=auth_headers)
+
+        assert sample('http_request_duration_seconds_count', endpoint='genres.genre_api', method='GET') == latency + 1
+        assert sample('http_request_db_duration_seconds_count', endpoint='genres.genre_api') == db_time + 1
+        assert sample('http_request_db_duration_seconds_sum', endpoint='genres.genre_api') > db_sum
+
+    def test_in_flight_returns_to_zero(self, client: FlaskClient, auth_headers: Headers):
+        """Test finished requests, failed ones included, leave the in-flight gauge"""
+        client.get('/api/movies/', headers=auth_headers)
+        client.get('/api/movies/missing-movie', headers=auth_headers)
+
+        assert sample('http_requests_in_flight', endpoint='movies.movie_api') == 0
+
+    def test_unmatched_urls_share_a_label(self, client: FlaskClient):
+        """Test unknown URLs do not create a series per path"""
+        before = sample('http_requests_total', endpoint='unmatched', method='GET', status='404')
+
+        client.get('/does-not-exist')
+        client.get('/neither-does-this')
+
+        assert sample('http_requests_total', endpoint='unmatched', method='GET', status='404') == before + 2
+
+    def test_exposition(self, client: FlaskClient, auth_headers: Headers):
+        """Test /metrics serves the Prometheus text format"""
+        client.get('/api/movies/', headers=auth_headers)
+
+        response = client.get('/metrics')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/plain'
+        body = response.get_data(as_text=True)
+        assert 'http_requests_total{endpoint="movies.movie_api",method="GET",status="200"}' in body
+        assert 'http_request_duration_seconds_bucket{endpoint="movies.movie_api"' in body
+        assert 'endpoint="metrics"' not in body
+
+    def test_disabled(self, monkeypatch: pytest.MonkeyPatch):
+        """Test METRICS_ENABLED=false leaves /metrics unregistered"""
+        monkeypatch.setattr(config['development'], 'METRICS_ENABLED', False)
+        app = create_app()
+
+        assert app.test_client().get('/metrics').status_code == 404
+
+    def test_token(self, app: Flask, client: FlaskClient):
+        """Test METRICS_TOKEN must be sent as a bearer token"""
+        app.config['METRICS_TOKEN'] = 'scrape-token'
+
+        assert client.get('/metrics').status_code == 401
+        assert client.get('/metrics', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+        assert client.get('/metrics', headers={'Authorization': 'Bearer scrape-token'}).status_code == 200
+
+    def test_off_in_production(self):
+        """Test production only serves metrics when asked to"""
+        assert not ProductionConfig.METRICS_ENABLED
@@ -0,0 +1,102 @@
+import io
+import json
+from typing import Any, Dict, List
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from werkzeug.datastructures import Headers
+
+from app.extensions import db
+from app.models import Genre, Movie
+from app.utils.json_stream import MAX_ITEM_SIZE, InvalidJson, iter_json_array, iter_ndjson
+
+
+def movie(title: str, **values: Any) -> Dict[str, Any]:
+    return {"title": title, "year": 2001, "genre": "Drama", "duration": 90, **values}
+
+
+def report(response: Any) -> List[Dict[str, Any]]:
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def decoded(values: List[Any]) -> List[Any]:
+    return [value.message if isinstance(value, InvalidJson) else value for value in values]
+
+
+class TestMovieBulkImport:
+    def test_import_json_array(self, client: FlaskClient, auth_headers: Headers):
+        """Test every row of an array is reported in order, then a summary"""
+        client.post('/api/movies/', json=movie("Existing"), headers=auth_headers)
+
+        lines = report(client.post('/api/movies/bulk', json=[
+            movie("Amélie", genre="Comédia, Romance"),
+            movie("Existing"),
+            movie("Amélie"),
+            movie("Too Old", year=1700),
+            "not a movie",
+        ], headers=auth_headers))
+
+        assert [line.get('status') for line in lines[:-1]] == ['created', 'duplicate', 'duplicate', 'invalid', 'invalid']
+        assert [line['row'] for line in lines[:-1]] == [1, 2, 3, 4, 5]
+        assert lines[0]['id'] == db.session.query(Movie.id).filter_by(title="Amélie").scalar()
+        assert lines[3]['errors'][0]['loc'] == ['year']
+        assert lines[-1] == {'summary': {'created': 1, 'duplicate': 2, 'invalid': 2, 'error': 0}}
+
+    def test_import_ndjson_in_chunks(self, app: Flask, client: FlaskClient, auth_headers: Headers):
+        """Test NDJSON uploads are inserted chunk by chunk and keep genre counts"""
+        app.config['MOVIE_BULK_CHUNK_SIZE'] = 2
+        body = '\n'.join(json.dumps(movie(f"Movie {index}", genre="Drama, Terror")) for index in range(5))
+        body += '\n{broken\n' + json.dumps(movie("Movie 0")) + '\n'
+
+        lines = report(client.post('/api/movies/bulk', data=body, headers=auth_headers, content_type='application/x-ndjson'))
+
+        assert lines[-1]['summary'] == {'created': 5, 'duplicate': 1, 'invalid': 1, 'error': 0}
+        assert lines[5]['status'] == 'invalid'
+        assert lines[6] == {'row': 7, 'status': 'duplicate', 'title': "Movie 0"}
+        assert db.session.query(Movie).count() == 5
+        counts = {genre.name: genre.movie_count for genre in db.session.query(Genre)}
+        assert counts == {'Drama': 5, 'Terror': 5}
+
+    def test_import_requires_authentication(self, client: FlaskClient):
+        """Test anonymous uploads are rejected"""
+        response = client.post('/api/movies/bulk', json=[movie("Anonymous")])
+
+        assert response.status_code == 401
+        assert db.session.query(Movie).count() == 0
+
+
+class TestJsonStream:
+    @pytest.mark.parametrize('read_size', [1, 3, 64])
+    def test_array_items_split_across_reads(self, read_size: int):
+        """Test items are decoded whatever the read boundaries"""
+        items = [movie(f"Ação {index}", rating=index / 3) for index in range(20)] + [12345, None]
+        raw = json.dumps(items, ensure_ascii=False).encode()
+
+        assert list(iter_json_array(io.BytesIO(raw), read_size)) == items
+
+    def test_malformed_array_stops(self):
+        """Test decoding stops at the first syntax error"""
+        values = iter_json_array(io.BytesIO(b'[{"a": 1} {"a": 2}]'))
+
+        assert decoded(list(values)) == [{'a': 1}, "Expected ',' or ']' after an array item"]
+        assert decoded(list(iter_json_array(io.BytesIO(b'{"a": 1}')))) == ['Expected a JSON array']
+        assert list(iter_json_array(io.BytesIO(b' [ ] '))) == []
+
+    def test_ndjson_skips_bad_lines(self):
+        """Test a bad NDJSON line is reported and the next ones still read"""
+        values = iter_ndjson(io.BytesIO(b'{"a": 1}\n\nnope\n{"b": 2}'))
+
+        assert decoded(list(values)) == [{'a': 1}, 'Expecting value', {'b': 2}]
+
+    def test_ndjson_rejects_oversized_lines(self):
+        """Test a line over the item size limit is reported without being kept whole"""
+        oversized = b'"' + b'x' * (2 * MAX_ITEM_SIZE) + b'"\n'
+        at_limit = b'"' + b'y' * (MAX_ITEM_SIZE - 2) + b'"\n'
+        values = iter_ndjson(io.BytesIO(b'{"a": 1}\n' + oversized + at_limit + b'{"b": 2}'))
+
+        assert decoded(list(values)) == [
+            {'a': 1}, f'Item larger than {MAX_ITEM_SIZE} bytes', 'y' * (MAX_ITEM_SIZE - 2), {'b': 2},
+        ]
@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+from typing import Any, Dict, List
+
+from flask import Flask
+from flask.testing import FlaskClient
+from werkzeug.datastructures import Headers
+
+
+def import_movies(client: FlaskClient, headers: Headers, count: int) -> None:
+    movies = [{"title": f"Movie {index}, \"{index}\"", "year": 2000 + index, "genre": "Drama", "duration": 90} for index in range(count)]
+    client.post('/api/movies/bulk', json=movies, headers=headers).get_data()
+
+
+def ndjson(body: str) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in body.splitlines()]
+
+
+class TestMovieExport:
+    def test_export_ndjson(self, client: FlaskClient, auth_headers: Headers):
+        """Test every movie is exported as one JSON object per line"""
+        import_movies(client, auth_headers, 3)
+
+        response = client.get('/api/movies/export', headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        assert response.headers['Content-Disposition'] == 'attachment; filename="movies.ndjson"'
+        movies = ndjson(response.get_data(as_text=True))
+        assert [movie['title'] for movie in movies] == ['Movie 0, "0"', 'Movie 1, "1"', 'Movie 2, "2"']
+        assert set(movies[0]) == {'id', 'title', 'year', 'genre', 'duration_minutes', 'description', 'created_at'}
+
+    def test_export_csv_with_aggregates(self, client: FlaskClient, auth_headers: Headers):
+        """Test the CSV export quotes values and adds the aggregates on request"""
+        import_movies(client, auth_headers, 2)
+        movie_id = ndjson(client.get('/api/movies/export', headers=auth_headers).get_data(as_text=True))[0]['id']
+        client.post(f'/api/movies/{movie_id}/rent', headers=auth_headers)
+        client.post(f'/api/movies/{movie_id}/rate', json={"rating": 8}, headers=auth_headers)
+
+        response = client.get('/api/movies/export?format=csv&aggregates=true', headers=auth_headers)
+
+        assert response.mimetype == 'text/csv'
+        rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+        assert [row['title'] for row in rows] == ['Movie 0, "0"', 'Movie 1, "1"']
+        assert (rows[0]['total_reviews'], rows[0]['average_rating']) == ('1', '8.0')
+        assert rows[1]['total_reviews'] == '0'
+
+    def test_empty_csv_has_header(self, client: FlaskClient, auth_headers: Headers):
+        """Test an empty catalog still exports the CSV header"""
+        response = client.get('/api/movies/export?format=csv', headers=auth_headers)
+
+        assert response.get_data(as_text=True).splitlines() == ['id,title,year,genre,duration_minutes,description,created_at']
+
+    def test_export_streams_in_batches(self, app: Flask, client: FlaskClient, auth_headers: Headers):
+        """Test rows are written out batch by batch as they are fetched"""
+        app.config['MOVIE_EXPORT_BATCH_SIZE'] = 2
+        import_movies(client, auth_headers, 5)
+
+        response = client.get('/api/movies/export', headers=auth_headers, buffered=False)
+
+        assert response.is_streamed
+        chunks = [chunk for chunk in response.response if chunk]
+        assert [len(ndjson(chunk.decode())) for chunk in chunks] == [2, 2, 1]
+        response.close()
+
+    def test_export_validation(self, client: FlaskClient, auth_headers: Headers):
+        """Test unknown formats are rejected and the export needs a token"""
+        assert client.get('/api/movies/export?format=xml', headers=auth_headers).status_code == 400
+        assert client.get('/api/movies/export').status_code == 401
@@ -1,6 +1,11 @@
-from typing import Dict, List
+from typing import Any, Dict, List
 from wsgiref.headers import Headers
+from flask import Flask
 from flask.testing import FlaskClient
+from sqlalchemy import event, update
+
+from app.extensions import db
+from app.models import Movie, Review, User
 
 CreateMovieData = Dict[str, int | str]
 
@@ -142,3 +147,252 @@ class TestMovieController:
         assert genre_response.json
         assert genre_response.status_code == 200
         assert len(genre_response.json['movies']) == 1
+
+    def test_get_movies_query_count_is_constant(self, app: Flask, client: FlaskClient, auth_headers: Headers):
+        """Test listing movies issues the same number of queries regardless of review volume"""
+        def seed_reviews(reviews_per_movie: int, offset: int) -> None:
+            for index in range(5):
+                movie = Movie(title=f"Movie {offset + index}", year=2000, genre="Drama", duration_minutes=100)
+                db.session.add(movie)
+                for reviewer in range(reviews_per_movie):
+                    user = User(
+                        username=f"user-{offset + index}-{reviewer}",
+                        email=f"user-{offset + index}-{reviewer}@example.com",
+                        password="hashed",
+                        name=f"Reviewer {reviewer}",
+                    )
+                    db.session.add(Review(user=user, movie=movie, rating=5))
+            db.session.commit()
+            db.session.expunge_all()
+
+        def count_list_queries() -> int:
+            statements: List[str] = []
+
+            def before_cursor_execute(*args: Any) -> None:
+                statements.append(args[2])
+
+            event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+            try:
+                response = client.get('/api/movies/?view=detail', headers=auth_headers)
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+            assert response.status_code == 200
+            return len(statements)
+
+        seed_reviews(reviews_per_movie=1, offset=0)
+        few_reviews = count_list_queries()
+
+        seed_reviews(reviews_per_movie=10, offset=5)
+        many_reviews = count_list_queries()
+
+        assert few_reviews == many_reviews
+
+    def test_get_movies_cursor_pagination(self, client: FlaskClient, auth_headers: Headers):
+        """Test walking the movie list forwards and backwards with cursors"""
+        for index in range(5):
+            movie: CreateMovieData = {"title": f"Cursor Movie {index}", "year": 2000 + index, "genre": "Drama", "duration": 100}
+            response = client.post('/api/movies/', json=movie, headers=auth_headers)
+            assert response.status_code == 201
+
+        first_page = client.get('/api/movies/?limit=2', headers=auth_headers)
+        assert first_page.json
+        assert [m['title'] for m in first_page.json['movies']['data']] == ["Cursor Movie 0", "Cursor Movie 1"]
+        assert first_page.json['pagination']['prev_cursor'] is None
+
+        next_cursor = first_page.json['pagination']['next_cursor']
+        second_page = client.get(f'/api/movies/?limit=2&cursor={next_cursor}', headers=auth_headers)
+        assert second_page.json
+        assert [m['title'] for m in second_page.json['movies']['data']] == ["Cursor Movie 2", "Cursor Movie 3"]
+
+        last_cursor = second_page.json['pagination']['next_cursor']
+        last_page = client.get(f'/api/movies/?limit=2&cursor={last_cursor}', headers=auth_headers)
+        assert last_page.json
+        assert [m['title'] for m in last_page.json['movies']['data']] == ["Cursor Movie 4"]
+        assert last_page.json['pagination']['next_cursor'] is None
+
+        prev_cursor = last_page.json['pagination']['prev_cursor']
+        previous_page = client.get(f'/api/movies/?limit=2&cursor={prev_cursor}', headers=auth_headers)
+        assert previous_page.json
+        assert [m['title'] for m in previous_page.json['movies']['data']] == ["Cursor Movie 2", "Cursor Movie 3"]
+
+    def test_get_movies_invalid_cursor(self, client: FlaskClient, auth_headers: Headers):
+        """Test an invalid cursor is rejected"""
+        response = client.get('/api/movies/?cursor=not-a-cursor', headers=auth_headers)
+
+        assert response.json
+        assert response.status_code == 400
+        assert response.json['message'] == "Cursor de paginação inválido"
+
+    def test_search_movies_ranked_by_relevance(self, client: FlaskClient, auth_headers: Headers):
+        """Test title search returns exact and prefix matches first and escapes wildcards"""
+        titles = ["The Matrix Revolutions", "Matrix Reloaded", "Matrix", "100% Matrix", "Alien"]
+        for title in titles:
+            movie: CreateMovieData = {"title": title, "year": 2000, "genre": "Sci-Fi", "duration": 120}
+            response = client.post('/api/movies/', json=movie, headers=auth_headers)
+            assert response.status_code == 201
+
+        response = client.get('/api/movies/?search=matrix', headers=auth_headers)
+        assert response.json
+        found = [m['title'] for m in response.json['movies']['data']]
+        assert found[:2] == ["Matrix", "Matrix Reloaded"]
+        assert set(found) == {"The Matrix Revolutions", "Matrix Reloaded", "Matrix", "100% Matrix"}
+
+        response = client.get('/api/movies/?search=%25', headers=auth_headers)
+        assert response.json
+        assert [m['title'] for m in response.json['movies']['data']] == ["100% Matrix"]
+
+    def test_get_movies_composite_filters(self, client: FlaskClient, auth_headers: Headers):
+        """Test combining search, genre, ranges, rating and sort in one request"""
+        test_movies: List[CreateMovieData] = [
+            {"title": "Star Voyage", "year": 1995, "genre": "Sci-Fi", "duration": 100},
+            {"title": "Star Voyage II", "year": 2001, "genre": "Sci-Fi", "duration": 130},
+            {"title": "Star Voyage III", "year": 2008, "genre": "Sci-Fi", "duration": 125},
+            {"title": "Star Voyage: The Musical", "year": 2005, "genre": "Comedy", "duration": 120},
+            {"title": "Dark Star", "year": 2003, "genre": "Sci-Fi", "duration": 210},
+        ]
+        for movie in test_movies:
+            response = client.post('/api/movies/', json=movie, headers=auth_headers)
+            assert response.status_code == 201
+        db.session.execute(update(Movie).where(Movie.title == "Star Voyage III").values(average_rating=4.0))
+        db.session.commit()
+
+        response = client.get(
+            '/api/movies/?search=star&genre=sci-fi&year_min=2000&duration_max=150&sort=-year',
+            headers=auth_headers,
+        )
+        assert response.json
+        assert response.status_code == 200
+        assert [m['title'] for m in response.json['movies']['data']] == ["Star Voyage III", "Star Voyage II"]
+
+        response = client.get('/api/movies/?search=star&min_rating=3', headers=auth_headers)
+        assert response.json
+        assert [m['title'] for m in response.json['movies']['data']] == ["Star Voyage III"]
+
+    def test_get_movies_sorted_cursor_pagination(self, client: FlaskClient, auth_headers: Headers):
+        """Test cursor pagination follows the requested sort order"""
+        for year in (2003, 2001, 2004, 2002):
+            movie: CreateMovieData = {"title": f"Year {year}", "year": year, "genre": "Drama", "duration": 100}
+            response = client.post('/api/movies/', json=movie, headers=auth_headers)
+            assert response.status_code == 201
+
+        first_page = client.get('/api/movies/?sort=-year&limit=3', headers=auth_headers)
+        assert first_page.json
+        assert [m['year'] for m in first_page.json['movies']['data']] == [2004, 2003, 2002]
+
+        next_cursor = first_page.json['pagination']['next_cursor']
+        second_page = client.get(f'/api/movies/?sort=-year&limit=3&cursor={next_cursor}', headers=auth_headers)
+        assert second_page.json
+        assert [m['year'] for m in second_page.json['movies']['data']] == [2001]
+
+        mismatched = client.get(f'/api/movies/?sort=year&limit=3&cursor={next_cursor}', headers=auth_headers)
+        assert mismatched.status_code == 400
+
+    def test_get_movies_invalid_ranges(self, client: FlaskClient, auth_headers: Headers):
+        """Test rejecting inverted filter ranges"""
+        response = client.get('/api/movies/?year_min=2010&year_max=2000', headers=auth_headers)
+
+        assert response.status_code == 400
+
+    def test_get_movie_conditional(self, app: Flask, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, Any]):
+        """Test movie detail answers 304 to a current ETag after a single query"""
+        movie_id = test_movie['id']
+        response = client.get(f'/api/movies/{movie_id}', headers=auth_headers)
+        etag = response.headers['ETag']
+        assert response.headers['Last-Modified']
+
+        statements: List[str] = []
+
+        def before_cursor_execute(*args: Any) -> None:
+            statements.append(args[2])
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            cached = client.get(f'/api/movies/{movie_id}', headers={**auth_headers, 'If-None-Match': etag})
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+        assert cached.status_code == 304
+        assert cached.data == b''
+        assert cached.headers['ETag'] == etag
+        assert len(statements) == 1
+
+        client.post(f'/api/movies/{movie_id}/rent', headers=auth_headers)
+        rented = client.get(f'/api/movies/{movie_id}', headers={**auth_headers, 'If-None-Match': etag})
+        assert rented.status_code == 200
+        assert rented.headers['ETag'] != etag
+
+        client.post(f'/api/movies/{movie_id}/rate', json={"rating": 5}, headers=auth_headers)
+        reviewed = client.get(f'/api/movies/{movie_id}', headers={**auth_headers, 'If-None-Match': rented.headers['ETag']})
+        assert reviewed.status_code == 200
+        assert reviewed.json
+        assert reviewed.json['total_reviews'] == 1
+
+    def test_get_movie_if_modified_since(self, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, Any]):
+        """Test movie detail honours If-Modified-Since"""
+        movie_id = test_movie['id']
+        response = client.get(f'/api/movies/{movie_id}', headers=auth_headers)
+        last_modified = response.headers['Last-Modified']
+
+        cached = client.get(f'/api/movies/{movie_id}', headers={**auth_headers, 'If-Modified-Since': last_modified})
+        stale = client.get(f'/api/movies/{movie_id}', headers={**auth_headers, 'If-Modified-Since': 'Mon, 01 Jan 2001 00:00:00 GMT'})
+
+        assert cached.status_code == 304
+        assert stale.status_code == 200
+
+    def test_get_movies_conditional(self, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, Any]):
+        """Test the movie list is versioned by the whole catalog"""
+        response = client.get('/api/movies/', headers=auth_headers)
+        etag = response.headers['ETag']
+
+        cached = client.get('/api/movies/', headers={**auth_headers, 'If-None-Match': etag})
+        assert cached.status_code == 304
+
+        movie: CreateMovieData = {"title": "New Release", "year": 2024, "genre": "Drama", "duration": 100}
+        client.post('/api/movies/', json=movie, headers=auth_headers)
+
+        changed = client.get('/api/movies/', headers={**auth_headers, 'If-None-Match': etag})
+        assert changed.status_code == 200
+        assert changed.json
+        assert len(changed.json['movies']['data']) == 2
+
+    def test_get_movies_selects_only_rendered_columns(self, app: Flask, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, Any]):
+        """Test the list page reads projected rows instead of Movie entities"""
+        statements: List[str] = []
+
+        def before_cursor_execute(*args: Any) -> None:
+            statements.append(args[2])
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            response = client.get('/api/movies/', headers=auth_headers)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+        assert response.json
+        assert response.json['movies']['data'][0]['title'] == "Inception"
+        list_statement = next(s for s in statements if 'FROM movies' in s and 'count(' not in s)
+        assert 'rating_sum' not in list_statement
+        assert 'updated_at' not in list_statement
+
+    def test_get_movies_views(self, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, Any]):
+        """Test list pages default to summaries and embed reviews only on request"""
+        movie_id = test_movie['id']
+        client.post(f'/api/movies/{movie_id}/rent', headers=auth_headers)
+        client.post(f'/api/movies/{movie_id}/rate', json={"rating": 4, "comment": "Bom"}, headers=auth_headers)
+
+        summary = client.get('/api/movies/', headers=auth_headers)
+        detail = client.get('/api/movies/?view=detail', headers=auth_headers)
+        rented = client.get('/api/movies/?rented=true', headers=auth_headers)
+
+        assert summary.json and detail.json and rented.json
+        summary_movie = summary.json['movies']['data'][0]
+        assert 'reviews' not in summary_movie
+        assert 'description' not in summary_movie
+        assert summary_movie['total_reviews'] == 1
+        assert summary_movie['average_rating'] == 4
+        assert detail.json['movies']['data'][0]['reviews']['data'][0]['comment'] == "Bom"
+        assert 'reviews' not in rented.json['movies']['data'][0]
+        assert rented.json['movies']['data'][0]['rented_at'] is not None
+
+        invalid = client.get('/api/movies/?view=full', headers=auth_headers)
+        assert invalid.status_code == 400
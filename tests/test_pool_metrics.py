@@ -0,0 +1,130 @@
+import os
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from flask import Flask
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import StaticPool
+
+from app import create_app
+from app.config import config
+from app.extensions import db
+from app.utils.pool_metrics import Histogram, InstrumentedQueuePool
+
+
+@pytest.fixture
+def pooled_app(tmp_path: Path, make_app: Callable[..., Flask]) -> Flask:
+    # File databases get a queue pool, in-memory ones a static pool.
+    return make_app(f"sqlite:///{tmp_path / 'pool.db'}", SQLALCHEMY_ENGINE_OPTIONS={
+        'pool_size': 1,
+        'max_overflow': 0,
+        'pool_timeout': 0.05,
+        'pool_pre_ping': True,
+    })
+
+
+class TestHistogram:
+    def test_buckets_are_cumulative(self):
+        """Test each bucket counts every observation up to its bound"""
+        histogram = Histogram(buckets=(0.01, 0.1))
+        for value in (0.005, 0.01, 0.05, 2):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot['buckets'] == {'0.01': 2, '0.1': 3, '+Inf': 4}
+        assert snapshot['count'] == 4
+        assert snapshot['sum'] == pytest.approx(2.065)
+
+
+class TestPoolMetrics:
+    def test_in_memory_database_skips_queue_options(self, app: Flask):
+        """Test pool sizing options are dropped for the static pool"""
+        assert isinstance(db.engine.pool, StaticPool)
+
+    def test_queue_pool_options(self, pooled_app: Flask):
+        """Test the configured engine options reach the queue pool"""
+        pool = db.engine.pool
+
+        assert isinstance(pool, InstrumentedQueuePool)
+        assert pool.size() == 1
+        assert pool._pre_ping
+
+    def test_endpoint_reports_checkouts(self, pooled_app: Flask):
+        """Test requests show up in the pool counters and wait histogram"""
+        client = pooled_app.test_client()
+        client.post('/api/register', json={
+            "username": "pooluser",
+            "name": "Pool User",
+            "email": "pool@example.com",
+            "password": "PoolPass123"
+        })
+        # The fixture's app context outlives the request, end its session
+        # the way the request's own teardown would
+        db.session.remove()
+
+        response = client.get('/api/metrics/pool')
+
+        assert response.json
+        assert response.status_code == 200
+        [pool] = response.json['pools']
+        assert pool['name'] == 'default'
+        assert pool['size'] == 1
+        assert pool['checked_out'] == 0
+        assert pool['checkouts'] >= 1
+        assert pool['connects'] >= 1
+        assert pool['wait_seconds']['count'] == pool['checkouts']
+
+    def test_endpoint_access(self, app: Flask):
+        """Test the endpoint follows METRICS_ENABLED and METRICS_TOKEN"""
+        client = app.test_client()
+        app.config['METRICS_TOKEN'] = 'scrape-token'
+
+        assert client.get('/api/metrics/pool').status_code == 401
+        assert client.get('/api/metrics/pool', headers={'Authorization': 'Bearer scrape-token'}).status_code == 200
+
+        app.config['METRICS_ENABLED'] = False
+
+        assert client.get('/api/metrics/pool', headers={'Authorization': 'Bearer scrape-token'}).status_code == 404
+
+    def test_timeouts_are_counted(self, pooled_app: Flask):
+        """Test checkouts that give up waiting are counted"""
+        metrics = pooled_app.extensions['pool_metrics']['default']
+        held = db.engine.connect()
+        try:
+            with pytest.raises(PoolTimeoutError):
+                db.engine.connect()
+        finally:
+            held.close()
+
+        assert metrics.timeouts == 1
+        assert metrics.checked_out == 0
+
+    def test_metrics_survive_dispose(self, pooled_app: Flask):
+        """Test a disposed engine's new pool keeps reporting"""
+        metrics = pooled_app.extensions['pool_metrics']['default']
+        db.engine.dispose()
+
+        with db.engine.connect():
+            assert metrics.checked_out == 1
+
+        assert metrics.pool is db.engine.pool
+        assert metrics.snapshot()['wait_seconds']['count'] >= 1
+
+
+def test_statement_timeout_on_postgres(monkeypatch: pytest.MonkeyPatch):
+    """Test new PostgreSQL connections get the configured statement timeout"""
+    url = os.getenv('TEST_POSTGRES_URL', '')
+    if not url:
+        pytest.skip('TEST_POSTGRES_URL is not set')
+    monkeypatch.setattr(config['development'], 'SQLALCHEMY_DATABASE_URI', url)
+    monkeypatch.setattr(config['development'], 'DATABASE_STATEMENT_TIMEOUT', 1234)
+    app = create_app()
+
+    with app.app_context():
+        assert db.session.execute(text('SHOW statement_timeout')).scalar() == '1234ms'
+        db.session.rollback()
+        # The setting is per session, not undone with the transaction
+        assert db.session.execute(text('SHOW statement_timeout')).scalar() == '1234ms'
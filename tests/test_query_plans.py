@@ -0,0 +1,105 @@
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+from flask import Flask
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models import Movie, Rental, Review, User
+from app.repositories import MovieRepository, RentalRepository, ReviewRepository
+from app.schemas.movie.get_movie_request_schema import GetMovieRequest
+from app.schemas.movie.get_reviews_request_schema import GetReviewsRequest
+
+# Hot repository queries, each called with the seeded user and movie ids.
+HOT_QUERIES: Dict[str, Callable[[str, str], Any]] = {
+    'movies.find_by_id': lambda user_id, movie_id: MovieRepository().find_by_id(movie_id),
+    'movies.find_page': lambda user_id, movie_id: MovieRepository().find_page(GetMovieRequest(limit=10)),
+    'movies.find_page_by_year': lambda user_id, movie_id: MovieRepository().find_page(GetMovieRequest(sort='-year', year_min=2000)),
+    'rentals.find_by_user_and_movie': lambda user_id, movie_id: RentalRepository().find_by_user_and_movie(user_id, movie_id),
+    'rentals.find_movie_rows_by_user_id': lambda user_id, movie_id: RentalRepository().find_movie_rows_by_user_id(user_id),
+    'rentals.find_by_movie_id': lambda user_id, movie_id: RentalRepository().find_by_movie_id(movie_id),
+    'reviews.find_rows_by_movie_ids': lambda user_id, movie_id: ReviewRepository().find_rows_by_movie_ids([movie_id]),
+    'reviews.find_page': lambda user_id, movie_id: ReviewRepository().find_page(movie_id, GetReviewsRequest(sort='-rating')),
+    'reviews.find_by_user_and_movie': lambda user_id, movie_id: ReviewRepository().find_by_user_and_movie(user_id, movie_id),
+}
+
+# A bare "SCAN <table>" is a full table scan. "SCAN <table> USING INDEX"
+# walks an index in order (bounded by LIMIT) and "SEARCH" is an index seek.
+SQLITE_FULL_SCAN = re.compile(r'^SCAN (\w+)$')
+
+
+@pytest.fixture(params=['sqlite', 'postgresql'])
+def plan_app(request: pytest.FixtureRequest, make_app: Callable[..., Flask]) -> Flask:
+    url = 'sqlite:///:memory:'
+    if request.param == 'postgresql':
+        url = os.getenv('TEST_POSTGRES_URL', '')
+        if not url:
+            pytest.skip('TEST_POSTGRES_URL is not set')
+    return make_app(url)
+
+
+def seed() -> Tuple[str, str]:
+    user = User(username="planner", email="planner@example.com", password="hashed")
+    movie = Movie(title="Plan Nine", year=2001, genre="Drama", duration_minutes=90)
+    db.session.add_all([
+        user,
+        movie,
+        Rental(user=user, movie=movie, expires_at=datetime.now() + timedelta(days=7)),
+        Review(user=user, movie=movie, rating=7),
+    ])
+    db.session.commit()
+    return user.id, movie.id
+
+
+def capture(query: Callable[[], Any]) -> List[Tuple[str, Any]]:
+    statements: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, *args: Any) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        query()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    return statements
+
+
+def full_scans(statement: str, parameters: Any) -> List[str]:
+    connection = db.session.connection()
+
+    if connection.dialect.name == 'sqlite':
+        rows = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).all()
+        return [row[-1] for row in rows if SQLITE_FULL_SCAN.match(row[-1])]
+
+    # Tiny test tables make sequential scans the cheapest plan, so only an
+    # unavoidable one (no usable index) survives disabling them.
+    connection.exec_driver_sql('SET LOCAL enable_seqscan = off')
+    plan = connection.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {statement}', parameters).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    scans: List[str] = []
+    nodes = [plan[0]['Plan']]
+    while nodes:
+        node = nodes.pop()
+        if node['Node Type'] == 'Seq Scan':
+            scans.append(f"Seq Scan on {node['Relation Name']}")
+        nodes.extend(node.get('Plans', []))
+    return scans
+
+
+class TestQueryPlans:
+    @pytest.mark.parametrize('name', sorted(HOT_QUERIES))
+    def test_hot_query_uses_indexes(self, plan_app: Flask, name: str):
+        """Test every hot repository query is served by indexes"""
+        user_id, movie_id = seed()
+        statements = capture(lambda: HOT_QUERIES[name](user_id, movie_id))
+
+        assert statements
+        for statement, parameters in statements:
+            assert full_scans(statement, parameters) == [], statement
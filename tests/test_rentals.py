@@ -1,6 +1,9 @@
-from typing import Dict
+from typing import Any, Dict, List
 from wsgiref.headers import Headers
 from flask.testing import FlaskClient
+from sqlalchemy import event
+
+from app.extensions import db
 
 
 class TestMovieRentalController:
@@ -52,3 +55,20 @@ class TestMovieRentalController:
         )
         
         assert response.status_code == 404
+
+    def test_rent_movie_single_statement(self, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, int | str]):
+        """Test renting a movie issues a single INSERT statement"""
+        statements: List[str] = []
+
+        def before_cursor_execute(*args: Any) -> None:
+            statements.append(args[2])
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            response = client.post(f'/api/movies/{test_movie["id"]}/rent', headers=auth_headers)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+        assert response.status_code == 200
+        assert len(statements) == 1
+        assert statements[0].startswith('INSERT INTO rentals')
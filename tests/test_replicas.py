@@ -0,0 +1,158 @@
+from pathlib import Path
+from typing import Any, Callable, Generator
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from werkzeug.datastructures import Headers
+
+from app.extensions import db
+from app.models import Movie
+from app.utils.cache import LocalRedis
+from app.utils.replicas import PinStore, ReplicaSet
+
+
+def replica_app(make_app: Callable[..., Flask], tmp_path: Path, *replica_urls: str, **overrides: Any) -> Flask:
+    # Two SQLite files stand in for a primary and a replica that has not
+    # caught up, so each test controls what each side contains.
+    return make_app(f"sqlite:///{tmp_path / 'primary.db'}", SQLALCHEMY_BINDS={
+        f'replica_{index}': {'url': url} for index, url in enumerate(replica_urls)
+    }, **overrides)
+
+
+@pytest.fixture
+def routed_app(tmp_path: Path, make_app: Callable[..., Flask]) -> Generator[Flask]:
+    app = replica_app(make_app, tmp_path, f"sqlite:///{tmp_path / 'replica.db'}")
+    db.metadata.create_all(db.engines['replica_0'])
+    yield app
+    db.metadata.drop_all(db.engines['replica_0'])
+
+
+def login(client: FlaskClient) -> Headers:
+    client.post('/api/register', json={
+        "username": "replicauser",
+        "name": "Replica User",
+        "email": "replica@example.com",
+        "password": "ReplicaPass123"
+    })
+    response = client.post('/api/login', json={
+        "email": "replica@example.com",
+        "password": "ReplicaPass123"
+    })
+    headers = Headers()
+    headers.add('Authorization', f"Bearer {response.json['access_token']}")
+    # The fixture's app context outlives requests, end the session that
+    # wrote the user the way request teardown would
+    db.session.remove()
+    return headers
+
+
+def add_movie(engine: Engine, **values: Any) -> None:
+    with engine.begin() as connection:
+        connection.execute(insert(Movie), [{'year': 2010, 'genre': 'Drama', 'duration_minutes': 120, **values}])
+
+
+def titles(response: Any) -> list[str]:
+    assert response.status_code == 200
+    return [movie['title'] for movie in response.json['movies']['data']]
+
+
+class TestReplicaRouting:
+    def test_reads_go_to_replica(self, routed_app: Flask):
+        """Test movie listings are read from the replica"""
+        client = routed_app.test_client()
+        headers = login(client)
+        add_movie(db.engines['replica_0'], id='replica-movie', title='Only On Replica')
+
+        assert titles(client.get('/api/movies/', headers=headers)) == ['Only On Replica']
+
+    def test_writes_go_to_primary(self, routed_app: Flask):
+        """Test new movies are written to the primary only"""
+        client = routed_app.test_client()
+        headers = login(client)
+
+        response = client.post('/api/movies/', json={"title": "Fresh", "year": 2024, "genre": "Drama", "duration": 100}, headers=headers)
+
+        assert response.status_code == 201
+        assert db.session.query(Movie).count() == 1
+        with db.engines['replica_0'].connect() as connection:
+            assert connection.execute(Movie.__table__.select()).all() == []
+
+    def test_reads_follow_own_writes(self, routed_app: Flask):
+        """Test a user's reads stay on the primary right after they rent"""
+        client = routed_app.test_client()
+        headers = login(client)
+        for engine in (db.engines[None], db.engines['replica_0']):
+            add_movie(engine, id='shared-movie', title='Shared')
+
+        assert client.post('/api/movies/shared-movie/rent', headers=headers).status_code == 200
+        db.session.remove()
+
+        # The replica has no rental yet, only the primary can answer
+        assert titles(client.get('/api/movies/?rented=true', headers=headers)) == ['Shared']
+
+        routed_app.extensions['replica_pins'] = PinStore(LocalRedis())
+        db.session.remove()
+        assert titles(client.get('/api/movies/?rented=true', headers=headers)) == []
+
+    def test_rental_check_reads_primary(self, routed_app: Flask):
+        """Test a review is accepted for a rental the replica has not seen"""
+        client = routed_app.test_client()
+        headers = login(client)
+        for engine in (db.engines[None], db.engines['replica_0']):
+            add_movie(engine, id='shared-movie', title='Shared')
+        assert client.post('/api/movies/shared-movie/rent', headers=headers).status_code == 200
+        # Another worker, without this one's pin, takes the review
+        routed_app.extensions['replica_pins'] = PinStore(LocalRedis())
+        db.session.remove()
+
+        response = client.post('/api/movies/shared-movie/rate', json={"rating": 8}, headers=headers)
+
+        assert response.status_code == 200
+
+    def test_pin_survives_disabled_cache(self, tmp_path: Path, make_app: Callable[..., Flask]):
+        """Test pins are kept when the cache stores nothing"""
+        app = replica_app(make_app, tmp_path, f"sqlite:///{tmp_path / 'replica.db'}", CACHE_BACKEND='null')
+        db.metadata.create_all(db.engines['replica_0'])
+        client = app.test_client()
+        headers = login(client)
+        for engine in (db.engines[None], db.engines['replica_0']):
+            add_movie(engine, id='shared-movie', title='Shared')
+
+        assert client.post('/api/movies/shared-movie/rent', headers=headers).status_code == 200
+        db.session.remove()
+
+        assert titles(client.get('/api/movies/?rented=true', headers=headers)) == ['Shared']
+        db.metadata.drop_all(db.engines['replica_0'])
+
+    def test_pin_requires_shared_store(self, tmp_path: Path, make_app: Callable[..., Flask]):
+        """Test replicas with per-process pins are refused when state must be shared"""
+        with pytest.raises(RuntimeError, match='REPLICA_PIN_REDIS_URL'):
+            replica_app(make_app, tmp_path, f"sqlite:///{tmp_path / 'replica.db'}", REQUIRE_SHARED_STATE=True)
+
+    def test_unreachable_replica_falls_back_to_primary(self, tmp_path: Path, make_app: Callable[..., Flask]):
+        """Test reads fail over to the primary and the replica is skipped"""
+        app = replica_app(make_app, tmp_path, f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        client = app.test_client()
+        headers = login(client)
+        add_movie(db.engines[None], id='primary-movie', title='On Primary')
+
+        assert titles(client.get('/api/movies/', headers=headers)) == ['On Primary']
+
+        replicas: ReplicaSet = app.extensions['replicas']
+        assert replicas.pick() is None
+
+
+class TestReplicaSet:
+    def test_round_robin(self):
+        """Test replicas take turns and unhealthy ones are skipped"""
+        first, second = Engine.__new__(Engine), Engine.__new__(Engine)
+        replicas = ReplicaSet([first, second], retry_after=60)
+
+        assert [replicas.pick() for _ in range(4)] == [first, second, first, second]
+
+        replicas.mark_down(second)
+
+        assert [replicas.pick() for _ in range(3)] == [first, first, first]
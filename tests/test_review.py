@@ -1,8 +1,24 @@
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict
 from wsgiref.headers import Headers
 
+import pytest
+from flask import Flask
 from flask.testing import FlaskClient
 
+from app.extensions import db
+from app.models import Movie, Review, User
+from app.repositories import ReviewRepository
+
+
+@pytest.fixture
+def file_app(tmp_path: Path, make_app: Callable[..., Flask]) -> Flask:
+    # Concurrent writers need separate connections, which an in-memory
+    # SQLite database shared through a single connection cannot provide.
+    return make_app(f"sqlite:///{tmp_path / 'reviews.db'}")
+
 
 class TestMovieReviewController:
     def test_add_review_success(self, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, int | str]):
@@ -72,3 +88,76 @@ class TestMovieReviewController:
         assert response.json
         assert response.status_code == 409
         assert response.json['message'] == "Tentativa de avaliar um filme que já foi avaliado"
+
+    def test_concurrent_reviews_aggregate(self, file_app: Flask):
+        """Test parallel reviews of one movie are all counted in its aggregates"""
+        ratings = [(index % 10) + 0.5 for index in range(40)]
+        movie = Movie(title="Popular", year=2020, genre="Drama", duration_minutes=100)
+        users = [
+            User(username=f"reviewer{index}", email=f"reviewer{index}@example.com", password="hashed")
+            for index in range(len(ratings))
+        ]
+        db.session.add_all([movie, *users])
+        db.session.commit()
+        movie_id = movie.id
+        user_ids = [user.id for user in users]
+
+        def review(args: tuple[str, float]) -> None:
+            user_id, rating = args
+            with file_app.app_context():
+                ReviewRepository().create(user_id, movie_id, rating, None)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(review, zip(user_ids, ratings)))
+
+        db.session.expire_all()
+        movie = db.session.get(Movie, movie_id)
+        assert movie
+        assert movie.total_reviews == len(ratings)
+        assert movie.rating_sum == pytest.approx(sum(ratings))
+        assert movie.average_rating == pytest.approx(sum(ratings) / len(ratings))
+
+    def test_list_reviews_paginated(self, client: FlaskClient, auth_headers: Headers, test_movie: Dict[str, int | str]):
+        """Test paging through a movie's reviews by recency and by rating"""
+        movie_id = test_movie['id']
+        movie = db.session.get(Movie, movie_id)
+        for index, rating in enumerate([3, 5, 1, 4, 2]):
+            user = User(username=f"critic{index}", email=f"critic{index}@example.com", password="hashed", name=f"Critic {index}")
+            db.session.add(Review(user=user, movie=movie, rating=rating, comment=f"Review {index}", created_at=datetime(2024, 1, index + 1, tzinfo=timezone.utc)))
+        db.session.commit()
+
+        first = client.get(f'/api/movies/{movie_id}/reviews?limit=2', headers=auth_headers)
+        assert first.json
+        assert [r['comment'] for r in first.json['reviews']['data']] == ["Review 4", "Review 3"]
+        assert first.json['pagination']['prev_cursor'] is None
+
+        second = client.get(f"/api/movies/{movie_id}/reviews?limit=2&cursor={first.json['pagination']['next_cursor']}", headers=auth_headers)
+        assert second.json
+        assert [r['comment'] for r in second.json['reviews']['data']] == ["Review 2", "Review 1"]
+
+        back = client.get(f"/api/movies/{movie_id}/reviews?limit=2&cursor={second.json['pagination']['prev_cursor']}", headers=auth_headers)
+        assert back.json
+        assert [r['comment'] for r in back.json['reviews']['data']] == ["Review 4", "Review 3"]
+
+        by_rating = client.get(f'/api/movies/{movie_id}/reviews?sort=-rating&limit=3', headers=auth_headers)
+        assert by_rating.json
+        assert [r['rating'] for r in by_rating.json['reviews']['data']] == [5, 4, 3]
+        next_by_rating = client.get(f"/api/movies/{movie_id}/reviews?sort=-rating&limit=3&cursor={by_rating.json['pagination']['next_cursor']}", headers=auth_headers)
+        assert next_by_rating.json
+        assert [r['rating'] for r in next_by_rating.json['reviews']['data']] == [2, 1]
+        assert next_by_rating.json['pagination']['next_cursor'] is None
+
+        mismatched = client.get(f"/api/movies/{movie_id}/reviews?sort=rating&cursor={by_rating.json['pagination']['next_cursor']}", headers=auth_headers)
+        assert mismatched.status_code == 400
+
+    def test_list_reviews_requires_authentication(self, client: FlaskClient, test_movie: Dict[str, int | str]):
+        """Test listing reviews without a token is rejected"""
+        response = client.get(f"/api/movies/{test_movie['id']}/reviews")
+
+        assert response.status_code == 401
+
+    def test_list_reviews_movie_not_found(self, client: FlaskClient, auth_headers: Headers):
+        """Test listing the reviews of an unknown movie"""
+        response = client.get('/api/movies/nonexistent/reviews', headers=auth_headers)
+
+        assert response.status_code == 404
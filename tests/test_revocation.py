@@ -0,0 +1,108 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+
+import pytest
+from flask import Flask
+
+from app.config import ProductionConfig
+from app.utils.cache import LocalRedis
+from app.utils.revocation import (
+    BloomFilter,
+    MemoryRevocationStore,
+    RedisRevocationStore,
+    RevocationStore,
+    create_revocation_store,
+)
+
+
+@pytest.fixture(params=['memory', 'redis'])
+def store(request: pytest.FixtureRequest) -> RevocationStore:
+    if request.param == 'memory':
+        return MemoryRevocationStore(capacity=4)
+    return RedisRevocationStore(LocalRedis())
+
+
+class TestBloomFilter:
+    def test_never_misses_added_keys(self):
+        """Test every added key is reported as present"""
+        bloom = BloomFilter(capacity=1000)
+        keys = [f'jti-{i}' for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+
+    def test_false_positive_rate(self):
+        """Test absent keys are rarely reported at capacity"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f'jti-{i}')
+
+        false_positives = sum(f'other-{i}' in bloom for i in range(10000))
+
+        assert false_positives < 300
+
+
+class TestRevocationStores:
+    def test_revoke(self, store: RevocationStore):
+        """Test revoked ids are reported until their token expires"""
+        store.revoke('revoked', int(time.time()) + 60)
+
+        assert store.is_revoked('revoked')
+        assert not store.is_revoked('other')
+
+    def test_expired_tokens_are_not_kept(self, store: RevocationStore):
+        """Test revoking an already expired token stores nothing"""
+        store.revoke('expired', int(time.time()) - 1)
+
+        assert not store.is_revoked('expired')
+
+    def test_claim_is_single_use(self, store: RevocationStore):
+        """Test only the first claim of an id succeeds and revokes it"""
+        expires_at = int(time.time()) + 60
+
+        assert store.claim('refresh', expires_at)
+        assert not store.claim('refresh', expires_at)
+        assert store.is_revoked('refresh')
+        assert not store.claim('expired', int(time.time()) - 1)
+
+    def test_concurrent_claims(self, store: RevocationStore):
+        """Test one of many simultaneous claims of the same id wins"""
+        expires_at = int(time.time()) + 60
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            claims = list(executor.map(lambda _: store.claim('refresh', expires_at), range(32)))
+
+        assert claims.count(True) == 1
+
+    def test_memory_store_purges_expired_entries(self):
+        """Test a full store drops expired ids and rebuilds its filter"""
+        store = MemoryRevocationStore(capacity=2)
+        store.revoke('expired-1', int(time.time()) - 1)
+        store.revoke('expired-2', int(time.time()) - 1)
+        store.revoke('alive', int(time.time()) + 60)
+
+        assert set(store._entries) == {'alive'}
+        assert store.is_revoked('alive')
+
+    @pytest.mark.parametrize('settings', [
+        {'REVOCATION_BACKEND': 'memory'},
+        {'REVOCATION_BACKEND': 'redis'},
+        {'REVOCATION_BACKEND': 'redis', 'REVOCATION_REDIS_URL': 'memory://'},
+    ])
+    def test_shared_state_refuses_per_process_stores(self, settings: Dict[str, str]):
+        """Test production settings refuse a store each worker keeps alone"""
+        app = Flask(__name__)
+        app.config.update(REQUIRE_SHARED_STATE=True, **settings)
+
+        with pytest.raises(RuntimeError, match='REQUIRE_SHARED_STATE'):
+            create_revocation_store(app)
+
+        app.config['REQUIRE_SHARED_STATE'] = False
+        assert create_revocation_store(app)
+
+    def test_production_defaults_to_redis(self):
+        """Test production keeps revocations in Redis unless told otherwise"""
+        assert ProductionConfig.REVOCATION_BACKEND == 'redis'
+        assert ProductionConfig.REQUIRE_SHARED_STATE
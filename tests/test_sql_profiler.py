@@ -0,0 +1,77 @@
+import json
+import logging
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import select
+from werkzeug.datastructures import Headers
+
+from app import create_app
+from app.config import config
+from app.extensions import db
+from app.models import Movie
+from app.utils.sql_profiler import NPlusOneQueryError, fingerprint
+
+
+def lazy_loop(count: int) -> str:
+    # One lookup per id, the shape of a lazy relationship in a loop
+    for movie_id in range(count):
+        db.session.execute(select(Movie).where(Movie.id == str(movie_id))).first()
+    return ''
+
+
+class TestFingerprint:
+    def test_parameters_and_literals_collapse(self):
+        """Test queries differing only in values share a fingerprint"""
+        assert fingerprint("SELECT * FROM movies WHERE id = ? AND year > 2000") == "SELECT * FROM movies WHERE id = ? AND year > ?"
+        assert fingerprint("SELECT * FROM movies WHERE id = %(id_1)s") == fingerprint("SELECT * FROM movies WHERE id = 'abc'")
+
+    def test_in_lists_collapse(self):
+        """Test expanded IN lists of any length share a fingerprint"""
+        assert fingerprint("SELECT 1 FROM reviews WHERE movie_id IN (?, ?, ?)") == fingerprint("SELECT 1 FROM reviews\n WHERE movie_id IN (?)")
+
+
+class TestSqlProfiler:
+    def test_server_timing_header(self, client: FlaskClient, auth_headers: Headers):
+        """Test responses report the request's query count and DB time"""
+        response = client.get('/api/movies/', headers=auth_headers)
+
+        assert response.status_code == 200
+        [timing] = response.headers.getlist('Server-Timing')
+        assert timing.startswith('db;dur=')
+        assert timing.endswith(' queries"')
+
+    def test_logs_request_profile(self, client: FlaskClient, auth_headers: Headers, caplog: pytest.LogCaptureFixture):
+        """Test each request's profile is logged as JSON"""
+        with caplog.at_level(logging.INFO, logger='app.sql'):
+            client.get('/api/genres/', headers=auth_headers)
+
+        record = json.loads(caplog.records[-1].getMessage())
+        assert record['endpoint'] == 'api.genres.genre_api'
+        assert record['status'] == 200
+        assert record['queries'] >= 1
+        assert record['repeated'] == {}
+
+    def test_raises_on_n_plus_one(self, app: Flask):
+        """Test a statement repeated past the threshold fails the request"""
+        app.add_url_rule('/n-plus-one/<int:count>', 'n_plus_one', lazy_loop)
+        client = app.test_client()
+
+        assert client.get('/n-plus-one/4').status_code == 200
+        with pytest.raises(NPlusOneQueryError, match='ran 5 times'):
+            client.get('/n-plus-one/5')
+
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch):
+        """Test the profiler adds nothing unless enabled"""
+        monkeypatch.setattr(config['development'], 'SQL_PROFILER', False)
+        app = create_app()
+        app.add_url_rule('/n-plus-one/<int:count>', 'n_plus_one', lazy_loop)
+
+        with app.app_context():
+            db.create_all()
+            response = app.test_client().get('/n-plus-one/10')
+            db.drop_all()
+
+        assert response.status_code == 200
+        assert 'Server-Timing' not in response.headers